@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from poetry_plugin_bundle.bundlers.bundler import Bundler
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from cleo.io.io import IO
+    from packaging.utils import NormalizedName
+    from poetry.poetry import Poetry
+
+    from poetry_plugin_bundle.utils.wheels import WheelMember
+
+
+class ArchiveBundler(Bundler):
+    """
+    Base class for bundlers writing the project and its dependencies
+    into an archive with the layout of site-packages.
+
+    No virtual environment is created: the content of the wheels
+    is streamed straight into the archive.
+    """
+
+    def __init__(self) -> None:
+        self._path: Path
+        self._executable: str | None = None
+        self._activated_groups: set[NormalizedName] | None = None
+        self._compile: bool = False
+        self._compile_invalidation_mode: str = "checked-hash"
+        self._platform: str | None = None
+        self._root_wheel: Path | None = None
+
+    def set_path(self, path: Path) -> ArchiveBundler:
+        self._path = path
+
+        return self
+
+    def set_executable(self, executable: str | None) -> ArchiveBundler:
+        self._executable = executable
+
+        return self
+
+    def set_activated_groups(
+        self, activated_groups: set[NormalizedName]
+    ) -> ArchiveBundler:
+        self._activated_groups = activated_groups
+
+        return self
+
+    def set_compile(
+        self, compile: bool = False, invalidation_mode: str | None = None
+    ) -> ArchiveBundler:
+        from poetry_plugin_bundle.utils.bytecode import HASH_INVALIDATION_MODES
+
+        if (
+            invalidation_mode is not None
+            and invalidation_mode not in HASH_INVALIDATION_MODES
+        ):
+            raise ValueError(
+                f"Invalid bytecode invalidation mode {invalidation_mode!r}, expected"
+                f" one of: {', '.join(HASH_INVALIDATION_MODES)}"
+            )
+
+        self._compile = compile or invalidation_mode is not None
+        self._compile_invalidation_mode = invalidation_mode or "checked-hash"
+
+        return self
+
+    def set_platform(self, platform: str | None) -> ArchiveBundler:
+        self._platform = platform
+
+        return self
+
+    def bundle(self, poetry: Poetry, io: IO) -> bool:
+        import os
+        import shutil
+        import uuid
+
+        from pathlib import Path
+        from tempfile import TemporaryDirectory
+
+        from cleo.io.null_io import NullIO
+        from poetry.core.masonry.builders.wheel import WheelBuilder
+        from poetry.core.masonry.utils.module import ModuleOrPackageNotFoundError
+        from poetry.utils.env.python import Python
+
+        from poetry_plugin_bundle.utils.artifacts import collect_locked_wheels
+        from poetry_plugin_bundle.utils.env import CachedPython
+        from poetry_plugin_bundle.utils.env import InterpreterEnv
+        from poetry_plugin_bundle.utils.interpreter_cache import InterpreterCache
+        from poetry_plugin_bundle.utils.locker import BundleLocker
+        from poetry_plugin_bundle.utils.wheel_cache import WheelCache
+        from poetry_plugin_bundle.utils.wheels import site_packages_layout
+
+        warnings = []
+        self._root_wheel = None
+
+        message = self._get_message(poetry, self._path)
+        if io.is_decorated() and not io.is_debug():
+            io = io.section()  # type: ignore[assignment]
+
+        io.write_line(message)
+
+        interpreter_cache = InterpreterCache.from_config(poetry.config)
+        if self._executable:
+            python: Python = CachedPython(Path(self._executable), interpreter_cache)
+        else:
+            python = Python.get_preferred_python(poetry.config)
+            if not poetry.package.python_constraint.allows(python.patch_version):
+                python = Python.get_compatible_python(poetry)
+
+        with TemporaryDirectory() as directory:
+            # Git dependencies are cloned and built in the temporary directory
+            env = InterpreterEnv(
+                python.executable, Path(directory) / "env", cache=interpreter_cache
+            )
+            if self._platform:
+                self._constrain_env_platform(env, self._platform)
+
+            self._write(
+                io,
+                f"{message}: <info>Collecting dependencies for Python"
+                f" <b>{python.executable}</b></info>",
+            )
+
+            build_dir = Path(directory) / "wheels"
+            build_dir.mkdir()
+            wheels = collect_locked_wheels(
+                poetry,
+                env,
+                BundleLocker.from_poetry(poetry),
+                NullIO() if not io.is_debug() else io,
+                build_dir,
+                self._activated_groups,
+            )
+            if wheels is None:
+                self._write(
+                    io,
+                    self._get_message(poetry, self._path, error=True)
+                    + ": <error>Failed</> at step <b>Collecting dependencies</b>",
+                )
+                return False
+
+            archives = [wheels[name] for name in sorted(wheels)]
+
+            if hasattr(poetry, "is_package_mode") and not poetry.is_package_mode:
+                self._write(
+                    io,
+                    f"{message}: <info>Skipping installation for non package project"
+                    f" <c1>{poetry.package.pretty_name}</c1>",
+                )
+            else:
+                self._write(
+                    io,
+                    f"{message}: <info>Building <c1>{poetry.package.pretty_name}</c1>"
+                    f" (<b>{poetry.package.pretty_version}</b>)</info>",
+                )
+
+                wheel_cache = WheelCache.from_config(poetry.config)
+                wheel_key = WheelCache.key(poetry)
+                wheel = wheel_cache.get(wheel_key) if wheel_key else None
+                try:
+                    if wheel is None:
+                        wheel = build_dir / WheelBuilder.make_in(
+                            poetry, directory=build_dir
+                        )
+                        if wheel_key:
+                            wheel = wheel_cache.put(wheel_key, wheel)
+
+                    # The files of the project take precedence over dependencies
+                    archives.insert(0, wheel)
+                    self._root_wheel = wheel
+                except ModuleOrPackageNotFoundError:
+                    warnings.append(
+                        "The root package was not included because no matching"
+                        " module or package was found."
+                    )
+
+            members, conflicts = site_packages_layout(archives)
+            warnings.extend(
+                f"The file {path} is provided by more than one distribution."
+                for path in conflicts
+            )
+
+            pycs: dict[str, Path] = {}
+            if self._compile:
+                from poetry_plugin_bundle.utils.bytecode import compile_wheel_members
+
+                self._write(io, f"{message}: <info>Compiling bytecode</info>")
+                pycs = compile_wheel_members(
+                    env,
+                    members,
+                    Path(directory) / "bytecode",
+                    self._compile_invalidation_mode,
+                )
+
+            self._write(io, f"{message}: <info>Writing archive</info>")
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            staging = self._path.with_name(f".{self._path.name}.{uuid.uuid4().hex}")
+            try:
+                self._write_archive(staging, members, pycs)
+                # Some layouts, such as OCI ones, are directories
+                if staging.is_dir() and self._path.is_dir():
+                    shutil.rmtree(self._path)
+                os.replace(staging, self._path)
+            finally:
+                if staging.is_dir():
+                    shutil.rmtree(staging)
+                else:
+                    staging.unlink(missing_ok=True)
+
+        self._write(io, self._get_message(poetry, self._path, done=True))
+
+        for warning in warnings:
+            io.write_line(
+                f"  <fg=yellow;options=bold>•</> <warning>{warning}</warning>"
+            )
+
+        return True
+
+    def _write_archive(
+        self, path: Path, members: list[WheelMember], pycs: dict[str, Path]
+    ) -> None:
+        """
+        Write the given wheel members and bytecode files to the archive at path,
+        in the order of their paths.
+
+        Members read from the wheel built for the project, if any,
+        have it as their wheel, which is kept in _root_wheel.
+        """
+        raise NotImplementedError()
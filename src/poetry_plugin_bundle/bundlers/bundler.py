@@ -4,8 +4,12 @@ from typing import TYPE_CHECKING
 
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from cleo.io.io import IO
+    from cleo.io.outputs.section_output import SectionOutput
     from poetry.poetry import Poetry
+    from poetry.utils.env import Env
 
 
 class Bundler:
@@ -13,3 +17,41 @@ class Bundler:
 
     def bundle(self, poetry: Poetry, io: IO) -> bool:
         raise NotImplementedError()
+
+    def _get_message(
+        self, poetry: Poetry, path: Path, done: bool = False, error: bool = False
+    ) -> str:
+        operation_color = "blue"
+
+        if error:
+            operation_color = "red"
+        elif done:
+            operation_color = "green"
+
+        verb = "Bundling"
+        if done:
+            verb = "<success>Bundled</success>"
+
+        return (
+            f"  <fg={operation_color};options=bold>•</>"
+            f" {verb} <c1>{poetry.package.pretty_name}</c1>"
+            f" (<b>{poetry.package.pretty_version}</b>) into <c2>{path}</c2>"
+        )
+
+    def _write(self, io: IO | SectionOutput, message: str) -> None:
+        from cleo.io.outputs.section_output import SectionOutput
+
+        if io.is_debug() or not io.is_decorated() or not isinstance(io, SectionOutput):
+            io.write_line(message)
+            return
+
+        io.overwrite(message)
+
+    def _constrain_env_platform(self, env: Env, platform: str) -> None:
+        """
+        Set the argument environment's supported tags
+        based on the configured platform override.
+        """
+        from poetry_plugin_bundle.utils.platforms import constrain_env_platform
+
+        constrain_env_platform(env, platform)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from typing import cast
 
 from poetry_plugin_bundle.exceptions import BundlerManagerError
 
@@ -9,20 +10,25 @@ if TYPE_CHECKING:
     from poetry_plugin_bundle.bundlers.bundler import Bundler
 
 
-class BundlerManager:
-    def __init__(self) -> None:
-        from poetry_plugin_bundle.bundlers.venv_bundler import VenvBundler
+# Default bundlers, imported only when requested
+BUNDLERS = {
+    "venv": "poetry_plugin_bundle.bundlers.venv_bundler:VenvBundler",
+    "zip": "poetry_plugin_bundle.bundlers.zip_bundler:ZipBundler",
+    "tar": "poetry_plugin_bundle.bundlers.tar_bundler:TarBundler",
+    "oci": "poetry_plugin_bundle.bundlers.oci_bundler:OciBundler",
+}
 
-        self._bundler_classes: dict[str, type[Bundler]] = {}
+# Entry point group of the bundlers provided by other distributions
+BUNDLER_ENTRY_POINT_GROUP = "poetry.bundle.bundler"
 
-        # Register default bundlers
-        self.register_bundler_class(VenvBundler)
 
-    def bundler(self, name: str) -> Bundler:
-        if name.lower() not in self._bundler_classes:
-            raise BundlerManagerError(f'The bundler class "{name}" does not exist.')
+class BundlerManager:
+    def __init__(self) -> None:
+        # Bundler classes, or the import paths of the ones not imported yet
+        self._bundler_classes: dict[str, type[Bundler] | str] = dict(BUNDLERS)
 
-        return self._bundler_classes[name.lower()]()
+    def bundler(self, name: str) -> Bundler:
+        return self._bundler_class(name.lower())()
 
     def register_bundler_class(self, bundler_class: type[Bundler]) -> BundlerManager:
         if not bundler_class.name:
@@ -36,3 +42,36 @@ class BundlerManager:
         self._bundler_classes[bundler_class.name.lower()] = bundler_class
 
         return self
+
+    def _bundler_class(self, name: str) -> type[Bundler]:
+        if name not in self._bundler_classes:
+            self._load_entry_point(name)
+
+        bundler_class = self._bundler_classes.get(name)
+        if bundler_class is None:
+            raise BundlerManagerError(f'The bundler class "{name}" does not exist.')
+
+        if isinstance(bundler_class, str):
+            bundler_class = self._bundler_classes[name] = _import(bundler_class)
+
+        return bundler_class
+
+    def _load_entry_point(self, name: str) -> None:
+        """
+        Look up a bundler provided by another distribution, which is only done
+        for unknown bundlers since it scans the metadata of every distribution.
+        """
+        from importlib.metadata import entry_points
+
+        for entry_point in entry_points(group=BUNDLER_ENTRY_POINT_GROUP):
+            if entry_point.name.lower() == name:
+                self._bundler_classes[name] = entry_point.load()
+                return
+
+
+def _import(path: str) -> type[Bundler]:
+    from importlib import import_module
+
+    module, _, attribute = path.partition(":")
+
+    return cast("type[Bundler]", getattr(import_module(module), attribute))
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from poetry_plugin_bundle.bundlers.archive_bundler import ArchiveBundler
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from poetry_plugin_bundle.utils.wheels import ArchiveEntry
+    from poetry_plugin_bundle.utils.wheels import WheelMember
+
+
+class OciBundler(ArchiveBundler):
+    """
+    Bundle the project and its dependencies into an OCI image layout directory.
+
+    The dependencies and the project are written to separate layers,
+    so that the layer of the dependencies is shared by the images of every
+    change of the project which leaves its dependencies untouched.
+    """
+
+    name = "oci"
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._target: str = "/app"
+        self._tag: str | None = None
+
+    def set_target(self, target: str) -> OciBundler:
+        if not target.startswith("/"):
+            raise ValueError(f"The target directory {target} must be absolute")
+
+        self._target = target
+
+        return self
+
+    def set_tag(self, tag: str | None) -> OciBundler:
+        self._tag = tag
+
+        return self
+
+    def _write_archive(
+        self, path: Path, members: list[WheelMember], pycs: dict[str, Path]
+    ) -> None:
+        import dataclasses
+        import importlib.util
+
+        from poetry_plugin_bundle.utils.oci import OciLayout
+        from poetry_plugin_bundle.utils.oci import oci_architecture
+        from poetry_plugin_bundle.utils.wheels import WheelReader
+        from poetry_plugin_bundle.utils.wheels import archive_entries
+        from poetry_plugin_bundle.utils.wheels import archive_timestamp
+
+        target = self._target.strip("/")
+        timestamp = archive_timestamp()
+
+        root_paths = {
+            member.path for member in members if member.wheel == self._root_wheel
+        }
+        # Bytecode files belong to the layer of their source file
+        root_pycs = {
+            pyc for pyc in pycs if importlib.util.source_from_cache(pyc) in root_paths
+        }
+
+        reader = WheelReader()
+
+        def layer_entries(root: bool) -> list[ArchiveEntry]:
+            return [
+                dataclasses.replace(entry, path=f"{target}/{entry.path}")
+                for entry in archive_entries(
+                    [m for m in members if (m.path in root_paths) is root],
+                    {p: pyc for p, pyc in pycs.items() if (p in root_pycs) is root},
+                    reader,
+                )
+            ]
+
+        layout = OciLayout(path)
+        try:
+            layers = [layout.write_layer(layer_entries(False), timestamp)]
+            if self._root_wheel is not None:
+                layers.append(layout.write_layer(layer_entries(True), timestamp))
+        finally:
+            reader.close()
+
+        annotations = {}
+        if self._tag:
+            annotations["org.opencontainers.image.ref.name"] = self._tag
+
+        layout.write_image(
+            layers,
+            {
+                "architecture": oci_architecture(self._platform),
+                "os": "linux",
+                "config": {"Env": [f"PYTHONPATH={self._target}"]},
+            },
+            annotations,
+        )
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from poetry_plugin_bundle.bundlers.archive_bundler import ArchiveBundler
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from cleo.io.io import IO
+    from poetry.poetry import Poetry
+
+    from poetry_plugin_bundle.utils.wheels import WheelMember
+
+
+class TarBundler(ArchiveBundler):
+    """
+    Bundle the project and its dependencies into a tar archive
+    with the layout of site-packages.
+
+    The archive is compressed with gzip or zstd, depending on its extension,
+    in blocks compressed in parallel.
+    """
+
+    name = "tar"
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self._compression_level: int | None = None
+
+    def set_compression_level(self, level: int | None) -> TarBundler:
+        self._compression_level = level
+
+        return self
+
+    def bundle(self, poetry: Poetry, io: IO) -> bool:
+        from poetry_plugin_bundle.utils.compression import block_compressor
+        from poetry_plugin_bundle.utils.compression import tar_compression
+
+        # Fail early if the archive cannot be compressed as requested
+        compression = tar_compression(self._path)
+        if compression is not None:
+            block_compressor(compression, self._compression_level)
+
+        return super().bundle(poetry, io)
+
+    def _write_archive(
+        self, path: Path, members: list[WheelMember], pycs: dict[str, Path]
+    ) -> None:
+        """
+        Write the archive deterministically: entries are sorted by path,
+        with a fixed timestamp and normalized ownership and permissions.
+        """
+        from poetry_plugin_bundle.utils.compression import ParallelCompressor
+        from poetry_plugin_bundle.utils.compression import block_compressor
+        from poetry_plugin_bundle.utils.compression import tar_compression
+        from poetry_plugin_bundle.utils.wheels import WheelReader
+        from poetry_plugin_bundle.utils.wheels import archive_entries
+        from poetry_plugin_bundle.utils.wheels import archive_timestamp
+        from poetry_plugin_bundle.utils.wheels import write_tar
+
+        compression = tar_compression(self._path)
+
+        reader = WheelReader()
+        with path.open("wb") as f:
+            stream = (
+                ParallelCompressor(
+                    f, block_compressor(compression, self._compression_level)
+                )
+                if compression is not None
+                else f
+            )
+            try:
+                write_tar(
+                    stream,
+                    archive_entries(members, pycs, reader),
+                    archive_timestamp(),
+                )
+            finally:
+                reader.close()
+                stream.close()
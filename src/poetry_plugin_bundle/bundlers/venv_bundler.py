@@ -6,14 +6,19 @@ from poetry_plugin_bundle.bundlers.bundler import Bundler
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
 
     from cleo.io.io import IO
-    from cleo.io.outputs.section_output import SectionOutput
     from packaging.utils import NormalizedName
     from poetry.poetry import Poetry
-    from poetry.repositories.lockfile_repository import LockfileRepository
     from poetry.utils.env import Env
+    from poetry.utils.env.python import Python
+
+    from poetry_plugin_bundle.utils.bundle_cache import BundleCache
+    from poetry_plugin_bundle.utils.locker import BundleLocker
+    from poetry_plugin_bundle.utils.manifest import BundleManifest
+    from poetry_plugin_bundle.utils.report import BundleReport
 
 
 class VenvBundler(Bundler):
@@ -25,7 +30,26 @@ class VenvBundler(Bundler):
         self._remove: bool = False
         self._activated_groups: set[NormalizedName] | None = None
         self._compile: bool = False
+        self._compile_invalidation_mode: str | None = None
+        self._compile_optimization_levels: list[int] = []
         self._platform: str | None = None
+        self._cache: bool = False
+        self._if_stale: bool = False
+        self._relocatable: bool = False
+        self._dedupe: bool = False
+        self._sourceless: bool = False
+        self._keep_sources: list[str] = []
+        self._prune_rules: list[str] = []
+        self._strip: bool = False
+        self._prune_packages: list[str] = []
+        self._size_budget: int | None = None
+        self._find_links: Path | None = None
+        self._offline: bool = False
+        self._installer: str = "poetry"
+        self._report_format: str | None = None
+        self._report_path: Path | None = None
+        self._trace_path: Path | None = None
+        self._locker: BundleLocker | None = None
 
     def set_path(self, path: Path) -> VenvBundler:
         self._path = path
@@ -54,26 +78,283 @@ class VenvBundler(Bundler):
 
         return self
 
+    def set_compile_options(
+        self,
+        invalidation_mode: str | None = None,
+        optimization_levels: Iterable[int] = (),
+    ) -> VenvBundler:
+        """
+        Compile bytecode once all distributions are installed, for the whole
+        environment at once, instead of package by package while installing.
+        """
+        from poetry_plugin_bundle.utils.bytecode import INVALIDATION_MODES
+        from poetry_plugin_bundle.utils.bytecode import OPTIMIZATION_LEVELS
+
+        if (
+            invalidation_mode is not None
+            and invalidation_mode not in INVALIDATION_MODES
+        ):
+            raise ValueError(
+                f"Invalid bytecode invalidation mode {invalidation_mode!r}, expected"
+                f" one of: {', '.join(INVALIDATION_MODES)}"
+            )
+
+        levels = sorted(set(optimization_levels))
+        if any(level not in OPTIMIZATION_LEVELS for level in levels):
+            raise ValueError(
+                "Invalid bytecode optimization levels"
+                f" {', '.join(str(level) for level in levels)}, expected"
+                f" some of: {', '.join(str(level) for level in OPTIMIZATION_LEVELS)}"
+            )
+
+        self._compile_invalidation_mode = invalidation_mode
+        self._compile_optimization_levels = levels
+
+        return self
+
     def set_platform(self, platform: str | None) -> VenvBundler:
         self._platform = platform
 
         return self
 
+    def set_cache(self, cache: bool = False) -> VenvBundler:
+        self._cache = cache
+
+        return self
+
+    def set_if_stale(self, if_stale: bool = False) -> VenvBundler:
+        self._if_stale = if_stale
+
+        return self
+
+    def set_relocatable(self, relocatable: bool = False) -> VenvBundler:
+        """
+        Make the bundle independent of its path, so that it can be moved
+        or copied to another path once created.
+        """
+        self._relocatable = relocatable
+
+        return self
+
+    def set_sourceless(
+        self, sourceless: bool = False, keep_sources: Iterable[str] = ()
+    ) -> VenvBundler:
+        """
+        Replace the source files of the installed distributions by bytecode
+        files once everything is installed, except for the distributions
+        named in keep_sources, which need their sources at runtime.
+        """
+        from packaging.utils import canonicalize_name
+
+        self._sourceless = sourceless
+        self._keep_sources = sorted({canonicalize_name(name) for name in keep_sources})
+
+        return self
+
+    def set_prune(self, rules: Iterable[str] = (), strip: bool = False) -> VenvBundler:
+        """
+        Remove the files of the installed distributions which are not needed
+        at runtime once everything is installed, according to the given rules,
+        and optionally strip the debug symbols of shared objects.
+        """
+        from poetry_plugin_bundle.utils.prune import PRUNE_RULES
+
+        rules = set(rules)
+        if "all" in rules:
+            rules = set(PRUNE_RULES)
+
+        unknown = sorted(rules - set(PRUNE_RULES))
+        if unknown:
+            raise ValueError(
+                f"Invalid prune rules {', '.join(unknown)}, expected"
+                f" some of: {', '.join(PRUNE_RULES)}, all"
+            )
+
+        self._prune_rules = [rule for rule in PRUNE_RULES if rule in rules]
+        self._strip = strip
+
+        return self
+
+    def set_prune_packages(self, packages: Iterable[str] = ()) -> VenvBundler:
+        """
+        Allow pruning the given import packages, e.g. foo.tests, which are
+        otherwise kept since they may be imported at runtime.
+        """
+        self._prune_packages = sorted(set(packages))
+
+        return self
+
+    def set_size_budget(self, size: int | None = None) -> VenvBundler:
+        """
+        Fail the bundle if the virtual environment is larger than size bytes
+        once installed and pruned.
+        """
+        self._size_budget = size
+
+        return self
+
+    def set_dedupe(self, dedupe: bool = False) -> VenvBundler:
+        """
+        Hardlink the installed files to identical files of the shared file
+        store, so that they are stored only once across bundles.
+        """
+        self._dedupe = dedupe
+
+        return self
+
+    def set_find_links(
+        self, path: Path | None = None, offline: bool = False
+    ) -> VenvBundler:
+        """
+        Install the archives found in the given wheelhouse, e.g. filled by
+        bundle download, rather than downloading them, and download nothing
+        at all when offline.
+        """
+        if offline and path is None:
+            raise ValueError("Offline bundles require a wheelhouse to install from")
+
+        self._find_links = path
+        self._offline = offline
+
+        return self
+
+    def set_installer(self, installer: str = "poetry") -> VenvBundler:
+        """
+        Install wheels with Poetry's installer, or with the bundle installer
+        extracting them in parallel straight into the environment.
+        """
+        from poetry_plugin_bundle.utils.wheel_installer import INSTALLERS
+
+        if installer not in INSTALLERS:
+            raise ValueError(
+                f"Invalid installer {installer!r}, expected"
+                f" one of: {', '.join(INSTALLERS)}"
+            )
+
+        self._installer = installer
+
+        return self
+
+    def set_report(
+        self, format: str | None = None, path: Path | None = None
+    ) -> VenvBundler:
+        """
+        Report the duration of each phase of the bundle, along with download,
+        cache and disk statistics, once done, to the output or to a file.
+        """
+        from poetry_plugin_bundle.utils.report import REPORT_FORMATS
+
+        if format is not None and format not in REPORT_FORMATS:
+            raise ValueError(
+                f"Invalid report format {format!r}, expected"
+                f" one of: {', '.join(REPORT_FORMATS)}"
+            )
+
+        self._report_format = format
+        self._report_path = path
+
+        return self
+
+    def set_trace(self, path: Path | None = None) -> VenvBundler:
+        """
+        Write a timeline of the bundle, with spans for its phases and for every
+        step of the installation of each package, in the Trace Event Format.
+        """
+        self._trace_path = path
+
+        return self
+
+    def set_locker(self, locker: BundleLocker | None) -> VenvBundler:
+        """
+        Use the given locker instead of loading the lock file of the project,
+        so that bundles of the same project share it.
+        """
+        self._locker = locker
+
+        return self
+
     def bundle(self, poetry: Poetry, io: IO) -> bool:
+        from poetry_plugin_bundle.utils.report import BundleReport
+
+        report = BundleReport(trace=self._trace_path is not None)
+        try:
+            return self._bundle(poetry, io, report)
+        finally:
+            report.finish()
+            if self._report_format is not None:
+                self._write_report(io, report)
+            if self._trace_path is not None:
+                report.write_trace(self._trace_path)
+
+    def _bundle(self, poetry: Poetry, io: IO, report: BundleReport) -> bool:
+        import functools
+        import sys
+        import time
+
+        from poetry_plugin_bundle.utils.fingerprint import discard_bundle_fingerprint
+        from poetry_plugin_bundle.utils.fingerprint import project_sources_hash
+        from poetry_plugin_bundle.utils.fingerprint import read_bundle_fingerprint
+        from poetry_plugin_bundle.utils.fingerprint import write_bundle_fingerprint
+
+        # The sources of the project are read at most once per bundle,
+        # for the fingerprint of the bundle and the key of its wheel
+        sources_hash = functools.cache(functools.partial(project_sources_hash, poetry))
+
+        # Check whether the bundle is up to date before anything else:
+        # this must stay cheap, so no environment is inspected here.
+        # The fingerprint is only needed by --if-stale and --cache.
+        fingerprint = (
+            self._get_fingerprint(
+                poetry, self._get_interpreter_identity(poetry), sources_hash()
+            )
+            if self._if_stale or self._cache
+            else None
+        )
+        if (
+            self._if_stale
+            and fingerprint is not None
+            and read_bundle_fingerprint(self._path) == fingerprint
+        ):
+            io.write_line(
+                self._get_message(poetry, self._path, done=True)
+                + ": <info>Already up to date</info>"
+            )
+            return True
+
+        if self._path.is_dir():
+            discard_bundle_fingerprint(self._path)
+
         from pathlib import Path
         from tempfile import TemporaryDirectory
 
         from cleo.io.null_io import NullIO
+        from packaging.utils import canonicalize_name
         from poetry.core.masonry.builders.wheel import WheelBuilder
         from poetry.core.masonry.utils.module import ModuleOrPackageNotFoundError
         from poetry.core.packages.package import Package
         from poetry.installation.installer import Installer
         from poetry.installation.operations.install import Install
-        from poetry.packages.locker import Locker
+        from poetry.repositories.installed_repository import InstalledRepository
         from poetry.utils.env import EnvManager
+        from poetry.utils.env import VirtualEnv
         from poetry.utils.env.python import Python
         from poetry.utils.env.python.exceptions import InvalidCurrentPythonVersionError
 
+        from poetry_plugin_bundle.utils.env import CachedPython
+        from poetry_plugin_bundle.utils.env import CachedVirtualEnv
+        from poetry_plugin_bundle.utils.env import InterpreterEnv
+        from poetry_plugin_bundle.utils.interpreter_cache import InterpreterCache
+        from poetry_plugin_bundle.utils.locker import BundleLocker
+        from poetry_plugin_bundle.utils.manifest import BundleManifest
+        from poetry_plugin_bundle.utils.manifest import locked_hashes
+        from poetry_plugin_bundle.utils.manifest import locked_package_infos
+        from poetry_plugin_bundle.utils.prefetch import prefetch_artifacts
+        from poetry_plugin_bundle.utils.report import ReportingExecutor
+        from poetry_plugin_bundle.utils.scheduler import PhaseScheduler
+        from poetry_plugin_bundle.utils.venv_templates import VenvTemplateCache
+        from poetry_plugin_bundle.utils.wheel_cache import WheelCache
+        from poetry_plugin_bundle.utils.wheelhouse import Wheelhouse
+
         class CustomEnvManager(EnvManager):
             """
             This class is used as an adapter for allowing us to use
@@ -97,6 +378,58 @@ class VenvBundler(Bundler):
                 """
                 return True
 
+            @classmethod
+            def build_venv(  # type: ignore[override]
+                cls,
+                path: Path,
+                executable: Path | None = None,
+                flags: dict[str, str | bool] | None = None,
+                with_pip: bool | None = None,
+                prompt: str | None = None,
+            ) -> None:
+                """
+                Clone a pristine virtual environment created earlier from the
+                same interpreter with the same options rather than creating
+                and seeding a new one. The virtualenv session Poetry returns
+                is not used by EnvManager.create_venv.
+                """
+                import functools
+
+                flags = dict(flags or {})
+                if with_pip is not None:
+                    flags["no-pip"] = not with_pip
+
+                interpreter = executable or Path(sys.executable)
+                key = VenvTemplateCache.key(interpreter, flags, prompt)
+                if not venv_templates.restore(key, path):
+                    venv_templates.put(
+                        key,
+                        interpreter,
+                        functools.partial(
+                            super().build_venv,
+                            executable=executable,
+                            flags=flags,
+                            prompt=prompt,
+                        ),
+                    )
+                    restored = venv_templates.restore(key, path)
+                    assert restored
+
+                if sys.platform == "darwin":
+                    import plistlib
+
+                    import xattr
+
+                    # Excluded from Time Machine backups, as Poetry does
+                    xattr.setxattr(
+                        str(path),
+                        "com.apple.metadata:com_apple_backup_excludeItem",
+                        plistlib.dumps("com.apple.backupd", fmt=plistlib.FMT_BINARY),
+                    )
+
+            def get(self, reload: bool = False) -> Env:
+                return self._cached(super().get(reload=reload))
+
             def create_venv_at_path(
                 self,
                 path: Path,
@@ -104,13 +437,34 @@ class VenvBundler(Bundler):
                 force: bool,
             ) -> Env:
                 self._path = path
-                return self.create_venv(name=None, python=python, force=force)
+                return self._cached(
+                    self.create_venv(name=None, python=python, force=force)
+                )
 
-        warnings = []
+            def _cached(self, env: Env) -> Env:
+                """
+                Read the data of virtual environments from the interpreter
+                cache rather than spawning their interpreter.
+                """
+                if type(env) is not VirtualEnv:
+                    return env
 
+                return CachedVirtualEnv(env.path, cache=interpreter_cache)
+
+        warnings: list[str] = []
+
+        is_fresh_env = self._remove or not self._path.exists()
+        interpreter_cache = InterpreterCache.from_config(poetry.config)
+        venv_templates = VenvTemplateCache.from_config(poetry.config)
         manager = CustomEnvManager(poetry)
         executable = Path(self._executable) if self._executable else None
-        python = Python(executable) if executable else None
+        python = CachedPython(executable, interpreter_cache) if executable else None
+
+        def preferred_python() -> Python:
+            return CachedPython(
+                Path(Python.get_preferred_python(poetry.config).python.executable),
+                interpreter_cache,
+            )
 
         message = self._get_message(poetry, self._path)
         if io.is_decorated() and not io.is_debug():
@@ -118,6 +472,49 @@ class VenvBundler(Bundler):
 
         io.write_line(message)
 
+        cache: BundleCache | None = None
+        cache_key: str | None = None
+        if self._cache:
+            from poetry_plugin_bundle.utils.bundle_cache import BundleCache
+
+            cache = BundleCache.from_config(poetry.config)
+            cache_key = self._get_cache_key(
+                poetry, python or preferred_python(), sources_hash()
+            )
+            # Existing environments are only replaced by cached bundles
+            # when they would be recreated anyway
+            entry = (
+                cache.restore(cache_key, self._path, replace=self._remove)
+                if is_fresh_env
+                else None
+            )
+            if entry is not None:
+                self._write(
+                    io,
+                    f"{message}: <info>Using cached bundle <b>{cache_key[:12]}</b></info>",
+                )
+                cached_env = CachedVirtualEnv(self._path, cache=interpreter_cache)
+                if self._compile and entry.source != self._path:
+                    self._recompile(cached_env)
+                assert fingerprint is not None
+                write_bundle_fingerprint(self._path, fingerprint)
+
+                # Restored bundles are copies, which are linked to the store as well
+                cached_manifest = BundleManifest.read(self._path)
+                if self._dedupe and cached_manifest is not None:
+                    self._write(io, f"{message}: <info>Deduplicating files</info>")
+                    warning = self._link_to_file_store(
+                        poetry, report, cached_env, cached_manifest, set()
+                    )
+                    if warning is not None:
+                        io.write_line(
+                            f"  <fg=yellow;options=bold>•</> <warning>{warning}</warning>"
+                        )
+
+                self._write(io, self._get_message(poetry, self._path, done=True))
+
+                return True
+
         if executable:
             self._write(
                 io,
@@ -131,47 +528,207 @@ class VenvBundler(Bundler):
                 " using Poetry-determined Python",
             )
 
-        try:
-            env = manager.create_venv_at_path(
-                self._path, python=python, force=self._remove
+        start = time.perf_counter()
+        custom_locker = self._locker or BundleLocker.from_poetry(poetry)
+        locked_packages = (
+            locked_package_infos(custom_locker.lock_data)
+            if custom_locker.is_locked()
+            else []
+        )
+        report.record_phase("lock", time.perf_counter() - start)
+        wheelhouse = Wheelhouse(self._find_links) if self._find_links else None
+        manifest_environment: dict[str, str] = {}
+        hashes: dict[str, str] = {}
+        unchanged_names: set[str] = set()
+
+        def create_env() -> Env:
+            try:
+                env = manager.create_venv_at_path(
+                    self._path, python=python, force=self._remove
+                )
+            except InvalidCurrentPythonVersionError:
+                self._write(
+                    io,
+                    f"{message}: <info>Replacing existing virtual environment"
+                    " due to incompatible Python version</info>",
+                )
+                env = manager.create_venv_at_path(self._path, python=python, force=True)
+
+            if self._platform:
+                self._constrain_env_platform(env, self._platform)
+
+            return env
+
+        def prefetch() -> None:
+            # Artifacts are selected for the interpreter the virtual environment
+            # will be created from, which shares its markers and tags.
+            try:
+                interpreter = python or preferred_python()
+                if not poetry.package.python_constraint.allows(
+                    interpreter.patch_version
+                ):
+                    return
+
+                env = InterpreterEnv(interpreter.executable, cache=interpreter_cache)
+                if self._platform:
+                    self._constrain_env_platform(env, self._platform)
+
+                prefetch_artifacts(
+                    poetry,
+                    env,
+                    custom_locker,
+                    self._activated_groups,
+                    report,
+                    wheelhouse=wheelhouse,
+                )
+            except Exception as e:  # noqa: BLE001
+                # The installation downloads whatever could not be prefetched
+                # and reports errors properly.
+                if io.is_debug():
+                    io.write_line(f"Prefetching artifacts failed: {e}")
+
+        def install_dependencies() -> tuple[Installer, int]:
+            env: Env = scheduler.result("venv")
+
+            self._write(io, f"{message}: <info>Installing dependencies</info>")
+
+            # Distributions recorded in the manifest of a previous bundle run
+            # and still matching the lock file are handed to the installer as
+            # already installed, so that it neither inspects the environment
+            # nor touches them. Stale distributions are removed beforehand.
+            manifest_environment.update(self._get_manifest_environment(env))
+            manifest = BundleManifest.read(env.path)
+            installed: InstalledRepository | None = None
+            if manifest is not None and manifest.environment == manifest_environment:
+                unchanged, stale = manifest.diff(
+                    env.path, locked_packages, poetry.package.name
+                )
+                BundleManifest.remove_distributions(env.path, stale)
+                installed = InstalledRepository(unchanged)
+                unchanged_names.update(package.name for package in unchanged)
+                for package in unchanged:
+                    hash = manifest.distributions[package.name].hash
+                    assert hash is not None
+                    hashes[package.name] = hash
+
+            # The manifest is only valid once the bundle is complete
+            BundleManifest.discard(env.path)
+
+            installer_io = NullIO() if not io.is_debug() else io
+            installer = Installer(
+                installer_io,
+                env,
+                poetry.package,
+                custom_locker,
+                poetry.pool,
+                poetry.config,
+                installed=installed,
+                executor=ReportingExecutor(
+                    env,
+                    poetry.pool,
+                    poetry.config,
+                    installer_io,
+                    report=report,
+                    wheelhouse=wheelhouse,
+                    offline=self._offline,
+                    installer=self._installer,
+                    dedupe=self._dedupe,
+                ),
+            )
+            if self._activated_groups is not None:
+                installer.only_groups(self._activated_groups)
+            installer.requires_synchronization()
+
+            installer.executor.enable_bytecode_compilation(
+                self._compile and not self._compiles_environment()
             )
-        except InvalidCurrentPythonVersionError:
+
+            return installer, installer.run()
+
+        def build_wheel() -> tuple[Path, str | None, bool] | None:
+            wheel_key = WheelCache.key(poetry, sources_hash)
+            cached_wheel = wheel_cache.get(wheel_key) if wheel_key else None
+            if cached_wheel is not None:
+                return cached_wheel, wheel_key, True
+
+            try:
+                wheel_name = WheelBuilder.make_in(poetry, directory=Path(directory))
+            except ModuleOrPackageNotFoundError:
+                return None
+
+            return Path(directory).joinpath(wheel_name), wheel_key, False
+
+        def install_root() -> None:
+            installer, return_code = scheduler.result("dependencies")
+            if return_code:
+                return
+
+            built: tuple[Path, str | None, bool] | None = scheduler.result("wheel")
             self._write(
                 io,
-                f"{message}: <info>Replacing existing virtual environment"
-                " due to incompatible Python version</info>",
+                f"{message}: <info>Installing <c1>{poetry.package.pretty_name}</c1>"
+                f" (<b>{poetry.package.pretty_version}</b>)"
+                + (" from cached wheel" if built is not None and built[2] else "")
+                + "</info>",
             )
-            env = manager.create_venv_at_path(self._path, python=python, force=True)
-
-        if self._platform:
-            self._constrain_env_platform(env, self._platform)
 
-        self._write(io, f"{message}: <info>Installing dependencies</info>")
+            if built is None:
+                warnings.append(
+                    "The root package was not installed because no matching module or"
+                    " package was found."
+                )
+                return
 
-        class CustomLocker(Locker):
-            def locked_repository(self) -> LockfileRepository:
-                repo = super().locked_repository()
-                for package in repo.packages:
-                    package.develop = False
-                return repo
+            # The wheel is only stored once the virtual environment exists,
+            # so that the cache is never written to while it is being created.
+            wheel, wheel_key, cached = built
+            if wheel_key and not cached:
+                wheel = wheel_cache.put(wheel_key, wheel)
 
-        custom_locker = CustomLocker(poetry.locker.lock, poetry.locker._pyproject_data)
+            package = Package(
+                poetry.package.name,
+                poetry.package.version,
+                source_type="file",
+                source_url=str(wheel),
+            )
+            installer.executor.execute([Install(package)])
 
-        installer = Installer(
-            NullIO() if not io.is_debug() else io,
-            env,
-            poetry.package,
-            custom_locker,
-            poetry.pool,
-            poetry.config,
+        # The phases run concurrently as far as their dependencies allow:
+        # artifacts are downloaded while the virtual environment is created
+        # and the wheel of the project is built while dependencies install.
+        is_package_mode = not (
+            hasattr(poetry, "is_package_mode") and not poetry.is_package_mode
         )
-        if self._activated_groups is not None:
-            installer.only_groups(self._activated_groups)
-        installer.requires_synchronization()
+        wheel_cache = WheelCache.from_config(poetry.config)
+        scheduler = PhaseScheduler(5)
+        with TemporaryDirectory() as directory:
+            try:
+                scheduler.add("venv", report.timed("venv", create_env))
+                # Nothing is downloaded offline
+                if custom_locker.is_locked() and is_fresh_env and not self._offline:
+                    scheduler.add("prefetch", report.timed("prefetch", prefetch))
+                else:
+                    scheduler.add("prefetch", lambda: None)
+                if is_package_mode:
+                    scheduler.add("wheel", report.timed("wheel", build_wheel))
+                scheduler.add(
+                    "dependencies",
+                    report.timed("dependencies", install_dependencies),
+                    after=["venv", "prefetch"],
+                )
+                if is_package_mode:
+                    scheduler.add(
+                        "root",
+                        report.timed("root", install_root),
+                        after=["dependencies", "wheel"],
+                    )
 
-        installer.executor.enable_bytecode_compilation(self._compile)
+                scheduler.join()
+            finally:
+                scheduler.shutdown()
 
-        return_code = installer.run()
+        env: Env = scheduler.result("venv")
+        installer, return_code = scheduler.result("dependencies")
         if return_code:
             self._write(
                 io,
@@ -181,37 +738,129 @@ class VenvBundler(Bundler):
             return False
 
         # Skip building the wheel if is_package_mode exists and is set to false
-        if hasattr(poetry, "is_package_mode") and not poetry.is_package_mode:
+        if not is_package_mode:
             self._write(
                 io,
                 f"{message}: <info>Skipping installation for non package project"
                 f" <c1>{poetry.package.pretty_name}</c1>",
             )
-        else:
+
+        if self._compiles_environment():
+            from poetry_plugin_bundle.utils.bytecode import compile_env
+
+            self._write(io, f"{message}: <info>Compiling bytecode</info>")
+            report.timed(
+                "compile",
+                lambda: compile_env(
+                    env,
+                    self._compile_invalidation_mode or "timestamp",
+                    self._compile_optimization_levels or [0],
+                ),
+            )()
+
+        if self._sourceless:
+            from poetry_plugin_bundle.utils.bytecode import compile_sourceless
+
+            self._write(io, f"{message}: <info>Removing sources</info>")
+            report.timed(
+                "sourceless",
+                lambda: compile_sourceless(
+                    env,
+                    self._keep_sources,
+                    min(self._compile_optimization_levels or [0]),
+                ),
+            )()
+
+        if self._prune_rules or self._strip:
+            from poetry_plugin_bundle.utils.files import format_size
+            from poetry_plugin_bundle.utils.prune import prune_env
+
+            self._write(io, f"{message}: <info>Pruning files</info>")
+            pruned = report.timed(
+                "prune",
+                lambda: prune_env(
+                    env.path,
+                    [env.purelib, env.platlib],
+                    self._prune_rules,
+                    self._compile_optimization_levels or [0],
+                    self._strip,
+                    self._prune_packages,
+                ),
+            )()
+            report.record_prune(pruned)
             self._write(
                 io,
-                f"{message}: <info>Installing <c1>{poetry.package.pretty_name}</c1>"
-                f" (<b>{poetry.package.pretty_version}</b>)</info>",
+                f"{message}: <info>Pruned <b>{pruned.files}</b> file(s)"
+                f" and stripped <b>{pruned.stripped}</b> shared object(s),"
+                f" from <b>{format_size(pruned.size_before)}</b>"
+                f" to <b>{format_size(pruned.size_after)}</b></info>",
             )
+            if pruned.strip_unavailable:
+                warnings.append(
+                    "Shared objects were not stripped since the strip command"
+                    " could not be found"
+                )
 
-            # Build a wheel of the project in a temporary directory
-            # and install it in the newly create virtual environment
-            with TemporaryDirectory() as directory:
-                try:
-                    wheel_name = WheelBuilder.make_in(poetry, directory=Path(directory))
-                    wheel = Path(directory).joinpath(wheel_name)
-                    package = Package(
-                        poetry.package.name,
-                        poetry.package.version,
-                        source_type="file",
-                        source_url=str(wheel),
-                    )
-                    installer.executor.execute([Install(package)])
-                except ModuleOrPackageNotFoundError:
-                    warnings.append(
-                        "The root package was not installed because no matching module or"
-                        " package was found."
-                    )
+        if self._size_budget is not None:
+            from poetry_plugin_bundle.utils.files import directory_size
+            from poetry_plugin_bundle.utils.files import format_size
+
+            size = directory_size(env.path)
+            if size > self._size_budget:
+                self._write(
+                    io,
+                    self._get_message(poetry, self._path, error=True)
+                    + f": <error>The bundle size <b>{format_size(size)}</b>"
+                    f" exceeds the budget of <b>{format_size(self._size_budget)}</b>"
+                    "</>",
+                )
+                return False
+
+        if self._relocatable:
+            from poetry_plugin_bundle.utils.relocatable import make_relocatable
+
+            remaining = report.timed("relocate", lambda: make_relocatable(env.path))()
+            if remaining:
+                warnings.append(
+                    "The following files embed the path of the bundle,"
+                    " which must not be moved for them to keep working: "
+                    + ", ".join(str(file.relative_to(env.path)) for file in remaining)
+                )
+
+        for info in locked_packages:
+            if info.get("source", {}).get("type") == "git":
+                hashes[canonicalize_name(info["name"])] = next(
+                    iter(locked_hashes(info))
+                )
+        assert isinstance(installer.executor, ReportingExecutor)
+        hashes.update(installer.executor.archive_hashes)
+        manifest = BundleManifest.from_env(env, manifest_environment, hashes)
+        manifest.write(env.path)
+        if fingerprint is not None:
+            write_bundle_fingerprint(env.path, fingerprint)
+
+        if self._report_format is not None:
+            self._record_written(report, env.path, manifest, unchanged_names)
+
+        if self._dedupe:
+            self._write(io, f"{message}: <info>Deduplicating files</info>")
+            warning = self._link_to_file_store(
+                poetry, report, env, manifest, unchanged_names
+            )
+            if warning is not None:
+                warnings.append(warning)
+
+        if cache is not None and cache_key is not None:
+            self._write(io, f"{message}: <info>Storing bundle in cache</info>")
+            report.timed(
+                "cache",
+                lambda: cache.put(
+                    cache_key,
+                    self._path,
+                    poetry.package.pretty_name,
+                    poetry.package.pretty_version,
+                ),
+            )()
 
         self._write(io, self._get_message(poetry, self._path, done=True))
 
@@ -223,40 +872,203 @@ class VenvBundler(Bundler):
 
         return True
 
-    def _get_message(
-        self, poetry: Poetry, path: Path, done: bool = False, error: bool = False
-    ) -> str:
-        operation_color = "blue"
+    def _write_report(self, io: IO, report: BundleReport) -> None:
+        if self._report_format == "json":
+            content = report.to_json()
+            if self._report_path is None:
+                io.write_line(content)
+            else:
+                self._report_path.write_text(content + "\n", encoding="utf-8")
+
+            return
+
+        lines = report.to_text()
+        if self._report_path is None:
+            for line in lines:
+                io.write_line(f"    {line}")
+        else:
+            from cleo.formatters.formatter import Formatter
+
+            self._report_path.write_text(
+                "".join(f"{Formatter().remove_format(line)}\n" for line in lines),
+                encoding="utf-8",
+            )
+
+    def _record_written(
+        self,
+        report: BundleReport,
+        path: Path,
+        manifest: BundleManifest,
+        unchanged: set[str],
+    ) -> None:
+        """
+        Record the files installed by this bundle run, leaving out
+        the distributions which were already installed.
+        """
+        for name, distribution in manifest.distributions.items():
+            if name in unchanged:
+                continue
+
+            size = 0
+            for file in distribution.files:
+                try:
+                    size += (path / file).stat().st_size
+                except OSError:
+                    continue
+
+            report.record_written(len(distribution.files), size)
+
+    def _installed_files(
+        self, env: Env, manifest: BundleManifest, unchanged: set[str]
+    ) -> list[Path]:
+        """
+        Return the site-packages files installed by this bundle run.
+        """
+        root = env.path.resolve()
+        site_packages = {env.purelib.resolve(), env.platlib.resolve()}
+        files = []
+        for name, distribution in manifest.distributions.items():
+            if name in unchanged:
+                continue
+
+            for file in distribution.files:
+                path = root / file
+                if any(path.is_relative_to(directory) for directory in site_packages):
+                    files.append(path)
+
+        return files
+
+    def _link_to_file_store(
+        self,
+        poetry: Poetry,
+        report: BundleReport,
+        env: Env,
+        manifest: BundleManifest,
+        unchanged: set[str],
+    ) -> str | None:
+        """
+        Hardlink the site-packages files installed by this bundle run to the
+        shared file store. Returns a warning if they could not be linked.
+        """
+        from poetry_plugin_bundle.utils.dedupe import FileStore
+
+        store = FileStore.from_config(poetry.config)
+        stats = report.timed(
+            "dedupe",
+            lambda: store.link_files(self._installed_files(env, manifest, unchanged)),
+        )()
+        if not stats.unsupported:
+            return None
 
-        if error:
-            operation_color = "red"
-        elif done:
-            operation_color = "green"
+        return (
+            "Files could not be hardlinked to the shared file store"
+            f" at {store.path}, which must be on the same filesystem as the bundle"
+        )
+
+    def _recompile(self, env: Env) -> None:
+        """
+        Compile the bytecode of a bundle restored from the cache again,
+        so that it refers to the sources at the path of the bundle.
+        """
+        from poetry_plugin_bundle.utils.bytecode import compile_env
 
-        verb = "Bundling"
-        if done:
-            verb = "<success>Bundled</success>"
+        compile_env(
+            env,
+            self._compile_invalidation_mode or "timestamp",
+            self._compile_optimization_levels or [0],
+            force=True,
+        )
+
+    def _compiles_environment(self) -> bool:
+        return self._compile_invalidation_mode is not None or bool(
+            self._compile_optimization_levels
+        )
+
+    def _get_compile_identity(self) -> str:
+        if not self._compiles_environment():
+            return str(self._compile)
+
+        levels = self._compile_optimization_levels or [0]
 
         return (
-            f"  <fg={operation_color};options=bold>•</>"
-            f" {verb} <c1>{poetry.package.pretty_name}</c1>"
-            f" (<b>{poetry.package.pretty_version}</b>) into <c2>{path}</c2>"
+            f"{self._compile_invalidation_mode or 'timestamp'}"
+            f":{','.join(str(level) for level in levels)}"
         )
 
-    def _write(self, io: IO | SectionOutput, message: str) -> None:
-        from cleo.io.outputs.section_output import SectionOutput
+    def _get_manifest_environment(self, env: Env) -> dict[str, str]:
+        """
+        Describe the environment a bundle manifest is valid for.
+        """
+        return {
+            "implementation": env.python_implementation,
+            "python": ".".join(str(v) for v in env.version_info[:3]),
+            "platform": self._platform or "",
+            "compile": self._get_compile_identity(),
+        }
 
-        if io.is_debug() or not io.is_decorated() or not isinstance(io, SectionOutput):
-            io.write_line(message)
-            return
+    def _get_cache_key(self, poetry: Poetry, python: Python, sources_hash: str) -> str:
+        """
+        Compute the key identifying this bundle in the bundle cache.
+        """
+        return self._get_fingerprint(
+            poetry,
+            f"{python.executable.resolve()}:{python.implementation}"
+            f":{python.patch_version.to_string()}",
+            sources_hash,
+        )
+
+    def _get_interpreter_identity(self, poetry: Poetry) -> str:
+        """
+        Identify the interpreter the bundle would be created with,
+        without running it.
+        """
+        import shutil
+        import sys
+
+        from poetry_plugin_bundle.utils.fingerprint import file_identity
+
+        if self._executable:
+            return file_identity(shutil.which(self._executable) or self._executable)
 
-        io.overwrite(message)
+        # Mirror the selection of the preferred Python done by Poetry
+        executable = None
+        if not poetry.config.get("virtualenvs.use-poetry-python"):
+            executable = shutil.which("python")
 
-    def _constrain_env_platform(self, env: Env, platform: str) -> None:
+        return file_identity(executable or sys.executable)
+
+    def _get_fingerprint(
+        self, poetry: Poetry, interpreter: str, sources_hash: str
+    ) -> str:
         """
-        Set the argument environment's supported tags
-        based on the configured platform override.
+        Compute the fingerprint of the inputs of this bundle,
+        given the hash of the sources of the project.
         """
-        from poetry_plugin_bundle.utils.platforms import create_supported_tags
+        from poetry.__version__ import __version__
 
-        env._supported_tags = create_supported_tags(platform, env)
+        from poetry_plugin_bundle.utils.fingerprint import Fingerprint
+        from poetry_plugin_bundle.utils.fingerprint import lock_hash
+
+        groups = (
+            "*"
+            if self._activated_groups is None
+            else ",".join(sorted(self._activated_groups))
+        )
+
+        return (
+            Fingerprint()
+            .update("poetry", __version__)
+            .update("lock", lock_hash(poetry))
+            .update("groups", groups)
+            .update("interpreter", interpreter)
+            .update("platform", self._platform or "")
+            .update("compile", self._get_compile_identity())
+            .update("relocatable", str(self._relocatable))
+            .update("sourceless", str(self._sourceless))
+            .update("keep-sources", ",".join(self._keep_sources))
+            .update("prune", ",".join(self._prune_rules))
+            .update("strip", str(self._strip))
+            .update("prune-packages", ",".join(self._prune_packages))
+            .update("project", sources_hash)
+            .hexdigest()
+        )
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from poetry_plugin_bundle.bundlers.archive_bundler import ArchiveBundler
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from poetry_plugin_bundle.utils.wheels import WheelMember
+
+
+class ZipBundler(ArchiveBundler):
+    """
+    Bundle the project and its dependencies into a ZIP archive
+    with the layout of site-packages, e.g. for AWS Lambda.
+    """
+
+    name = "zip"
+
+    def _write_archive(
+        self, path: Path, members: list[WheelMember], pycs: dict[str, Path]
+    ) -> None:
+        """
+        Write the archive deterministically: entries are sorted by path,
+        with a fixed timestamp and normalized permissions.
+        """
+        import shutil
+        import stat
+        import zipfile
+
+        from poetry_plugin_bundle.utils.wheels import WheelReader
+        from poetry_plugin_bundle.utils.wheels import archive_entries
+        from poetry_plugin_bundle.utils.wheels import archive_timestamp
+        from poetry_plugin_bundle.utils.wheels import zip_date_time
+
+        date_time = zip_date_time(archive_timestamp())
+
+        def zip_info(path: str, executable: bool) -> zipfile.ZipInfo:
+            info = zipfile.ZipInfo(path, date_time=date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.create_system = 3
+            info.external_attr = (stat.S_IFREG | (0o755 if executable else 0o644)) << 16
+            return info
+
+        reader = WheelReader()
+        try:
+            with zipfile.ZipFile(path, "w") as archive:
+                for entry in archive_entries(members, pycs, reader):
+                    with (
+                        entry.open() as src,
+                        archive.open(
+                            zip_info(entry.path, entry.executable), "w"
+                        ) as dst,
+                    ):
+                        shutil.copyfileobj(src, dst, 1024 * 1024)
+        finally:
+            reader.close()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from cleo.helpers import argument
+from cleo.helpers import option
+from poetry.console.commands.command import Command
+
+from poetry_plugin_bundle.utils.batch import BatchManifest
+from poetry_plugin_bundle.utils.batch import bundle_batch
+
+
+class BundleBatchCommand(Command):
+    name = "bundle batch"
+    description = (
+        "Bundle many projects into virtual environments from a manifest, in one process"
+    )
+
+    arguments = [  # noqa: RUF012
+        argument("manifest", "The path to the TOML manifest listing the bundles.")
+    ]
+
+    options = [  # noqa: RUF012
+        option(
+            "workers",
+            None,
+            "The maximum number of bundles to run concurrently."
+            " Defaults to the workers of the manifest, or the number of cores.",
+            flag=False,
+            value_required=True,
+        )
+    ]
+
+    def handle(self) -> int:
+        try:
+            manifest = BatchManifest.read(Path(self.argument("manifest")))
+        except ValueError as e:
+            self.line_error(f"<error>{e}</>")
+            return 1
+
+        workers = manifest.workers
+        if self.option("workers") is not None:
+            if not self.option("workers").isdigit() or not int(self.option("workers")):
+                self.line_error(
+                    f"<error>Invalid workers {self.option('workers')},"
+                    " expected a positive integer</>"
+                )
+                return 1
+
+            workers = int(self.option("workers"))
+
+        self.line("")
+
+        success = bundle_batch(manifest.jobs, self.io, workers)
+
+        return int(not success)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from cleo.helpers import option
+from poetry.config.config import Config
+from poetry.console.commands.command import Command
+
+from poetry_plugin_bundle.utils.bundle_cache import BundleCache
+from poetry_plugin_bundle.utils.dedupe import FileStore
+from poetry_plugin_bundle.utils.files import format_size
+from poetry_plugin_bundle.utils.files import parse_size
+from poetry_plugin_bundle.utils.venv_templates import VenvTemplateCache
+
+
+class BundleCacheCommand(Command):
+    name = "bundle cache"
+    description = "Inspect and prune the bundle cache"
+
+    options = [  # noqa: RUF012
+        option(
+            "prune",
+            None,
+            "Evict the least recently used bundles according to"
+            " <comment>--max-size</comment> and <comment>--max-age</comment>,"
+            " and the files of the shared file store no bundle links anymore.",
+            flag=True,
+        ),
+        option(
+            "max-size",
+            None,
+            "The maximum total size of the cache, e.g. 500M or 10G.",
+            flag=False,
+            value_required=True,
+        ),
+        option(
+            "max-age",
+            None,
+            "The maximum number of days a bundle can stay unused in the cache.",
+            flag=False,
+            value_required=True,
+        ),
+        option(
+            "clear",
+            None,
+            "Remove all bundles, virtual environment templates"
+            " and files of the shared file store from the cache.",
+            flag=True,
+        ),
+    ]
+
+    def handle(self) -> int:
+        config = Config.create()
+        cache = BundleCache.from_config(config)
+
+        if self.option("clear"):
+            entries = cache.entries()
+            for entry in entries:
+                cache.remove(entry)
+
+            templates = VenvTemplateCache.from_config(config).clear()
+            files = FileStore.from_config(config).clear()
+            self.line(
+                f"Removed <b>{len(entries)}</b> bundle(s),"
+                f" <b>{templates}</b> virtual environment template(s)"
+                f" and <b>{files}</b> shared file(s) from the cache."
+            )
+            return 0
+
+        if self.option("prune"):
+            max_size = self.option("max-size")
+            max_age = self.option("max-age")
+            if max_size is None and max_age is None:
+                self.line_error(
+                    "<error>The --prune option requires --max-size and/or --max-age.</>"
+                )
+                return 1
+
+            removed = cache.prune(
+                max_size=parse_size(max_size) if max_size is not None else None,
+                max_age=float(max_age) * 86400 if max_age is not None else None,
+            )
+            freed = sum(entry.size for entry in removed)
+            self.line(
+                f"Removed <b>{len(removed)}</b> bundle(s) from the cache,"
+                f" freeing <b>{format_size(freed)}</b>."
+            )
+
+            # Evicted bundles may have been the last ones linking shared files
+            files, freed = FileStore.from_config(config).prune()
+            self.line(
+                f"Removed <b>{files}</b> unused file(s) from the shared file store,"
+                f" freeing <b>{format_size(freed)}</b>."
+            )
+            return 0
+
+        entries = cache.entries()
+        if not entries:
+            self.line_error("<warning>No bundles found in the cache</>")
+            return 0
+
+        for entry in entries:
+            last_used = datetime.fromtimestamp(entry.last_used).isoformat(
+                sep=" ", timespec="seconds"
+            )
+            self.line(
+                f"<comment>{entry.key[:12]}</comment>"
+                f" <c1>{entry.name}</c1> (<b>{entry.version}</b>)"
+                f" {format_size(entry.size)}, last used {last_used}"
+            )
+
+        total = sum(entry.size for entry in entries)
+        self.line("")
+        self.line(
+            f"<b>{len(entries)}</b> bundle(s), <b>{format_size(total)}</b>"
+            f" in <c2>{cache.path}</c2>"
+        )
+
+        return 0
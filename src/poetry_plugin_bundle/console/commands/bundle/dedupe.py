@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from cleo.helpers import argument
+from poetry.console.commands.command import Command
+
+from poetry_plugin_bundle.utils.dedupe import dedupe_bundles
+from poetry_plugin_bundle.utils.files import format_size
+
+
+class BundleDedupeCommand(Command):
+    name = "bundle dedupe"
+    description = "Hardlink the identical files of existing bundles together"
+
+    arguments = [  # noqa: RUF012
+        argument(
+            "paths",
+            "The paths of the bundles to deduplicate.",
+            multiple=True,
+        )
+    ]
+
+    def handle(self) -> int:
+        paths = [Path(path) for path in self.argument("paths")]
+        missing = [path for path in paths if not path.is_dir()]
+        if missing:
+            self.line_error(
+                f"<error>The bundle path <c2>{missing[0]}</c2> does not exist.</>"
+            )
+            return 1
+
+        stats = dedupe_bundles(paths)
+
+        self.line(
+            f"Linked <b>{stats.linked}</b> of <b>{stats.files}</b> file(s),"
+            f" freeing <b>{format_size(stats.saved)}</b>."
+        )
+        if stats.unsupported:
+            self.line_error(
+                "<warning>Some files could not be hardlinked,"
+                " e.g. because they are on different filesystems.</>"
+            )
+
+        return 0
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import itertools
+
+from pathlib import Path
+
+from cleo.helpers import argument
+from cleo.helpers import option
+from poetry.console.commands.group_command import GroupCommand
+from poetry.utils.env.python import Python
+
+from poetry_plugin_bundle.utils.env import CachedPython
+from poetry_plugin_bundle.utils.env import InterpreterEnv
+from poetry_plugin_bundle.utils.files import format_size
+from poetry_plugin_bundle.utils.interpreter_cache import InterpreterCache
+from poetry_plugin_bundle.utils.locker import BundleLocker
+from poetry_plugin_bundle.utils.platforms import constrain_env_platform
+from poetry_plugin_bundle.utils.wheelhouse import Wheelhouse
+from poetry_plugin_bundle.utils.wheelhouse import download_wheelhouse
+
+
+class BundleDownloadCommand(GroupCommand):
+    name = "bundle download"
+    description = (
+        "Download the locked packages of the current project into a wheelhouse,"
+        " to bundle them later with no network access"
+    )
+
+    arguments = [  # noqa: RUF012
+        argument("path", "The path to the wheelhouse directory to download into.")
+    ]
+
+    options = [  # noqa: RUF012
+        *GroupCommand._group_dependency_options(),
+        option(
+            "python",
+            "p",
+            "The Python executable to select the archives for."
+            " Defaults to the current Python executable. Can be used multiple times.",
+            flag=False,
+            value_required=True,
+            multiple=True,
+        ),
+        option(
+            "platform",
+            None,
+            "Only download wheels compatible with the specified platform."
+            " Otherwise the platform of the running system is used."
+            " Can be used multiple times.",
+            flag=False,
+            value_required=True,
+            multiple=True,
+        ),
+    ]
+
+    def handle(self) -> int:
+        locker = BundleLocker.from_poetry(self.poetry)
+        if not locker.is_locked():
+            self.line_error(
+                "<error>The project has no lock file to download the packages of,"
+                " run <c1>poetry lock</c1> first.</>"
+            )
+            return 1
+
+        wheelhouse = Wheelhouse(Path(self.argument("path")))
+        interpreter_cache = InterpreterCache.from_config(self.poetry.config)
+
+        self.line("")
+
+        pythons: list[str | None] = [*self.option("python")] or [None]
+        platforms: list[str | None] = [*self.option("platform")] or [None]
+        for executable, platform in itertools.product(pythons, platforms):
+            if executable:
+                python: Python = CachedPython(Path(executable), interpreter_cache)
+            else:
+                python = Python.get_preferred_python(self.poetry.config)
+                if not self.poetry.package.python_constraint.allows(
+                    python.patch_version
+                ):
+                    python = Python.get_compatible_python(self.poetry)
+
+            env = InterpreterEnv(python.executable, cache=interpreter_cache)
+            if platform:
+                constrain_env_platform(env, platform)
+
+            self.line(
+                f"Downloading the packages of <c1>{self.poetry.package.pretty_name}</c1>"
+                f" for Python <b>{python.executable}</b>"
+                + (f" on <b>{platform}</b>" if platform else "")
+                + f" into <c2>{wheelhouse.path}</c2>"
+            )
+            download_wheelhouse(
+                self.poetry, env, locker, wheelhouse, self.activated_groups
+            )
+
+        stats = wheelhouse.stats
+        self.line(
+            f"Added <b>{stats.archives}</b> archive(s): <b>{stats.downloaded}</b>"
+            f" downloaded ({format_size(stats.size)}), <b>{stats.cached}</b>"
+            f" from the artifact cache and <b>{stats.present}</b> already present."
+        )
+        if stats.sdists:
+            self.line_error(
+                "<warning>The following archives are source distributions, which"
+                " bundles build and whose build requirements may need network access: "
+                + ", ".join(sorted(stats.sdists))
+                + "</>"
+            )
+        if stats.unavailable:
+            self.line_error(
+                "<warning>The following git dependencies are not downloaded,"
+                " and need network access to be cloned by bundles: "
+                + ", ".join(sorted(stats.unavailable))
+                + "</>"
+            )
+
+        return 0
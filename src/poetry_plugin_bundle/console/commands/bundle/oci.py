@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from cleo.helpers import argument
+from cleo.helpers import option
+
+from poetry_plugin_bundle.console.commands.bundle.zip import BundleZipCommand
+
+
+if TYPE_CHECKING:
+    from poetry_plugin_bundle.bundlers.oci_bundler import OciBundler
+
+
+class BundleOciCommand(BundleZipCommand):
+    name = "bundle oci"
+    description = (
+        "Bundle the current project and its dependencies into an OCI image layout,"
+        " with separate layers for the dependencies and the project"
+    )
+
+    arguments = [  # noqa: RUF012
+        argument("path", "The path to the OCI image layout directory to bundle into.")
+    ]
+
+    options = [  # noqa: RUF012
+        *BundleZipCommand.options,
+        option(
+            "target",
+            None,
+            "The directory of the image the layers are extracted into.",
+            flag=False,
+            default="/app",
+        ),
+        option(
+            "tag",
+            None,
+            "The tag of the image in the layout. Defaults to the project version.",
+            flag=False,
+            value_required=True,
+        ),
+    ]
+
+    bundler_name = "oci"
+
+    def configure_bundler(self, bundler: OciBundler) -> None:  # type: ignore[override]
+        super().configure_bundler(bundler)
+        bundler.set_target(self.option("target"))
+        bundler.set_tag(self.option("tag") or self.poetry.package.pretty_version)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import os
+
+from pathlib import Path
+from typing import cast
+
+from cleo.helpers import option
+from poetry.console.commands.command import Command
+
+from poetry_plugin_bundle.utils.server import DEFAULT_PORT
+from poetry_plugin_bundle.utils.server import TOKEN_ENV_VAR
+from poetry_plugin_bundle.utils.server import BundleServer
+from poetry_plugin_bundle.utils.server import make_server
+
+
+class BundleServeCommand(Command):
+    name = "bundle serve"
+    description = (
+        "Run bundle jobs sent over HTTP, keeping Poetry state loaded between them"
+    )
+
+    options = [  # noqa: RUF012
+        option(
+            "host",
+            None,
+            "The host to listen on.",
+            flag=False,
+            value_required=True,
+            default="127.0.0.1",
+        ),
+        option(
+            "port",
+            None,
+            "The port to listen on.",
+            flag=False,
+            value_required=True,
+            default=str(DEFAULT_PORT),
+        ),
+        option(
+            "socket",
+            None,
+            "Listen on the given Unix socket instead of a port.",
+            flag=False,
+            value_required=True,
+        ),
+        option(
+            "token",
+            None,
+            "The token clients must send as a bearer token, required to listen"
+            " on a host other than a loopback one. Defaults to the"
+            f" <comment>{TOKEN_ENV_VAR}</comment> environment variable.",
+            flag=False,
+            value_required=True,
+        ),
+    ]
+
+    def handle(self) -> int:
+        socket = self.option("socket")
+        try:
+            server = make_server(
+                BundleServer(self.io),
+                host=self.option("host"),
+                port=int(self.option("port")),
+                socket_path=Path(socket) if socket else None,
+                token=self.option("token") or os.environ.get(TOKEN_ENV_VAR) or None,
+            )
+        except ValueError as e:
+            self.line_error(f"<error>{e}</>")
+            return 1
+
+        if socket:
+            address = f"unix://{socket}"
+        else:
+            host, port = cast("tuple[str, int]", server.server_address)
+            address = f"http://{host}:{port}"
+
+        self.line(f"Serving bundle jobs on <c2>{address}</c2>")
+
+        with server:
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                self.line("Stopping")
+
+        return 0
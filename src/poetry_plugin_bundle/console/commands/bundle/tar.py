@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from cleo.helpers import argument
+from cleo.helpers import option
+
+from poetry_plugin_bundle.console.commands.bundle.zip import BundleZipCommand
+
+
+if TYPE_CHECKING:
+    from poetry_plugin_bundle.bundlers.tar_bundler import TarBundler
+
+
+class BundleTarCommand(BundleZipCommand):
+    name = "bundle tar"
+    description = (
+        "Bundle the current project and its dependencies into a tar archive"
+        " with the layout of site-packages"
+    )
+
+    arguments = [  # noqa: RUF012
+        argument(
+            "path",
+            "The path to the archive to bundle into, ending with"
+            " <comment>.tar</comment>, <comment>.tar.gz</comment>"
+            " or <comment>.tar.zst</comment>.",
+        )
+    ]
+
+    options = [  # noqa: RUF012
+        *BundleZipCommand.options,
+        option(
+            "compression-level",
+            None,
+            "The level of compression of the archive.",
+            flag=False,
+            value_required=True,
+        ),
+    ]
+
+    bundler_name = "tar"
+
+    def configure_bundler(self, bundler: TarBundler) -> None:  # type: ignore[override]
+        level = self.option("compression-level")
+
+        super().configure_bundler(bundler)
+        bundler.set_compression_level(None if level is None else int(level))
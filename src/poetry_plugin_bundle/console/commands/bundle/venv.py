@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import TYPE_CHECKING
+from typing import cast
 
 from cleo.helpers import argument
 from cleo.helpers import option
@@ -11,6 +12,7 @@ from poetry_plugin_bundle.console.commands.bundle.bundle_command import BundleCo
 
 if TYPE_CHECKING:
     from poetry_plugin_bundle.bundlers.venv_bundler import VenvBundler
+    from poetry_plugin_bundle.utils.matrix import MatrixTarget
 
 
 class BundleVenvCommand(BundleCommand):
@@ -18,18 +20,35 @@ class BundleVenvCommand(BundleCommand):
     description = "Bundle the current project into a virtual environment"
 
     arguments = [  # noqa: RUF012
-        argument("path", "The path to the virtual environment to bundle into.")
+        argument(
+            "path",
+            "The path to the virtual environment to bundle into. When bundling"
+            " for several Python executables, platforms or group sets, the"
+            " placeholders <comment>{python}</comment>, <comment>{platform}</comment>"
+            " and <comment>{groups}</comment> are substituted in it.",
+        )
     ]
 
     options = [  # noqa: RUF012
         *BundleCommand._group_dependency_options(),
+        option(
+            "group-set",
+            None,
+            "A comma-separated set of the only dependency groups to bundle, as with"
+            " <comment>--only</comment>. Can be used multiple times to bundle"
+            " each set.",
+            flag=False,
+            value_required=True,
+            multiple=True,
+        ),
         option(
             "python",
             "p",
             "The Python executable to use to create the virtual environment. "
-            "Defaults to the current Python executable",
+            "Defaults to the current Python executable. Can be used multiple times.",
             flag=False,
             value_required=True,
+            multiple=True,
         ),
         option(
             "clear",
@@ -45,25 +64,300 @@ class BundleVenvCommand(BundleCommand):
             " because the old installer always compiles.)",
             flag=True,
         ),
+        option(
+            "compile-mode",
+            None,
+            "Compile bytecode for the whole environment once everything is installed,"
+            " using the given invalidation mode"
+            " (<comment>timestamp</comment>, <comment>checked-hash</comment>"
+            " or <comment>unchecked-hash</comment>).",
+            flag=False,
+            value_required=True,
+        ),
+        option(
+            "optimize",
+            None,
+            "Compile bytecode for the whole environment once everything is installed,"
+            " for the given optimization level (0, 1 or 2). Can be used multiple times.",
+            flag=False,
+            value_required=True,
+            multiple=True,
+        ),
         option(
             "platform",
             None,
             (
                 "Only use wheels compatible with the specified platform."
                 " Otherwise the default behavior uses the platform"
-                " of the running system. (<comment>Experimental</comment>)"
+                " of the running system. Can be used multiple times."
+                " (<comment>Experimental</comment>)"
             ),
             flag=False,
             value_required=True,
+            multiple=True,
+        ),
+        option(
+            "cache",
+            None,
+            "Reuse an identical bundle from the bundle cache if one exists"
+            " and add the bundle to the cache otherwise.",
+            flag=True,
+        ),
+        option(
+            "if-stale",
+            None,
+            "Only bundle if the project, the lock file, the interpreter"
+            " or the bundle options changed since the last bundle into the path.",
+            flag=True,
+        ),
+        option(
+            "relocatable",
+            None,
+            "Make the virtual environment independent of its path, so that"
+            " it can be moved or copied to another path once bundled.",
+            flag=True,
+        ),
+        option(
+            "sourceless",
+            None,
+            "Replace the source files of the installed packages by bytecode files"
+            " once everything is installed.",
+            flag=True,
+        ),
+        option(
+            "keep-sources",
+            None,
+            "The name of a package whose source files must be kept"
+            " with <comment>--sourceless</comment>. Can be used multiple times.",
+            flag=False,
+            value_required=True,
+            multiple=True,
+        ),
+        option(
+            "prune",
+            None,
+            "Remove the files which are not needed at runtime once everything"
+            " is installed, according to the given rule"
+            " (<comment>tests</comment>, <comment>docs</comment>,"
+            " <comment>stubs</comment>, <comment>sources</comment>,"
+            " <comment>caches</comment>, <comment>bytecode</comment>"
+            " or <comment>all</comment>). Can be used multiple times.",
+            flag=False,
+            value_required=True,
+            multiple=True,
+        ),
+        option(
+            "prune-package",
+            None,
+            "The dotted name of an import package, e.g. <comment>foo.tests</comment>,"
+            " which <comment>--prune</comment> may remove. Can be used multiple times.",
+            flag=False,
+            value_required=True,
+            multiple=True,
+        ),
+        option(
+            "strip",
+            None,
+            "Strip the debug symbols of the ELF shared objects once installed.",
+            flag=True,
+        ),
+        option(
+            "size-budget",
+            None,
+            "Fail if the virtual environment is larger than the given size"
+            " once installed and pruned, e.g. 250M.",
+            flag=False,
+            value_required=True,
+        ),
+        option(
+            "dedupe",
+            None,
+            "Hardlink the installed files to identical files of a store shared"
+            " by all bundles, so that they take disk space only once.",
+            flag=True,
+        ),
+        option(
+            "find-links",
+            None,
+            "Install the archives found in the given wheelhouse, e.g. filled by"
+            " <comment>bundle download</comment>, rather than downloading them.",
+            flag=False,
+            value_required=True,
+        ),
+        option(
+            "offline",
+            None,
+            "Do not download anything: every archive must be found in the wheelhouse"
+            " given with <comment>--find-links</comment>.",
+            flag=True,
+        ),
+        option(
+            "installer",
+            None,
+            "The installer of the wheels: <comment>poetry</comment>, or"
+            " <comment>bundle</comment> to extract them in parallel"
+            " straight into the environment.",
+            flag=False,
+            value_required=True,
+            default="poetry",
+        ),
+        option(
+            "report",
+            None,
+            "Report the time spent in each phase of the bundle along with download,"
+            " cache and disk statistics"
+            " (<comment>text</comment> or <comment>json</comment>).",
+            flag=False,
+            value_required=True,
+        ),
+        option(
+            "report-file",
+            None,
+            "Write the report to the given file instead of the output."
+            " Implies --report text unless a format is given.",
+            flag=False,
+            value_required=True,
+        ),
+        option(
+            "trace",
+            None,
+            "Write a timeline of the bundle to the given file, in the Trace Event"
+            " Format read by Perfetto and chrome://tracing.",
+            flag=False,
+            value_required=True,
         ),
     ]
 
     bundler_name = "venv"
 
-    def configure_bundler(self, bundler: VenvBundler) -> None:  # type: ignore[override]
-        bundler.set_path(Path(self.argument("path")))
-        bundler.set_executable(self.option("python"))
+    def handle(self) -> int:
+        from poetry_plugin_bundle.utils.bytecode import OPTIMIZATION_LEVELS
+        from poetry_plugin_bundle.utils.matrix import expand_matrix
+
+        levels = [str(level) for level in OPTIMIZATION_LEVELS]
+        invalid = [level for level in self.option("optimize") if level not in levels]
+        if invalid:
+            self.line_error(
+                f"<error>Invalid bytecode optimization levels {', '.join(invalid)},"
+                f" expected some of: {', '.join(levels)}</>"
+            )
+            return 1
+
+        group_sets = self._group_sets()
+        if group_sets and any(self.option(key) for key in ("with", "without", "only")):
+            self.line_error(
+                "<warning>The `<fg=yellow;options=bold>--with</>`,"
+                " `<fg=yellow;options=bold>--without</>` and"
+                " `<fg=yellow;options=bold>--only</>` options are ignored when used"
+                " along with the `<fg=yellow;options=bold>--group-set</>` option."
+                "</warning>"
+            )
+
+        targets = expand_matrix(
+            self.argument("path"),
+            self.option("python"),
+            self.option("platform"),
+            group_sets,
+        )
+        if len(targets) == 1:
+            return super().handle()
+
+        from poetry_plugin_bundle.utils.locker import BundleLocker
+        from poetry_plugin_bundle.utils.matrix import bundle_matrix
+        from poetry_plugin_bundle.utils.matrix import format_paths
+
+        # Bundles must not write their report or trace to the same file
+        for name in ("report-file", "trace"):
+            if self.option(name):
+                format_paths(self.option(name), [target for target, _ in targets])
+
+        self.line("")
+
+        assert self._bundler_manager is not None
+
+        # The lock file is loaded once for all bundles
+        locker = BundleLocker.from_poetry(self.poetry)
+        if locker.is_locked():
+            _ = locker.lock_data
+
+        bundlers = []
+        for target, path in targets:
+            bundler = cast(
+                "VenvBundler", self._bundler_manager.bundler(self.bundler_name)
+            )
+            self.configure_bundler(bundler, target, path)
+            bundler.set_locker(locker)
+            bundlers.append(bundler)
+
+        return int(not bundle_matrix(self.poetry, self._io, bundlers))
+
+    def configure_bundler(  # type: ignore[override]
+        self,
+        bundler: VenvBundler,
+        target: MatrixTarget | None = None,
+        path: Path | None = None,
+    ) -> None:
+        from packaging.utils import canonicalize_name
+
+        from poetry_plugin_bundle.utils.files import parse_size
+        from poetry_plugin_bundle.utils.matrix import expand_matrix
+
+        if target is None or path is None:
+            # The placeholders of the path are substituted for single targets too
+            [(target, path)] = expand_matrix(
+                self.argument("path"),
+                self.option("python"),
+                self.option("platform"),
+                self._group_sets(),
+            )
+
+        bundler.set_path(path)
+        bundler.set_executable(target.python)
         bundler.set_remove(self.option("clear"))
         bundler.set_compile(self.option("compile"))
-        bundler.set_platform(self.option("platform"))
-        bundler.set_activated_groups(self.activated_groups)
+        bundler.set_compile_options(
+            self.option("compile-mode"),
+            [int(level) for level in self.option("optimize")],
+        )
+        bundler.set_platform(target.platform)
+        bundler.set_cache(self.option("cache"))
+        bundler.set_if_stale(self.option("if-stale"))
+        bundler.set_relocatable(self.option("relocatable"))
+        bundler.set_dedupe(self.option("dedupe"))
+        bundler.set_sourceless(self.option("sourceless"), self.option("keep-sources"))
+        bundler.set_prune(self.option("prune"), self.option("strip"))
+        bundler.set_prune_packages(self.option("prune-package"))
+        size_budget = self.option("size-budget")
+        bundler.set_size_budget(
+            parse_size(size_budget) if size_budget is not None else None
+        )
+        find_links = self.option("find-links")
+        bundler.set_find_links(
+            Path(find_links) if find_links else None, self.option("offline")
+        )
+        bundler.set_installer(self.option("installer"))
+        report_file = self.option("report-file")
+        bundler.set_report(
+            self.option("report") or ("text" if report_file else None),
+            Path(target.format(report_file)) if report_file else None,
+        )
+        trace = self.option("trace")
+        bundler.set_trace(Path(target.format(trace)) if trace else None)
+        bundler.set_activated_groups(
+            {canonicalize_name(group) for group in target.groups}
+            if target.groups is not None
+            else self.activated_groups
+        )
+
+    def _group_sets(self) -> list[frozenset[str]]:
+        """
+        Return the sets of dependency groups given with --group-set, which must
+        all be groups of the project.
+        """
+        group_sets = [
+            frozenset(group.strip() for group in value.split(",") if group.strip())
+            for value in self.option("group-set")
+        ]
+        self._validate_group_options({"group-set": set().union(*group_sets)})
+
+        return group_sets
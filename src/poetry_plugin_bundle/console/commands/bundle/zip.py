@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from cleo.helpers import argument
+from cleo.helpers import option
+
+from poetry_plugin_bundle.console.commands.bundle.bundle_command import BundleCommand
+
+
+if TYPE_CHECKING:
+    from poetry_plugin_bundle.bundlers.archive_bundler import ArchiveBundler
+
+
+class BundleZipCommand(BundleCommand):
+    name = "bundle zip"
+    description = (
+        "Bundle the current project and its dependencies into a ZIP archive"
+        " with the layout of site-packages"
+    )
+
+    arguments = [  # noqa: RUF012
+        argument("path", "The path to the archive to bundle into.")
+    ]
+
+    options = [  # noqa: RUF012
+        *BundleCommand._group_dependency_options(),
+        option(
+            "python",
+            "p",
+            "The Python executable to select the wheels for and to compile bytecode"
+            " with. Defaults to the Python executable Poetry would use",
+            flag=False,
+            value_required=True,
+        ),
+        option(
+            "compile",
+            None,
+            "Include bytecode files compiled from the Python source files.",
+            flag=True,
+        ),
+        option(
+            "compile-mode",
+            None,
+            "The invalidation mode of the bytecode files"
+            " (<comment>checked-hash</comment> or <comment>unchecked-hash</comment>)."
+            " Implies --compile.",
+            flag=False,
+            value_required=True,
+        ),
+        option(
+            "platform",
+            None,
+            (
+                "Only use wheels compatible with the specified platform."
+                " Otherwise the default behavior uses the platform"
+                " of the running system. (<comment>Experimental</comment>)"
+            ),
+            flag=False,
+            value_required=True,
+        ),
+    ]
+
+    bundler_name = "zip"
+
+    def configure_bundler(self, bundler: ArchiveBundler) -> None:  # type: ignore[override]
+        bundler.set_path(Path(self.argument("path")))
+        bundler.set_executable(self.option("python"))
+        bundler.set_compile(self.option("compile"), self.option("compile-mode"))
+        bundler.set_platform(self.option("platform"))
+        bundler.set_activated_groups(self.activated_groups)
@@ -1,49 +1,75 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-from typing import Any
 from typing import cast
 
-from cleo.events.console_events import COMMAND
 from poetry.plugins.application_plugin import ApplicationPlugin
 
-from poetry_plugin_bundle.console.commands.bundle.venv import BundleVenvCommand
-
 
 if TYPE_CHECKING:
-    from cleo.events.console_command_event import ConsoleCommandEvent
+    from collections.abc import Callable
+
     from poetry.console.application import Application
     from poetry.console.commands.command import Command
 
 
+# The plugin is loaded by every Poetry command, so the commands are only
+# imported once run, or listed, through the lazy command loader of Poetry.
+COMMANDS = [
+    "bundle venv",
+    "bundle zip",
+    "bundle tar",
+    "bundle oci",
+    "bundle cache",
+    "bundle dedupe",
+    "bundle serve",
+    "bundle batch",
+    "bundle download",
+]
+
+
 class BundleApplicationPlugin(ApplicationPlugin):
     @property
     def commands(self) -> list[type[Command]]:
-        return [BundleVenvCommand]
+        return [command_class(name) for name in COMMANDS]
 
     def activate(self, application: Application) -> None:
-        assert application.event_dispatcher
-        application.event_dispatcher.add_listener(
-            COMMAND,
-            self.configure_bundle_commands,  # type: ignore[arg-type]
-        )
-        super().activate(application=application)
+        for name in COMMANDS:
+            application.command_loader.register_factory(name, load_command(name))
+
+
+def command_class(name: str) -> type[Command]:
+    """
+    Import the class of the given command, e.g. BundleVenvCommand
+    from poetry_plugin_bundle.console.commands.bundle.venv for "bundle venv".
+    """
+    from importlib import import_module
+
+    words = name.split(" ")
+    module = import_module("poetry_plugin_bundle.console.commands." + ".".join(words))
+
+    return cast(
+        "type[Command]",
+        getattr(module, "".join(word.title() for word in words) + "Command"),
+    )
+
+
+def load_command(name: str) -> Callable[[], Command]:
+    """
+    Return a factory of the given command, importing it only when called.
+    """
 
-    def configure_bundle_commands(
-        self, event: ConsoleCommandEvent, event_name: str, _: Any
-    ) -> None:
+    def _load() -> Command:
         from poetry_plugin_bundle.console.commands.bundle.bundle_command import (
             BundleCommand,
         )
 
-        command: BundleCommand = cast("BundleCommand", event.command)
-        if not isinstance(command, BundleCommand):
-            return
+        command = command_class(name)()
+        if isinstance(command, BundleCommand):
+            from poetry_plugin_bundle.bundlers.bundler_manager import BundlerManager
 
-        # If the command already has a bundler manager, do nothing
-        if command.bundler_manager is not None:
-            return
+            command.set_bundler_manager(BundlerManager())
 
-        from poetry_plugin_bundle.bundlers.bundler_manager import BundlerManager
+        return command
 
-        command.set_bundler_manager(BundlerManager())
+    return _load
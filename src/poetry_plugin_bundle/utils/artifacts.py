@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from poetry.installation.executor import Executor
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from cleo.io.io import IO
+    from packaging.utils import NormalizedName
+    from poetry.installation.operations.install import Install
+    from poetry.installation.operations.update import Update
+    from poetry.packages.locker import Locker
+    from poetry.poetry import Poetry
+    from poetry.utils.env import Env
+
+
+class WheelCollector(Executor):
+    """
+    An executor collecting the wheels of the packages to install
+    instead of installing them.
+
+    Archives are taken from the artifact cache or downloaded into it, and
+    source distributions, directories and git dependencies are built into
+    wheels, exactly as they would be for an installation.
+    """
+
+    def __init__(self, *args: Any, build_dir: Path, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+
+        self._build_dir = build_dir
+        self._wheels: dict[NormalizedName, Path] = {}
+
+    @property
+    def wheels(self) -> dict[NormalizedName, Path]:
+        return self._wheels
+
+    def _install(self, operation: Install | Update) -> int:
+        from poetry.core.packages.utils.link import Link
+
+        package = operation.package
+        if package.source_type == "git":
+            archive = self._prepare_git_archive(operation)
+        elif package.source_type in {"file", "directory"}:
+            archive = self._prepare_archive(operation, output_dir=self._build_dir)
+        elif package.source_type == "url":
+            assert package.source_url is not None
+            archive = self._download_link(operation, Link(package.source_url))
+        else:
+            archive = self._download(operation)
+
+        self._wheels[package.name] = archive
+
+        return 0
+
+
+def collect_locked_wheels(
+    poetry: Poetry,
+    env: Env,
+    locker: Locker,
+    io: IO,
+    build_dir: Path,
+    activated_groups: Iterable[NormalizedName] | None = None,
+) -> dict[NormalizedName, Path] | None:
+    """
+    Return the wheels of the locked packages that would be installed into
+    an empty environment matching env, or None if some could not be obtained.
+    """
+    from poetry.installation.installer import Installer
+    from poetry.repositories.installed_repository import InstalledRepository
+
+    collector = WheelCollector(env, poetry.pool, poetry.config, io, build_dir=build_dir)
+    installer = Installer(
+        io,
+        env,
+        poetry.package,
+        locker,
+        poetry.pool,
+        poetry.config,
+        installed=InstalledRepository(),
+        executor=collector,
+    )
+    if activated_groups is not None:
+        installer.only_groups(activated_groups)
+
+    if installer.run():
+        return None
+
+    return collector.wheels
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import os
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from poetry_plugin_bundle.utils.jobs import BundleJob
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from cleo.io.io import IO
+
+
+@dataclass(frozen=True)
+class BatchManifest:
+    """
+    A list of bundle jobs, read from a TOML file with an array of bundle
+    tables along with an optional number of workers:
+
+        workers = 4
+
+        [[bundle]]
+        project = "services/api"
+        path = "dist/venv"
+        groups = ["main"]
+
+    Projects are relative to the directory of the manifest,
+    and bundle paths are relative to their project.
+    """
+
+    jobs: list[BundleJob]
+    workers: int | None = None
+
+    @classmethod
+    def read(cls, path: Path) -> BatchManifest:
+        from poetry.core.utils._compat import tomllib
+
+        try:
+            data = tomllib.loads(path.read_text(encoding="utf-8"))
+        except (OSError, tomllib.TOMLDecodeError) as e:
+            raise ValueError(f"Invalid batch manifest {path}: {e}") from None
+
+        workers = data.get("workers")
+        if workers is not None and (not isinstance(workers, int) or workers < 1):
+            raise ValueError(
+                f"Invalid batch manifest {path}: workers must be a positive integer"
+            )
+
+        bundles = data.get("bundle")
+        if (
+            not isinstance(bundles, list)
+            or not bundles
+            or not all(isinstance(bundle, dict) for bundle in bundles)
+        ):
+            raise ValueError(
+                f"Invalid batch manifest {path}: expected at least one [[bundle]] table"
+            )
+
+        jobs = []
+        for index, bundle in enumerate(bundles, 1):
+            bundle = dict(bundle)
+            if isinstance(bundle.get("project"), str):
+                bundle["project"] = str(path.parent / bundle["project"])
+
+            try:
+                jobs.append(BundleJob.from_dict(bundle))
+            except (TypeError, ValueError) as e:
+                raise ValueError(
+                    f"Invalid batch manifest {path}: bundle {index}: {e}"
+                ) from None
+
+        paths = [job.path.resolve() for job in jobs]
+        if len(set(paths)) != len(paths):
+            raise ValueError(
+                f"Invalid batch manifest {path}: bundle paths must be unique"
+            )
+
+        return cls(jobs, workers)
+
+
+def bundle_batch(jobs: list[BundleJob], io: IO, workers: int | None = None) -> bool:
+    """
+    Run the given bundle jobs concurrently in a bounded pool of workers.
+
+    Each project is loaded once for all its jobs, and the artifact cache
+    is shared by all projects, which download each archive only once.
+    The output of each bundle is written at once when it is done.
+    """
+    import threading
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    from poetry_plugin_bundle.utils.jobs import ProjectCache
+    from poetry_plugin_bundle.utils.matrix import run_buffered
+
+    projects = ProjectCache()
+    bundles = []
+    for job in jobs:
+        poetry, locker = projects.get(job.project)
+        bundles.append((poetry, job.bundler(poetry, locker)))
+
+    workers = workers or min(len(bundles), os.cpu_count() or 1)
+    lock = threading.Lock()
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="bundle-batch"
+    ) as executor:
+        results = list(
+            executor.map(
+                lambda bundle: run_buffered(
+                    io, lock, lambda target_io: bundle[1].bundle(bundle[0], target_io)
+                ),
+                bundles,
+            )
+        )
+
+    return all(results)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import time
+import uuid
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from poetry_plugin_bundle.utils.files import clone_tree
+from poetry_plugin_bundle.utils.files import directory_size
+from poetry_plugin_bundle.utils.files import rewrite_prefix
+from poetry_plugin_bundle.utils.files import venv_path_dependent_files
+
+
+if TYPE_CHECKING:
+    from poetry.config.config import Config
+
+
+@dataclass
+class BundleCacheEntry:
+    key: str
+    path: Path
+    name: str
+    version: str
+    source: Path
+    size: int
+    created: float
+    last_used: float
+
+    @property
+    def bundle(self) -> Path:
+        return self.path / "bundle"
+
+
+class BundleCache:
+    """
+    A content-addressed store of complete bundles.
+
+    Each entry lives in a directory named after the fingerprint of the inputs
+    that produced it and holds a copy of the bundle along with its metadata.
+    The modification time of the metadata file records when the entry was
+    last used, which drives the LRU eviction of prune().
+    """
+
+    METADATA_FILE = "bundle.json"
+
+    def __init__(self, cache_dir: Path) -> None:
+        self._cache_dir = cache_dir
+
+    @classmethod
+    def from_config(cls, config: Config) -> BundleCache:
+        return cls(Path(config.get("cache-dir")).expanduser() / "bundles")
+
+    @property
+    def path(self) -> Path:
+        return self._cache_dir
+
+    def get(self, key: str) -> BundleCacheEntry | None:
+        entry = self._load_entry(self._cache_dir / key)
+        if entry is None:
+            return None
+
+        entry.last_used = time.time()
+        os.utime(entry.path / self.METADATA_FILE, (entry.last_used, entry.last_used))
+
+        return entry
+
+    def restore(
+        self, key: str, target: Path, replace: bool = False
+    ) -> BundleCacheEntry | None:
+        """
+        Materialize the cached bundle identified by key at the target path,
+        which must not exist unless replace is given, and return its entry.
+        Returns None on a cache miss.
+
+        Only the paths of the files of the virtual environment are rewritten:
+        compiled bytecode still refers to the sources at the path of the entry.
+        """
+        from poetry.utils.env import EnvManager
+
+        if target.exists() and not replace:
+            raise FileExistsError(f"Cannot restore a cached bundle over {target}")
+
+        entry = self.get(key)
+        if entry is None:
+            return None
+
+        if target.is_dir():
+            EnvManager.remove_venv(target)
+
+        clone_tree(entry.bundle, target)
+        rewrite_prefix(venv_path_dependent_files(target), entry.source, target)
+
+        return entry
+
+    def put(self, key: str, source: Path, name: str, version: str) -> BundleCacheEntry:
+        """
+        Add a copy of the bundle located at source to the cache.
+        """
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Populate a temporary directory first and move it in place
+        # so that concurrent bundle runs never see a partial entry.
+        staging = self._cache_dir / f".tmp-{uuid.uuid4().hex}"
+        clone_tree(source, staging / "bundle")
+
+        now = time.time()
+        metadata = {
+            "name": name,
+            "version": version,
+            "source": str(source),
+            "size": directory_size(staging / "bundle"),
+            "created": now,
+        }
+        (staging / self.METADATA_FILE).write_text(
+            json.dumps(metadata, indent=2), encoding="utf-8"
+        )
+
+        path = self._cache_dir / key
+        try:
+            os.replace(staging, path)
+        except OSError:
+            # Another process stored the same bundle in the meantime.
+            shutil.rmtree(staging, ignore_errors=True)
+
+        entry = self._load_entry(path)
+        assert entry is not None
+
+        return entry
+
+    def entries(self) -> list[BundleCacheEntry]:
+        if not self._cache_dir.is_dir():
+            return []
+
+        entries = []
+        for path in self._cache_dir.iterdir():
+            if path.name.startswith("."):
+                continue
+
+            entry = self._load_entry(path)
+            if entry is not None:
+                entries.append(entry)
+
+        return sorted(entries, key=lambda e: e.last_used, reverse=True)
+
+    def remove(self, entry: BundleCacheEntry) -> None:
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+    def prune(
+        self, max_size: int | None = None, max_age: float | None = None
+    ) -> list[BundleCacheEntry]:
+        """
+        Evict the least recently used entries until the cache holds at most
+        max_size bytes and no entry has been unused for more than max_age seconds.
+        Returns the evicted entries.
+        """
+        entries = self.entries()
+        removed = []
+
+        if max_age is not None:
+            threshold = time.time() - max_age
+            for entry in list(entries):
+                if entry.last_used < threshold:
+                    entries.remove(entry)
+                    removed.append(entry)
+
+        if max_size is not None:
+            total = sum(entry.size for entry in entries)
+            while entries and total > max_size:
+                entry = entries.pop()
+                total -= entry.size
+                removed.append(entry)
+
+        for entry in removed:
+            self.remove(entry)
+
+        return removed
+
+    def _load_entry(self, path: Path) -> BundleCacheEntry | None:
+        metadata_file = path / self.METADATA_FILE
+        try:
+            metadata = json.loads(metadata_file.read_text(encoding="utf-8"))
+            last_used = metadata_file.stat().st_mtime
+        except (OSError, ValueError):
+            return None
+
+        return BundleCacheEntry(
+            key=path.name,
+            path=path,
+            name=metadata["name"],
+            version=metadata["version"],
+            source=Path(metadata["source"]),
+            size=metadata["size"],
+            created=metadata["created"],
+            last_used=last_used,
+        )
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import os
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from poetry.utils.env import Env
+
+    from poetry_plugin_bundle.utils.wheels import WheelMember
+
+
+INVALIDATION_MODES = ("timestamp", "checked-hash", "unchecked-hash")
+HASH_INVALIDATION_MODES = ("checked-hash", "unchecked-hash")
+OPTIMIZATION_LEVELS = (0, 1, 2)
+
+# Run by the interpreter of the environment, since bytecode files are specific
+# to the version of Python compiling them. Files failing to compile are ignored,
+# as pip does, since some distributions ship sources which are not meant to be.
+COMPILE_ENV = """\
+import compileall
+import py_compile
+
+mode = py_compile.PycInvalidationMode[{mode!r}]
+for level in {levels!r}:
+    for path in {paths!r}:
+        compileall.compile_dir(
+            path,
+            quiet=2,
+            workers=0,
+            invalidation_mode=mode,
+            optimize=level,
+            force={force!r},
+        )
+"""
+
+# Compiles source files read from wheels, listed on the standard input, into
+# hash-based bytecode files, which do not depend on the modification time
+# of the sources and can thus be produced without installing them.
+COMPILE_WHEEL_MEMBERS = """\
+import importlib.util
+import json
+import marshal
+import os
+import sys
+import zipfile
+
+for wheel, members in json.load(sys.stdin):
+    with zipfile.ZipFile(wheel) as archive:
+        for name, path in members:
+            source = archive.read(name)
+            try:
+                code = compile(source, path, "exec", dont_inherit=True)
+            except (SyntaxError, ValueError):
+                continue
+
+            pyc = os.path.join({output!r}, importlib.util.cache_from_source(path))
+            os.makedirs(os.path.dirname(pyc), exist_ok=True)
+            with open(pyc, "wb") as f:
+                f.write(importlib.util.MAGIC_NUMBER)
+                f.write(({flags!r}).to_bytes(4, "little"))
+                f.write(importlib.util.source_hash(source))
+                f.write(marshal.dumps(code))
+"""
+
+# Compiles the source files listed on the standard input into bytecode files
+# next to them, which are imported when the sources are missing, and outputs
+# the sources which compiled. Hash-based bytecode files are reproducible.
+COMPILE_SOURCELESS = """\
+import json
+import py_compile
+import sys
+
+compiled = []
+for path in json.load(sys.stdin):
+    try:
+        py_compile.compile(
+            path,
+            cfile=path + "c",
+            doraise=True,
+            optimize={level!r},
+            invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+        )
+    except py_compile.PyCompileError:
+        continue
+
+    compiled.append(path)
+
+print(json.dumps(compiled))
+"""
+
+
+def compile_env(
+    env: Env,
+    invalidation_mode: str = "timestamp",
+    optimization_levels: Iterable[int] = (0,),
+    force: bool = False,
+) -> None:
+    """
+    Compile every source file of the site-packages of env to bytecode,
+    across a pool of processes sized to the number of cores.
+
+    Up to date bytecode files are compiled again if force is given,
+    e.g. to refer to the sources at a new path.
+    """
+    levels = sorted(set(optimization_levels))
+
+    env.run_python_script(
+        COMPILE_ENV.format(
+            mode=invalidation_mode.upper().replace("-", "_"),
+            levels=levels,
+            paths=sorted({str(env.purelib), str(env.platlib)}),
+            force=force,
+        )
+    )
+
+
+def compile_sourceless(
+    env: Env, keep_sources: Collection[str] = (), optimization_level: int = 0
+) -> list[Path]:
+    """
+    Compile the source files of the site-packages of env into bytecode files
+    next to them and remove the sources, along with their cached bytecode,
+    except for the distributions named in keep_sources.
+
+    Sources which fail to compile are kept. Returns the removed sources.
+    """
+    import json
+
+    from importlib.metadata import distributions
+    from pathlib import Path
+
+    from packaging.utils import canonicalize_name
+
+    from poetry_plugin_bundle.utils.files import update_records
+
+    site_packages = sorted({env.purelib, env.platlib})
+    keep = {canonicalize_name(name) for name in keep_sources}
+
+    kept: set[str] = set()
+    for distribution in distributions(path=[str(path) for path in site_packages]):
+        if canonicalize_name(distribution.metadata["Name"]) in keep:
+            kept.update(
+                os.path.normpath(str(distribution.locate_file(file)))
+                for file in distribution.files or []
+            )
+
+    sources = []
+    for directory in site_packages:
+        for root, dirs, files in os.walk(directory):
+            dirs[:] = [name for name in dirs if name != "__pycache__"]
+            for name in files:
+                path = os.path.join(root, name)
+                if name.endswith(".py") and os.path.normpath(path) not in kept:
+                    sources.append(path)
+
+    output = env.run_python_script(
+        COMPILE_SOURCELESS.format(level=optimization_level),
+        input=json.dumps(sorted(sources)),
+    )
+
+    removed = []
+    for path in json.loads(output):
+        source = Path(path)
+        source.unlink()
+        for pyc in source.parent.glob(f"__pycache__/{source.stem}.*.pyc"):
+            pyc.unlink()
+
+        removed.append(source)
+
+    changes = {
+        Path(os.path.normpath(source)): source.with_suffix(".pyc") for source in removed
+    }
+    for directory in site_packages:
+        update_records(directory, changes)
+
+    return removed
+
+
+def compile_wheel_members(
+    env: Env,
+    members: Iterable[WheelMember],
+    output_dir: Path,
+    invalidation_mode: str = "checked-hash",
+) -> dict[str, Path]:
+    """
+    Compile the Python source files of wheels to bytecode with the interpreter
+    of env, without installing them.
+
+    Returns the bytecode files written to output_dir,
+    keyed by their path relative to site-packages.
+    """
+    import json
+
+    from pathlib import Path
+
+    sources: dict[str, list[tuple[str, str]]] = {}
+    for member in members:
+        if member.path.endswith(".py"):
+            sources.setdefault(str(member.wheel), []).append((member.name, member.path))
+
+    env.run_python_script(
+        COMPILE_WHEEL_MEMBERS.format(
+            output=str(output_dir),
+            # Hash-based flag, along with the flag to check the source
+            flags=0b11 if invalidation_mode == "checked-hash" else 0b01,
+        ),
+        input=json.dumps(sorted(sources.items())),
+    )
+
+    pycs = {}
+    for root, _, files in os.walk(output_dir):
+        for name in files:
+            pyc = Path(root, name)
+            pycs[pyc.relative_to(output_dir).as_posix()] = pyc
+
+    return pycs
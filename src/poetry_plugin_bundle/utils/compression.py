@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import functools
+import gzip
+import os
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from typing import Protocol
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+    from pathlib import Path
+
+
+# Size of the blocks compressed independently of each other
+BLOCK_SIZE = 4 * 1024 * 1024
+
+TAR_COMPRESSIONS = {
+    ".tar": None,
+    ".tar.gz": "gzip",
+    ".tgz": "gzip",
+    ".tar.zst": "zstd",
+    ".tzst": "zstd",
+}
+
+
+class BinaryWriter(Protocol):
+    def write(self, data: bytes, /) -> int: ...
+
+
+class ParallelCompressor:
+    """
+    A writable binary stream compressing its content in blocks on a pool of
+    threads, and writing the compressed blocks to fileobj in order.
+
+    Every block is compressed into an independent gzip member or zstd frame,
+    which decompressors read back as a single stream. Compression libraries
+    release the GIL, so that all cores are used.
+    """
+
+    def __init__(
+        self,
+        fileobj: BinaryWriter,
+        compress: Callable[[bytes], bytes],
+        block_size: int = BLOCK_SIZE,
+        workers: int | None = None,
+    ) -> None:
+        self._fileobj = fileobj
+        self._compress = compress
+        self._block_size = block_size
+        self._workers = workers or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._workers, thread_name_prefix="bundle-compress"
+        )
+        self._buffer = bytearray()
+        self._pending: deque[Future[bytes]] = deque()
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        while len(self._buffer) >= self._block_size:
+            block = bytes(self._buffer[: self._block_size])
+            del self._buffer[: self._block_size]
+            self._submit(block)
+
+        return len(data)
+
+    def close(self) -> None:
+        try:
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+                self._buffer.clear()
+
+            while self._pending:
+                self._fileobj.write(self._pending.popleft().result())
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _submit(self, block: bytes) -> None:
+        self._pending.append(self._executor.submit(self._compress, block))
+
+        # Bound the memory used by blocks in flight
+        while len(self._pending) > 2 * self._workers:
+            self._fileobj.write(self._pending.popleft().result())
+
+
+def tar_compression(path: Path) -> str | None:
+    """
+    Return the compression of a tar archive based on the extension of its path.
+    """
+    for suffix, compression in TAR_COMPRESSIONS.items():
+        if path.name.endswith(suffix):
+            return compression
+
+    raise ValueError(
+        f"Unsupported archive {path.name}, expected one of the extensions:"
+        f" {', '.join(TAR_COMPRESSIONS)}"
+    )
+
+
+def block_compressor(
+    compression: str, level: int | None = None
+) -> Callable[[bytes], bytes]:
+    """
+    Return a thread-safe function compressing a block into a gzip member
+    or a zstd frame.
+    """
+    if compression == "gzip":
+        # A null modification time keeps archives reproducible
+        return functools.partial(
+            gzip.compress, compresslevel=6 if level is None else level, mtime=0
+        )
+
+    try:
+        # Available in the standard library from Python 3.14
+        from compression import zstd  # type: ignore[import-not-found]
+
+        return functools.partial(zstd.compress, level=level)
+    except ImportError:
+        pass
+
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError:
+        raise RuntimeError(
+            "Writing zstd archives requires the zstandard package"
+            " or Python 3.14 or later"
+        ) from None
+
+    def compress(block: bytes) -> bytes:
+        # Compressor objects must not be shared between threads
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+        return compressor.compress(block)  # type: ignore[no-any-return]
+
+    return compress
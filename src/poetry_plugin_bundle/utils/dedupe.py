@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import contextlib
+import errno
+import os
+import stat
+import uuid
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from poetry_plugin_bundle.utils.fingerprint import hash_file
+from poetry_plugin_bundle.utils.manifest import BUNDLE_METADATA_DIR
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from poetry.config.config import Config
+
+
+# Errors of os.link() meaning that files cannot be hardlinked together,
+# e.g. because they live on different filesystems
+LINK_UNSUPPORTED_ERRORS = {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP}
+
+
+@dataclass
+class DedupeStats:
+    files: int = 0
+    linked: int = 0
+    saved: int = 0
+    unsupported: bool = False
+
+    def add(self, other: DedupeStats) -> None:
+        self.files += other.files
+        self.linked += other.linked
+        self.saved += other.saved
+        self.unsupported |= other.unsupported
+
+
+class FileStore:
+    """
+    A content-addressed store of files shared by bundles through hardlinks,
+    so that identical files take disk space and page cache only once.
+
+    Files are keyed by the hash of their content and by their permissions,
+    which hardlinks share. Files of the store which are not linked by any
+    bundle anymore are only removed by pruning the store.
+    """
+
+    def __init__(self, store_dir: Path) -> None:
+        self._store_dir = store_dir
+
+    @classmethod
+    def from_config(cls, config: Config) -> FileStore:
+        return cls(Path(config.get("cache-dir")).expanduser() / "bundle-files")
+
+    @property
+    def path(self) -> Path:
+        return self._store_dir
+
+    def link_files(self, files: Iterable[Path]) -> DedupeStats:
+        """
+        Replace the given files by hardlinks to identical files of the store,
+        adding the files which are not in the store yet.
+        """
+        stats = DedupeStats()
+        for batch in _bytecode_last(files):
+            for file, status in _regular_files(batch):
+                stats.files += 1
+                entry = self._entry(file, status)
+                try:
+                    if entry.exists():
+                        if not os.path.samefile(entry, file):
+                            link_file(entry, file)
+                            stats.linked += 1
+                            stats.saved += status.st_size
+                    else:
+                        entry.parent.mkdir(parents=True, exist_ok=True)
+                        os.link(file, entry)
+                except FileExistsError:
+                    # Another bundle stored the same file in the meantime
+                    continue
+                except OSError as e:
+                    if e.errno not in LINK_UNSUPPORTED_ERRORS:
+                        raise
+
+                    stats.unsupported = True
+                    return stats
+
+        return stats
+
+    def prune(self) -> tuple[int, int]:
+        """
+        Remove the files of the store which are not linked by any bundle anymore.
+        Returns the number and the total size of the removed files.
+        """
+        removed = 0
+        freed = 0
+        for entry in self._entries():
+            try:
+                status = entry.lstat()
+                if status.st_nlink > 1:
+                    continue
+
+                entry.unlink()
+            except FileNotFoundError:
+                continue
+
+            removed += 1
+            freed += status.st_size
+
+        self._remove_empty_directories()
+
+        return removed, freed
+
+    def clear(self) -> int:
+        """
+        Remove all the files of the store, leaving the bundles linking them intact.
+        Returns the number of removed files.
+        """
+        removed = 0
+        for entry in self._entries():
+            entry.unlink(missing_ok=True)
+            removed += 1
+
+        self._remove_empty_directories()
+
+        return removed
+
+    def _entries(self) -> list[Path]:
+        if not self._store_dir.is_dir():
+            return []
+
+        return [entry for entry in self._store_dir.glob("*/*") if entry.is_file()]
+
+    def _remove_empty_directories(self) -> None:
+        if not self._store_dir.is_dir():
+            return
+
+        for directory in self._store_dir.iterdir():
+            # Another bundle may have stored a file in the meantime
+            with contextlib.suppress(OSError):
+                directory.rmdir()
+
+    def _entry(self, file: Path, status: os.stat_result) -> Path:
+        key = f"{hash_file(file)}-{stat.S_IMODE(status.st_mode):o}"
+
+        return self._store_dir / key[:2] / key[2:]
+
+
+def dedupe_bundles(paths: Iterable[Path]) -> DedupeStats:
+    """
+    Fold the identical files found below the given bundle paths
+    into hardlinks to a single file.
+
+    Files are compared by size and permissions first, and only
+    hashed when several of them match.
+    """
+    stats = DedupeStats()
+    for batch in _bytecode_last(_bundle_files(paths)):
+        stats.add(_fold_files(batch))
+
+    return stats
+
+
+def _fold_files(files: Iterable[Path]) -> DedupeStats:
+    candidates: dict[tuple[int, int, int], list[tuple[Path, os.stat_result]]] = {}
+    for file, status in _regular_files(files):
+        key = (status.st_dev, status.st_size, stat.S_IMODE(status.st_mode))
+        candidates.setdefault(key, []).append((file, status))
+
+    stats = DedupeStats()
+    for files_ in candidates.values():
+        stats.files += len(files_)
+        if len(files_) < 2:
+            continue
+
+        # Files sharing an inode already are only hashed once
+        by_hash: dict[str, Path] = {}
+        inodes: dict[int, str] = {}
+        for file, status in files_:
+            digest = inodes.get(status.st_ino)
+            if digest is None:
+                digest = inodes[status.st_ino] = hash_file(file)
+
+            source = by_hash.setdefault(digest, file)
+            if source == file or os.path.samefile(source, file):
+                continue
+
+            try:
+                link_file(source, file)
+            except OSError as e:
+                if e.errno not in LINK_UNSUPPORTED_ERRORS:
+                    raise
+
+                stats.unsupported = True
+                continue
+
+            stats.linked += 1
+            if status.st_nlink == 1:
+                stats.saved += status.st_size
+
+    return stats
+
+
+def link_file(source: Path, target: Path) -> None:
+    """
+    Atomically replace target by a hardlink to source, which has the same
+    content, and refresh the bytecode files of target accordingly.
+    """
+    old = target.stat()
+    temporary = target.with_name(f".{target.name}.{uuid.uuid4().hex}")
+    os.link(source, temporary)
+    try:
+        os.replace(temporary, target)
+    except OSError:
+        temporary.unlink(missing_ok=True)
+        raise
+
+    if target.suffix == ".py":
+        refresh_bytecode(target, old)
+
+
+def refresh_bytecode(source: Path, old: os.stat_result) -> None:
+    """
+    Record the new modification time of source in its timestamp-based bytecode
+    files, which would otherwise be stale once source got linked to a file
+    with the same content but another modification time.
+    """
+    new = source.stat()
+    old_mtime = (int(old.st_mtime) & 0xFFFFFFFF).to_bytes(4, "little")
+    new_mtime = (int(new.st_mtime) & 0xFFFFFFFF).to_bytes(4, "little")
+    size = (old.st_size & 0xFFFFFFFF).to_bytes(4, "little")
+    if old_mtime == new_mtime:
+        return
+
+    for pyc in source.parent.glob(f"__pycache__/{source.stem}.*.pyc"):
+        content = pyc.read_bytes()
+        # Flags are null for timestamp-based bytecode files
+        if content[4:8] != bytes(4) or content[8:16] != old_mtime + size:
+            continue
+
+        # Write a new file since the bytecode file may be linked as well
+        temporary = pyc.with_name(f".{pyc.name}.{uuid.uuid4().hex}")
+        temporary.write_bytes(content[:8] + new_mtime + content[12:])
+        os.replace(temporary, pyc)
+
+
+def _bundle_files(paths: Iterable[Path]) -> Iterator[Path]:
+    for path in paths:
+        for root, dirs, files in os.walk(path):
+            # Bundle metadata is rewritten in place
+            if root == str(path) and BUNDLE_METADATA_DIR in dirs:
+                dirs.remove(BUNDLE_METADATA_DIR)
+
+            for name in files:
+                yield Path(root, name)
+
+
+def _bytecode_last(files: Iterable[Path]) -> tuple[list[Path], list[Path]]:
+    """
+    Split files into the bytecode files and the others, which are linked
+    first since linking sources refreshes their bytecode files.
+    """
+    sources: list[Path] = []
+    bytecode: list[Path] = []
+    for file in files:
+        (bytecode if file.suffix == ".pyc" else sources).append(file)
+
+    return sources, bytecode
+
+
+def _regular_files(files: Iterable[Path]) -> Iterator[tuple[Path, os.stat_result]]:
+    """
+    Yield the non-empty regular files among the given ones along with their status.
+    """
+    for file in files:
+        try:
+            status = file.lstat()
+        except FileNotFoundError:
+            continue
+
+        if stat.S_ISREG(status.st_mode) and status.st_size:
+            yield file, status
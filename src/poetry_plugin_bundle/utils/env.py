@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from poetry.utils.env import VirtualEnv
+from poetry.utils.env.python import Python
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from packaging.tags import Tag
+    from poetry.utils.env.base_env import EnvPaths
+    from poetry.utils.env.base_env import MarkerEnv
+
+    from poetry_plugin_bundle.utils.interpreter_cache import InterpreterCache
+
+
+# Run by an interpreter to describe itself at once, rather than through
+# the separate probes run by Python.
+GET_PYTHON_INFO = """\
+import json
+import platform
+import sys
+import sysconfig
+
+print(
+    json.dumps(
+        {
+            "version": platform.python_version().split("+")[0],
+            "interpreter": sys.executable,
+            "implementation": platform.python_implementation().lower(),
+            "free_threaded": bool(sysconfig.get_config_var("Py_GIL_DISABLED")),
+        }
+    )
+)
+"""
+
+
+class CachedPython(Python):
+    """
+    A Python interpreter described by a single probe, whose result
+    is read from the interpreter cache when the interpreter is unchanged.
+    """
+
+    def __init__(self, executable: Path, cache: InterpreterCache | None = None) -> None:
+        import json
+        import subprocess
+
+        from pathlib import Path
+
+        from poetry.core.constraints.version import Version
+
+        info = cache.get(executable, "python") if cache is not None else None
+        if info is None:
+            info = json.loads(
+                subprocess.run(
+                    [str(executable), "-I", "-c", GET_PYTHON_INFO],
+                    capture_output=True,
+                    check=True,
+                    text=True,
+                ).stdout
+            )
+            if cache is not None:
+                cache.put(executable, "python", info)
+
+        super().__init__(executable, Version.parse(info["version"]))
+
+        self._interpreter = Path(info["interpreter"])
+        self._implementation: str = info["implementation"]
+        self._free_threaded: bool = info["free_threaded"]
+
+    @property
+    def executable(self) -> Path:
+        return self._interpreter
+
+    @property
+    def implementation(self) -> str:
+        return self._implementation
+
+    @property
+    def free_threaded(self) -> bool:
+        return self._free_threaded
+
+
+class CachedVirtualEnv(VirtualEnv):
+    """
+    A virtual environment reading the data of its interpreter, i.e. its
+    markers, paths and supported tags, from the interpreter cache when it
+    is unchanged.
+
+    The data is cached through the methods Env subclasses implement, which
+    every supported version of Poetry calls to compute it.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        base: Path | None = None,
+        cache: InterpreterCache | None = None,
+    ) -> None:
+        self._interpreter_cache = cache
+
+        super().__init__(path, base)
+
+    def get_marker_env(self) -> MarkerEnv:
+        if self._interpreter_cache is None:
+            return super().get_marker_env()
+
+        marker_env: MarkerEnv = self._cached_environment(self._interpreter_cache)[
+            "marker_env"
+        ]
+        # Tuples are read back from the cache as lists
+        marker_env["version_info"] = tuple(marker_env["version_info"])  # type: ignore[typeddict-item]
+
+        return marker_env
+
+    def get_paths(self) -> EnvPaths:
+        if self._interpreter_cache is None:
+            return super().get_paths()
+
+        paths: EnvPaths = self._cached_environment(self._interpreter_cache)["paths"]
+
+        return paths
+
+    def get_supported_tags(self) -> list[Tag]:
+        from pathlib import Path
+
+        from packaging.tags import Tag
+
+        cache = self._interpreter_cache
+        if cache is None:
+            return super().get_supported_tags()
+
+        # The tags are computed from the cached markers, so they are only
+        # added to the cached data once these are cached
+        data = self._cached_environment(cache)
+        if "tags" not in data:
+            data["tags"] = [str(tag) for tag in super().get_supported_tags()]
+            cache.put(Path(self.python), "environment", data)
+
+        return [Tag(*tag.split("-")) for tag in data["tags"]]
+
+    def _cached_environment(self, cache: InterpreterCache) -> dict[str, Any]:
+        """
+        Return the markers and paths of the environment, along with its
+        supported tags once computed, read from the
+        interpreter cache unless its interpreter or its pyvenv.cfg changed,
+        e.g. when the environment was recreated at the same path.
+        """
+        from pathlib import Path
+
+        from poetry_plugin_bundle.utils.fingerprint import file_identity
+
+        executable = Path(self.python)
+        identity = file_identity(self._path / "pyvenv.cfg")
+        data: dict[str, Any] | None = cache.get(executable, "environment")
+        if data is not None and data.get("pyvenv") == identity:
+            return data
+
+        data = {
+            "pyvenv": identity,
+            "marker_env": super().get_marker_env(),
+            "paths": super().get_paths(),
+        }
+        cache.put(executable, "environment", data)
+
+        return data
+
+
+class InterpreterEnv(CachedVirtualEnv):
+    """
+    The environment of a bare Python interpreter.
+
+    It exposes the markers and the supported tags of the virtual environments
+    created from the interpreter, which allows selecting artifacts for them
+    before they exist. Nothing must be installed into it.
+
+    The path of the environment defaults to the directory of the interpreter;
+    it is only used to clone git dependencies into.
+    """
+
+    def __init__(
+        self,
+        executable: Path,
+        path: Path | None = None,
+        cache: InterpreterCache | None = None,
+    ) -> None:
+        self._interpreter = executable
+
+        super().__init__(path or executable.parent, cache=cache)
+
+    def _bin(self, bin: str) -> str:
+        if bin == self._executable:
+            return str(self._interpreter)
+
+        return super()._bin(bin)
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+# ioctl request code for FICLONE, see linux/fs.h
+FICLONE = 0x40049409
+
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def reflink_file(source: Path, destination: Path) -> bool:
+    """
+    Try to create a copy-on-write clone of source at destination.
+
+    Returns False if the platform or the filesystem does not support it,
+    in which case destination is left untouched or empty.
+    """
+    if sys.platform != "linux":
+        return False
+
+    import fcntl
+
+    try:
+        with source.open("rb") as src, destination.open("wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+    except OSError:
+        return False
+
+    return True
+
+
+def clone_file(source: Path, destination: Path) -> None:
+    """
+    Copy a file, preferring a copy-on-write clone when the filesystem supports it.
+
+    Hardlinks are deliberately not used: the wheel installer rewrites existing
+    files in place, so a shared inode would leak changes between copies.
+    """
+    if not reflink_file(source, destination):
+        shutil.copyfile(source, destination)
+
+    shutil.copystat(source, destination)
+
+
+def clone_tree(source: Path, destination: Path) -> None:
+    """
+    Recursively copy a directory with clone_file, preserving symlinks as is.
+    """
+    destination.mkdir(parents=True, exist_ok=True)
+
+    with os.scandir(source) as entries:
+        for entry in entries:
+            target = destination / entry.name
+            if entry.is_symlink():
+                os.symlink(os.readlink(entry.path), target)
+            elif entry.is_dir():
+                clone_tree(Path(entry.path), target)
+            else:
+                clone_file(Path(entry.path), target)
+
+    shutil.copystat(source, destination)
+
+
+def directory_size(path: Path) -> int:
+    """
+    Return the size in bytes of the regular files below path.
+    """
+    size = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            file = os.path.join(root, name)
+            if not os.path.islink(file):
+                size += os.path.getsize(file)
+
+    return size
+
+
+def parse_size(value: str) -> int:
+    value = value.strip().upper().removesuffix("B").removesuffix("I")
+    unit = value[-1:] if value[-1:] in SIZE_UNITS else ""
+    number = value.removesuffix(unit) if unit else value
+
+    try:
+        return int(float(number) * SIZE_UNITS[unit])
+    except ValueError:
+        raise ValueError(f"Invalid size: {value}") from None
+
+
+def format_size(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+
+    amount = float(size)
+    for unit in ("KiB", "MiB", "GiB"):
+        amount /= 1024
+        if amount < 1024:
+            return f"{amount:.1f} {unit}"
+
+    return f"{amount / 1024:.1f} TiB"
+
+
+def venv_path_dependent_files(venv: Path) -> list[Path]:
+    """
+    Return the files of a virtual environment that may embed its absolute path,
+    i.e. its configuration file, activation scripts and script shebangs.
+    """
+    files = [venv / "pyvenv.cfg"]
+    for bin_dir in (venv / "bin", venv / "Scripts"):
+        if not bin_dir.is_dir():
+            continue
+
+        files.extend(
+            file
+            for file in bin_dir.iterdir()
+            if file.is_file() and not file.is_symlink()
+        )
+
+    return [file for file in files if file.exists()]
+
+
+def rewrite_prefix(files: list[Path], old: Path, new: Path) -> None:
+    """
+    Replace every occurrence of the old path by the new one in the given text files.
+
+    Binary files (e.g. Windows launchers) are left untouched since changing
+    the length of their content would corrupt them.
+    """
+    old_prefix = str(old).encode()
+    new_prefix = str(new).encode()
+    if old_prefix == new_prefix:
+        return
+
+    for file in files:
+        content = file.read_bytes()
+        if b"\0" in content[:8192] or old_prefix not in content:
+            continue
+
+        # Write a new file rather than modifying it in place
+        # so that a cloned inode is never shared with its source.
+        stat = file.stat()
+        file.unlink()
+        file.write_bytes(content.replace(old_prefix, new_prefix))
+        os.chmod(file, stat.st_mode)
+
+
+def update_records(site_packages: Path, changes: Mapping[Path, Path | None]) -> None:
+    """
+    Update the RECORD files of the distributions installed into site-packages
+    after some of their files were removed or replaced by other files, so that
+    they match what is actually installed.
+
+    The changes map the absolute paths of the installed files to the paths
+    of the files replacing them, or to None if they were removed.
+    """
+    import csv
+    import io
+    import uuid
+
+    for record in site_packages.glob("*.dist-info/RECORD"):
+        rows = list(csv.reader(io.StringIO(record.read_text(encoding="utf-8"))))
+        updated = []
+        for row in rows:
+            path = Path(os.path.normpath(site_packages / row[0])) if row else None
+            if path is None or path not in changes:
+                updated.append(row)
+                continue
+
+            replacement = changes[path]
+            if replacement is not None:
+                # The hash and size of the new file are optional
+                relative = os.path.relpath(replacement, site_packages)
+                updated.append([Path(relative).as_posix(), "", ""])
+
+        if updated == rows:
+            continue
+
+        output = io.StringIO()
+        csv.writer(output, lineterminator="\n").writerows(updated)
+
+        # Write a new file since the record may be linked to other bundles
+        temporary = record.with_name(f".{record.name}.{uuid.uuid4().hex}")
+        temporary.write_text(output.getvalue(), encoding="utf-8")
+        os.replace(temporary, record)
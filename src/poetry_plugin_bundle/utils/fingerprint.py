@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import hashlib
+import os
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from poetry_plugin_bundle.utils.manifest import BUNDLE_METADATA_DIR
+
+
+if TYPE_CHECKING:
+    from poetry.poetry import Poetry
+
+
+# File of a bundle holding the fingerprint of the inputs that produced it
+BUNDLE_FINGERPRINT_FILE = Path(BUNDLE_METADATA_DIR) / "fingerprint"
+
+
+class Fingerprint:
+    """
+    Incrementally computed digest identifying the inputs of a bundle.
+
+    Every component is recorded with its name so that two different
+    sets of inputs can never produce the same serialized stream.
+    """
+
+    def __init__(self) -> None:
+        self._hash = hashlib.sha256()
+
+    def update(self, name: str, value: str) -> Fingerprint:
+        self._hash.update(f"{name}={value}\0".encode())
+
+        return self
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+def hash_file(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            hasher.update(chunk)
+
+    return hasher.hexdigest()
+
+
+def file_identity(path: str | Path) -> str:
+    """
+    Identify a file by its resolved path, inode and modification time,
+    without reading its content.
+    """
+    resolved = os.path.realpath(path)
+    try:
+        stat = os.stat(resolved)
+    except OSError:
+        return resolved
+
+    return f"{resolved}:{stat.st_ino}:{stat.st_mtime_ns}"
+
+
+def read_bundle_fingerprint(path: Path) -> str | None:
+    try:
+        return (path / BUNDLE_FINGERPRINT_FILE).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+
+def write_bundle_fingerprint(path: Path, fingerprint: str) -> None:
+    file = path / BUNDLE_FINGERPRINT_FILE
+    file.parent.mkdir(parents=True, exist_ok=True)
+    file.write_text(fingerprint, encoding="utf-8")
+
+
+def discard_bundle_fingerprint(path: Path) -> None:
+    (path / BUNDLE_FINGERPRINT_FILE).unlink(missing_ok=True)
+
+
+def lock_hash(poetry: Poetry) -> str:
+    """
+    Return the hash of the lock file content, or an empty string
+    if the project has not been locked.
+    """
+    lock = poetry.locker.lock
+    if not lock.exists():
+        return ""
+
+    return hash_file(lock)
+
+
+def project_sources_hash(poetry: Poetry) -> str:
+    """
+    Return a hash of the pyproject file and of every file
+    that would be included in the wheel of the root project,
+    along with the metadata of the wheel.
+    """
+    from poetry.core.masonry.builders.wheel import WheelBuilder
+    from poetry.core.masonry.utils.module import ModuleOrPackageNotFoundError
+
+    hasher = hashlib.sha256()
+    hasher.update(poetry.pyproject_path.read_bytes())
+
+    if hasattr(poetry, "is_package_mode") and not poetry.is_package_mode:
+        return hasher.hexdigest()
+
+    builder = WheelBuilder(poetry)
+    try:
+        files = builder.find_files_to_add()
+    except ModuleOrPackageNotFoundError:
+        return hasher.hexdigest()
+
+    for file in sorted(files, key=lambda f: f.relative_to_source_root().as_posix()):
+        hasher.update(file.relative_to_source_root().as_posix().encode())
+        hasher.update(b"\0")
+        hasher.update(hash_file(file.path).encode())
+        hasher.update(b"\0")
+
+    # The metadata embeds the readme and the version, which plugins may
+    # compute, e.g. from tags, and the license files and scripts are
+    # included in the wheel outside of the package.
+    hasher.update(builder.get_metadata_content().encode())
+    hasher.update(b"\0")
+    metadata_files = {*builder._get_legal_files(), *builder.convert_script_files()}
+    for path in sorted(metadata_files):
+        hasher.update(
+            path.relative_to(poetry.pyproject_path.parent).as_posix().encode()
+        )
+        hasher.update(b"\0")
+        hasher.update(hash_file(path).encode())
+        hasher.update(b"\0")
+
+    return hasher.hexdigest()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+import os
+import uuid
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+
+if TYPE_CHECKING:
+    from poetry.config.config import Config
+
+
+class InterpreterCache:
+    """
+    A cache of the data probed from Python interpreters, e.g. their version,
+    markers and paths, which spares spawning them on every bundle run.
+
+    Entries are keyed by the path of the interpreter along with the inode
+    and modification time of the file it resolves to, so that they are
+    invalidated when the interpreter is replaced or upgraded.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self._cache_dir = cache_dir
+
+    @classmethod
+    def from_config(cls, config: Config) -> InterpreterCache:
+        return cls(Path(config.get("cache-dir")).expanduser() / "bundle-interpreters")
+
+    @property
+    def path(self) -> Path:
+        return self._cache_dir
+
+    @staticmethod
+    def key(executable: Path) -> str | None:
+        """
+        Compute the key of an interpreter, or None if it does not exist.
+        """
+        from poetry_plugin_bundle.utils.fingerprint import Fingerprint
+        from poetry_plugin_bundle.utils.fingerprint import file_identity
+
+        if not executable.exists():
+            return None
+
+        # The path itself is part of the key since the paths of a virtual
+        # environment depend on it, not only on the interpreter it links to.
+        return (
+            Fingerprint()
+            .update("path", str(executable.absolute()))
+            .update("interpreter", file_identity(executable))
+            .hexdigest()
+        )
+
+    def get(self, executable: Path, probe: str) -> Any | None:
+        key = self.key(executable)
+        if key is None:
+            return None
+
+        return self._load(key).get(probe)
+
+    def put(self, executable: Path, probe: str, data: Any) -> None:
+        key = self.key(executable)
+        if key is None:
+            return
+
+        entry = self._load(key)
+        entry[probe] = data
+
+        # Failing to cache a probe only means running it again next time
+        staging = self._cache_dir / f".tmp-{uuid.uuid4().hex}"
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            staging.write_text(json.dumps(entry, sort_keys=True), encoding="utf-8")
+            os.replace(staging, self._cache_dir / f"{key}.json")
+        except OSError:
+            staging.unlink(missing_ok=True)
+
+    def _load(self, key: str) -> dict[str, Any]:
+        try:
+            entry = json.loads(
+                (self._cache_dir / f"{key}.json").read_text(encoding="utf-8")
+            )
+        except (OSError, ValueError):
+            return {}
+
+        return entry if isinstance(entry, dict) else {}
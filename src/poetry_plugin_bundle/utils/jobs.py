@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import cast
+
+from poetry.repositories.repository_pool import RepositoryPool
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from poetry.config.config import Config
+    from poetry.poetry import Poetry
+    from poetry.repositories.repository import Repository
+    from poetry.utils.cache import ArtifactCache
+
+    from poetry_plugin_bundle.bundlers.venv_bundler import VenvBundler
+    from poetry_plugin_bundle.utils.locker import BundleLocker
+
+
+@dataclass(frozen=True)
+class BundleJob:
+    """
+    A request to bundle the project at the given path into a virtual environment.
+
+    Bundle paths are relative to the project.
+    """
+
+    project: Path
+    path: Path
+    python: str | None = None
+    platform: str | None = None
+    groups: frozenset[str] | None = None
+    clear: bool = False
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> BundleJob:
+        unknown = sorted(set(data) - set(cls.__dataclass_fields__))
+        if unknown:
+            raise ValueError(
+                f"Invalid bundle job fields {', '.join(unknown)}, expected"
+                f" some of: {', '.join(cls.__dataclass_fields__)}"
+            )
+
+        for name in ("project", "path"):
+            if not isinstance(data.get(name), str):
+                raise TypeError(f"Invalid bundle job, expected a string {name!r}")
+
+        for name in ("python", "platform"):
+            if not isinstance(data.get(name), (str, type(None))):
+                raise TypeError(f"Invalid bundle job, expected a string {name!r}")
+
+        groups = data.get("groups")
+        if groups is not None and not (
+            isinstance(groups, list) and all(isinstance(group, str) for group in groups)
+        ):
+            raise TypeError("Invalid bundle job, expected a list of 'groups'")
+
+        project = Path(data["project"]).expanduser()
+
+        return cls(
+            project=project,
+            path=project / Path(data["path"]).expanduser(),
+            python=data.get("python"),
+            platform=data.get("platform"),
+            groups=frozenset(groups) if groups is not None else None,
+            clear=bool(data.get("clear", False)),
+        )
+
+    def bundler(self, poetry: Poetry, locker: BundleLocker) -> VenvBundler:
+        """
+        Create the bundler of this job for the given project.
+        """
+        from packaging.utils import canonicalize_name
+
+        from poetry_plugin_bundle.bundlers.bundler_manager import BundlerManager
+
+        groups = self.groups
+        if groups is None:
+            groups = frozenset(poetry.package.dependency_group_names())
+
+        bundler = cast("VenvBundler", BundlerManager().bundler("venv"))
+        bundler.set_path(self.path)
+        bundler.set_executable(self.python)
+        bundler.set_platform(self.platform)
+        bundler.set_remove(self.clear)
+        bundler.set_activated_groups({canonicalize_name(group) for group in groups})
+        bundler.set_locker(locker)
+
+        return bundler
+
+
+class SharedArtifactCachePool(RepositoryPool):
+    """
+    A repository pool using the given artifact cache, e.g. one shared with
+    the pools of other projects, rather than an artifact cache of its own.
+    """
+
+    def __init__(
+        self,
+        repositories: list[Repository] | None = None,
+        *,
+        config: Config | None = None,
+        artifact_cache: ArtifactCache,
+    ) -> None:
+        super().__init__(repositories, config=config)
+
+        self._shared_artifact_cache = artifact_cache
+
+    @classmethod
+    def from_pool(
+        cls,
+        pool: RepositoryPool,
+        artifact_cache: ArtifactCache,
+        config: Config | None = None,
+    ) -> SharedArtifactCachePool:
+        """
+        Create a pool with the repositories and priorities of pool,
+        using the given artifact cache.
+        """
+        shared = cls(config=config, artifact_cache=artifact_cache)
+        for repository in pool.all_repositories:
+            shared.add_repository(
+                repository, priority=pool.get_priority(repository.name)
+            )
+
+        return shared
+
+    @property
+    def artifact_cache(self) -> ArtifactCache:
+        return self._shared_artifact_cache
+
+
+class ProjectCache:
+    """
+    The Poetry objects of projects, along with their repository pools and lock
+    data, loaded once and reused as long as their pyproject.toml and poetry.lock
+    files are unchanged.
+
+    Projects share their artifact cache, so that an archive needed by several
+    projects bundled concurrently is downloaded only once.
+    """
+
+    def __init__(self) -> None:
+        self._projects: dict[Path, tuple[str, Poetry, BundleLocker]] = {}
+        self._artifact_caches: dict[Path, ArtifactCache] = {}
+
+    @property
+    def projects(self) -> list[Path]:
+        return sorted(self._projects)
+
+    def get(self, directory: Path) -> tuple[Poetry, BundleLocker]:
+        from poetry.factory import Factory
+
+        from poetry_plugin_bundle.utils.fingerprint import file_identity
+        from poetry_plugin_bundle.utils.locker import BundleLocker
+
+        directory = directory.resolve()
+        identity = ",".join(
+            file_identity(directory / name)
+            for name in ("pyproject.toml", "poetry.lock")
+        )
+        cached = self._projects.get(directory)
+        if cached is not None and cached[0] == identity:
+            return cached[1], cached[2]
+
+        poetry = Factory().create_poetry(directory)
+        # Downloads are only deduplicated by the same artifact cache instance
+        poetry.set_pool(
+            SharedArtifactCachePool.from_pool(
+                poetry.pool,
+                self._artifact_caches.setdefault(
+                    poetry.config.artifacts_cache_directory, poetry.pool.artifact_cache
+                ),
+                config=poetry.config,
+            )
+        )
+
+        locker = BundleLocker.from_poetry(poetry)
+        if locker.is_locked():
+            # Parse the lock file once for all jobs
+            _ = locker.lock_data
+
+        self._projects[directory] = (identity, poetry, locker)
+
+        return poetry, locker
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from poetry.packages.locker import Locker
+
+
+if TYPE_CHECKING:
+    from poetry.poetry import Poetry
+    from poetry.repositories.lockfile_repository import LockfileRepository
+
+
+class BundleLocker(Locker):
+    """
+    A locker of the project which never installs packages in editable mode,
+    since bundles must not depend on the sources they were built from.
+    """
+
+    @classmethod
+    def from_poetry(cls, poetry: Poetry) -> BundleLocker:
+        return cls(poetry.locker.lock, poetry.locker._pyproject_data)
+
+    def locked_repository(self) -> LockfileRepository:
+        repo = super().locked_repository()
+        for package in repo.packages:
+            package.develop = False
+        return repo
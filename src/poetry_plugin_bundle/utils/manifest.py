@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+
+from dataclasses import asdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+
+    from poetry.core.packages.package import Package
+    from poetry.utils.env import Env
+
+
+# Directory of a bundle holding the metadata written by the bundler
+BUNDLE_METADATA_DIR = ".poetry-bundle"
+
+# Distributions kept when not locked, as Poetry does when synchronizing
+# environments, since virtual environments are seeded with them
+PRESERVED_DISTRIBUTIONS = {"pip"}
+
+
+@dataclass
+class InstalledDistribution:
+    name: str
+    version: str
+    hash: str | None
+    files: list[str]
+
+
+class BundleManifest:
+    """
+    Record of the distributions installed in a bundle by the bundler.
+
+    The manifest stores, for each distribution, its version, the hash of the
+    archive it was installed from and the files it installed, relative to the
+    root of the bundle. It allows later bundle runs to work out which
+    distributions changed without inspecting the environment.
+    """
+
+    FILE = Path(BUNDLE_METADATA_DIR) / "manifest.json"
+    VERSION = 1
+
+    def __init__(
+        self,
+        environment: Mapping[str, str],
+        distributions: Mapping[str, InstalledDistribution],
+    ) -> None:
+        self._environment = dict(environment)
+        self._distributions = dict(distributions)
+
+    @property
+    def environment(self) -> dict[str, str]:
+        return self._environment
+
+    @property
+    def distributions(self) -> dict[str, InstalledDistribution]:
+        return self._distributions
+
+    @classmethod
+    def read(cls, path: Path) -> BundleManifest | None:
+        try:
+            data = json.loads((path / cls.FILE).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if data.get("version") != cls.VERSION:
+            return None
+
+        return cls(
+            data["environment"],
+            {
+                name: InstalledDistribution(**distribution)
+                for name, distribution in data["distributions"].items()
+            },
+        )
+
+    def write(self, path: Path) -> None:
+        file = path / self.FILE
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(
+            json.dumps(
+                {
+                    "version": self.VERSION,
+                    "environment": self._environment,
+                    "distributions": {
+                        name: asdict(distribution)
+                        for name, distribution in sorted(self._distributions.items())
+                    },
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+
+    @classmethod
+    def discard(cls, path: Path) -> None:
+        (path / cls.FILE).unlink(missing_ok=True)
+
+    @classmethod
+    def from_env(
+        cls, env: Env, environment: Mapping[str, str], hashes: Mapping[str, str]
+    ) -> BundleManifest:
+        """
+        Build the manifest of the distributions currently installed in env,
+        identifying their installed artifacts with the given hashes.
+
+        Only the files which exist are recorded, since the RECORD of some
+        distributions lists files which were never installed, e.g. bytecode.
+        """
+        from importlib.metadata import distributions
+
+        from packaging.utils import canonicalize_name
+
+        root = os.path.normcase(os.path.abspath(env.path))
+        site_packages = sorted({str(env.purelib), str(env.platlib)})
+
+        installed: dict[str, InstalledDistribution] = {}
+        for distribution in distributions(path=site_packages):
+            name = canonicalize_name(distribution.metadata["Name"])
+
+            files = []
+            for file in distribution.files or []:
+                absolute = os.path.normcase(
+                    os.path.abspath(str(distribution.locate_file(file)))
+                )
+                if absolute.startswith(root + os.sep) and os.path.exists(absolute):
+                    files.append(Path(os.path.relpath(absolute, root)).as_posix())
+
+            installed[name] = InstalledDistribution(
+                name=name,
+                version=distribution.version,
+                hash=hashes.get(name),
+                files=sorted(files),
+            )
+
+        return cls(environment, installed)
+
+    def diff(
+        self,
+        path: Path,
+        locked_packages: Iterable[dict[str, Any]],
+        root: str | None = None,
+    ) -> tuple[list[Package], list[InstalledDistribution]]:
+        """
+        Compare the manifest with the packages of the lock file.
+
+        Returns the packages which are installed exactly as locked, with all
+        of their files, and the distributions that are stale and must be removed.
+        The root project and the preserved distributions are neither, unless locked.
+        """
+        from packaging.utils import canonicalize_name
+        from poetry.core.packages.package import Package
+
+        locked: dict[str, dict[str, Any]] = {
+            canonicalize_name(info["name"]): info for info in locked_packages
+        }
+
+        unchanged = []
+        stale = []
+        for name, distribution in self._distributions.items():
+            info = locked.get(name)
+            if info is None and (name == root or name in PRESERVED_DISTRIBUTIONS):
+                continue
+
+            if (
+                info is None
+                or info["version"] != distribution.version
+                or distribution.hash is None
+                or distribution.hash not in locked_hashes(info)
+                or not all((path / file).exists() for file in distribution.files)
+            ):
+                stale.append(distribution)
+                continue
+
+            source = info.get("source", {})
+            source_type = source.get("type")
+            unchanged.append(
+                Package(
+                    name,
+                    info["version"],
+                    # Installed packages never have the "legacy" source type
+                    source_type=source_type if source_type != "legacy" else None,
+                    source_url=source.get("url") if source_type != "legacy" else None,
+                    source_reference=source.get("reference"),
+                    source_resolved_reference=source.get("resolved_reference"),
+                    source_subdirectory=source.get("subdirectory"),
+                )
+            )
+
+        return unchanged, stale
+
+    @staticmethod
+    def remove_distributions(
+        path: Path, distributions: Iterable[InstalledDistribution]
+    ) -> None:
+        """
+        Remove the files installed by the given distributions
+        along with the directories they leave empty.
+        """
+        directories = set()
+        for distribution in distributions:
+            for file in distribution.files:
+                target = path / file
+                target.unlink(missing_ok=True)
+                directories.add(target.parent)
+
+        # Deepest directories first so that emptied parents can be removed too
+        for directory in sorted(directories, key=lambda d: len(d.parts), reverse=True):
+            _remove_if_empty(directory, path)
+
+
+def locked_package_infos(lock_data: Mapping[str, Any]) -> list[dict[str, Any]]:
+    """
+    Return the package entries of the lock file, with their files
+    attached to them regardless of the version of the lock file.
+    """
+    metadata_files = lock_data.get("metadata", {}).get("files", {})
+
+    infos = []
+    for info in lock_data.get("package", []):
+        if "files" not in info:
+            info = {**info, "files": metadata_files.get(info["name"], [])}
+        infos.append(info)
+
+    return infos
+
+
+def locked_hashes(info: dict[str, Any]) -> set[str]:
+    """
+    Return the values that may identify the installed artifact
+    of a package entry of the lock file.
+    """
+    source = info.get("source", {})
+    if source.get("type") == "git":
+        return {f"git:{source.get('url')}@{source.get('resolved_reference')}"}
+
+    # Directory dependencies are not immutable, they are always reinstalled.
+    if source.get("type") == "directory":
+        return set()
+
+    return {file["hash"] for file in info.get("files", [])}
+
+
+def _remove_if_empty(directory: Path, root: Path) -> None:
+    while directory != root and directory.is_dir():
+        remaining = [
+            entry for entry in directory.iterdir() if entry.name != "__pycache__"
+        ]
+        if remaining:
+            return
+
+        shutil.rmtree(directory, ignore_errors=True)
+        directory = directory.parent
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Sequence
+
+    from cleo.io.io import IO
+    from poetry.poetry import Poetry
+
+    from poetry_plugin_bundle.bundlers.bundler import Bundler
+
+
+PLACEHOLDERS = ("{python}", "{platform}", "{groups}")
+
+
+@dataclass(frozen=True)
+class MatrixTarget:
+    python: str | None
+    platform: str | None
+    # The only dependency groups to bundle, if not the ones selected by default
+    groups: frozenset[str] | None = None
+
+    def format(self, template: str) -> str:
+        """
+        Substitute the placeholders of template with the values of the target.
+        """
+        return (
+            template.replace(
+                "{python}", Path(self.python).name if self.python else "python"
+            )
+            .replace("{platform}", self.platform or "native")
+            .replace(
+                "{groups}",
+                "-".join(sorted(self.groups)) if self.groups is not None else "default",
+            )
+        )
+
+
+def expand_matrix(
+    template: str,
+    pythons: Sequence[str],
+    platforms: Sequence[str],
+    group_sets: Sequence[frozenset[str]] = (),
+) -> list[tuple[MatrixTarget, Path]]:
+    """
+    Return the targets of every combination of the given Python executables,
+    platforms and sets of dependency groups, along with the path to bundle
+    each of them into.
+    """
+    axes: tuple[list[str | None], list[str | None], list[frozenset[str] | None]] = (
+        [*pythons] or [None],
+        [*platforms] or [None],
+        [*group_sets] or [None],
+    )
+    targets = [
+        MatrixTarget(python, platform, groups)
+        for python, platform, groups in itertools.product(*axes)
+    ]
+
+    return list(zip(targets, format_paths(template, targets), strict=True))
+
+
+def format_paths(template: str, targets: Sequence[MatrixTarget]) -> list[Path]:
+    """
+    Return the path of each of the targets given by template,
+    which must tell them apart so that no two targets share a path.
+    """
+    paths = [Path(target.format(template)) for target in targets]
+    if len(set(paths)) != len(paths):
+        raise ValueError(
+            f"The path {template} must tell the bundles apart with the placeholders"
+            f" {', '.join(PLACEHOLDERS[:-1])} and {PLACEHOLDERS[-1]}"
+        )
+
+    return paths
+
+
+def bundle_matrix(
+    poetry: Poetry, io: IO, bundlers: Sequence[Bundler], workers: int | None = None
+) -> bool:
+    """
+    Run the given bundlers concurrently with the same Poetry instance.
+
+    Bundlers share the artifact cache of the repository pool of Poetry, which
+    downloads each archive only once even when several bundlers need it.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    lock = threading.Lock()
+    workers = workers or min(len(bundlers), os.cpu_count() or 1)
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="bundle-matrix"
+    ) as executor:
+        results = list(
+            executor.map(
+                lambda bundler: run_buffered(
+                    io, lock, lambda buffered: bundler.bundle(poetry, buffered)
+                ),
+                bundlers,
+            )
+        )
+
+    return all(results)
+
+
+def run_buffered(io: IO, lock: threading.Lock, run: Callable[[IO], bool]) -> bool:
+    """
+    Run a bundle alongside others, writing its output to a buffer which is
+    written to io under the given lock once the bundle is done.
+
+    The sections of an output cannot be written to by several threads,
+    so the buffer is not decorated.
+    """
+    from cleo.io.buffered_io import BufferedIO
+    from cleo.io.outputs.output import Type
+
+    buffered = BufferedIO(supports_utf8=io.supports_utf8())
+    buffered.set_verbosity(io.output.verbosity)
+    try:
+        return run(buffered)
+    finally:
+        with lock:
+            io.output.write(buffered.fetch_output(), type=Type.RAW)
+            io.error_output.write(buffered.fetch_error(), type=Type.RAW)
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+    from pathlib import Path
+
+    from poetry_plugin_bundle.utils.compression import BinaryWriter
+    from poetry_plugin_bundle.utils.wheels import ArchiveEntry
+
+
+MEDIA_TYPE_INDEX = "application/vnd.oci.image.index.v1+json"
+MEDIA_TYPE_MANIFEST = "application/vnd.oci.image.manifest.v1+json"
+MEDIA_TYPE_CONFIG = "application/vnd.oci.image.config.v1+json"
+MEDIA_TYPE_LAYER = "application/vnd.oci.image.layer.v1.tar+gzip"
+
+# Architectures of the platform tags of wheels, as named by OCI
+ARCHITECTURES = {
+    "x86_64": "amd64",
+    "amd64": "amd64",
+    "aarch64": "arm64",
+    "arm64": "arm64",
+    "armv7l": "arm",
+    "i686": "386",
+    "ppc64le": "ppc64le",
+    "s390x": "s390x",
+}
+
+
+@dataclass(frozen=True)
+class Descriptor:
+    media_type: str
+    digest: str
+    size: int
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"mediaType": self.media_type, "digest": self.digest, "size": self.size}
+
+
+@dataclass(frozen=True)
+class Layer:
+    descriptor: Descriptor
+    # Digest of the uncompressed layer
+    diff_id: str
+
+
+class _DigestWriter:
+    def __init__(self, fileobj: BinaryWriter | None = None) -> None:
+        self._fileobj = fileobj
+        self._hash = hashlib.sha256()
+        self.size = 0
+
+    @property
+    def digest(self) -> str:
+        return f"sha256:{self._hash.hexdigest()}"
+
+    def write(self, data: bytes) -> int:
+        self._hash.update(data)
+        self.size += len(data)
+        if self._fileobj is not None:
+            self._fileobj.write(data)
+
+        return len(data)
+
+
+class OciLayout:
+    """
+    An OCI image layout directory, holding content-addressed blobs.
+
+    Blobs are identified by the digest of their content, so that identical
+    layers are shared by images built from the same files.
+
+    Refer to:
+        https://github.com/opencontainers/image-spec/blob/main/image-layout.md
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._blobs = path / "blobs" / "sha256"
+
+    def write_blob(self, data: bytes, media_type: str) -> Descriptor:
+        digest = hashlib.sha256(data).hexdigest()
+        self._blobs.mkdir(parents=True, exist_ok=True)
+        (self._blobs / digest).write_bytes(data)
+
+        return Descriptor(media_type, f"sha256:{digest}", len(data))
+
+    def write_layer(
+        self, entries: Iterable[ArchiveEntry], timestamp: int, level: int | None = None
+    ) -> Layer:
+        """
+        Write the given entries into a gzip compressed tar layer.
+
+        Layers are compressed in blocks of a fixed size, so that the same
+        entries always produce the same blob, whatever the number of cores.
+        """
+        from poetry_plugin_bundle.utils.compression import ParallelCompressor
+        from poetry_plugin_bundle.utils.compression import block_compressor
+        from poetry_plugin_bundle.utils.wheels import write_tar
+
+        self._blobs.mkdir(parents=True, exist_ok=True)
+        staging = self._blobs / ".layer"
+        with staging.open("wb") as f:
+            blob = _DigestWriter(f)
+            compressor = ParallelCompressor(blob, block_compressor("gzip", level))
+            diff = _DigestWriter(compressor)
+            try:
+                write_tar(diff, entries, timestamp)
+            finally:
+                compressor.close()
+
+        os.replace(staging, self._blobs / blob.digest.removeprefix("sha256:"))
+
+        return Layer(Descriptor(MEDIA_TYPE_LAYER, blob.digest, blob.size), diff.digest)
+
+    def write_image(
+        self,
+        layers: Iterable[Layer],
+        config: Mapping[str, Any],
+        annotations: Mapping[str, str] | None = None,
+    ) -> Descriptor:
+        """
+        Write the configuration and the manifest of an image made of the given
+        layers, and reference it from the index of the layout.
+        """
+        layers = list(layers)
+        config_descriptor = self.write_blob(
+            _dumps(
+                {
+                    **config,
+                    "rootfs": {
+                        "type": "layers",
+                        "diff_ids": [layer.diff_id for layer in layers],
+                    },
+                }
+            ),
+            MEDIA_TYPE_CONFIG,
+        )
+        manifest = self.write_blob(
+            _dumps(
+                {
+                    "schemaVersion": 2,
+                    "mediaType": MEDIA_TYPE_MANIFEST,
+                    "config": config_descriptor.as_dict(),
+                    "layers": [layer.descriptor.as_dict() for layer in layers],
+                }
+            ),
+            MEDIA_TYPE_MANIFEST,
+        )
+
+        (self._path / "oci-layout").write_bytes(_dumps({"imageLayoutVersion": "1.0.0"}))
+        (self._path / "index.json").write_bytes(
+            _dumps(
+                {
+                    "schemaVersion": 2,
+                    "mediaType": MEDIA_TYPE_INDEX,
+                    "manifests": [
+                        {**manifest.as_dict(), "annotations": dict(annotations or {})}
+                    ],
+                }
+            )
+        )
+
+        return manifest
+
+
+def oci_architecture(platform: str | None = None) -> str:
+    """
+    Return the OCI architecture of the given platform tag,
+    or of the running system if none is given.
+    """
+    if platform is None:
+        import platform as platform_module
+
+        machine = platform_module.machine().lower()
+    else:
+        from poetry_plugin_bundle.utils.platforms import PlatformTagParseResult
+
+        machine = PlatformTagParseResult.parse(platform).arch
+
+    return ARCHITECTURES.get(machine, machine)
+
+
+def _dumps(data: Mapping[str, Any]) -> bytes:
+    return json.dumps(data, sort_keys=True, separators=(",", ":")).encode()
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import functools
+import operator
+import sys
+
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
+from typing import SupportsIndex
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+
     from packaging.tags import Tag
     from poetry.utils.env import Env
 
@@ -37,10 +45,98 @@ class PlatformTagParseResult:
         )
 
 
+@dataclass(frozen=True)
+class TagIndex:
+    """
+    The tags supported by an environment, most preferred first,
+    along with their set and the priority of every tag.
+    """
+
+    tags: tuple[Tag, ...]
+    tag_set: frozenset[Tag]
+    priorities: Mapping[Tag, int]
+
+    @staticmethod
+    def from_tags(tags: Iterable[Tag]) -> TagIndex:
+        tags = tuple(tags)
+        priorities: dict[Tag, int] = {}
+        for priority, tag in enumerate(tags):
+            # Lists return the index of the first occurrence of a value
+            priorities.setdefault(tag, priority)
+
+        return TagIndex(
+            tags=tags,
+            tag_set=frozenset(priorities),
+            priorities=priorities,
+        )
+
+
+class IndexedTags(list["Tag"]):
+    """
+    A list of supported tags looking tags up in their index, which makes
+    the membership tests and index lookups done by Poetry to select
+    and rank wheels constant time instead of linear.
+
+    The list must not be modified.
+    """
+
+    def __init__(self, index: TagIndex) -> None:
+        super().__init__(index.tags)
+
+        self._priorities = index.priorities
+
+    def __contains__(self, tag: object) -> bool:
+        return tag in self._priorities
+
+    def index(
+        self, tag: Tag, start: SupportsIndex = 0, stop: SupportsIndex = sys.maxsize
+    ) -> int:
+        priority = self._priorities.get(tag)
+        if priority is None or not (
+            operator.index(start) <= priority < operator.index(stop)
+        ):
+            # Let the list raise or handle negative bounds
+            return super().index(tag, start, stop)
+
+        return priority
+
+
+def constrain_env_platform(env: Env, platform: str) -> None:
+    """
+    Set the argument environment's supported tags
+    based on the given platform override.
+    """
+    index = supported_tag_index(platform, env)
+    env._supported_tags = IndexedTags(index)
+    env._supported_tags_set = set(index.tag_set)
+
+
 def create_supported_tags(platform: str, env: Env) -> list[Tag]:
     """
     Given a platform specifier string, generate a list of compatible tags
     for the argument environment's interpreter.
+    """
+    return list(supported_tag_index(platform, env).tags)
+
+
+def supported_tag_index(platform: str, env: Env) -> TagIndex:
+    """
+    Return the index of the tags compatible with the given platform
+    for the argument environment's interpreter.
+
+    Indexes are computed once per platform, interpreter and Python version.
+    """
+    return _supported_tag_index(
+        platform, env.python_implementation.lower(), tuple(env.version_info[:2])
+    )
+
+
+@functools.cache
+def _supported_tag_index(
+    platform: str, python_implementation: str, python_version: tuple[int, ...]
+) -> TagIndex:
+    """
+    Generate the compatible tags, most preferred first.
 
     Refer to:
         https://packaging.python.org/en/latest/specifications/platform-compatibility-tags/#platform-tag
@@ -60,8 +156,6 @@ def create_supported_tags(platform: str, env: Env) -> list[Tag]:
     else:
         raise NotImplementedError(f"Platform {platform} not supported")
 
-    python_implementation = env.python_implementation.lower()
-    python_version = env.version_info[:2]
     interpreter_name = INTERPRETER_SHORT_NAMES.get(
         python_implementation, python_implementation
     )
@@ -87,7 +181,7 @@ def create_supported_tags(platform: str, env: Env) -> list[Tag]:
         )
     )
 
-    return tags
+    return TagIndex.from_tags(tags)
 
 
 def create_supported_manylinux_platforms(platform: str) -> list[str]:
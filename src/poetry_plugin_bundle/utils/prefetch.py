@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import functools
+
+from concurrent.futures import wait
+from typing import TYPE_CHECKING
+
+from poetry.installation.operations.install import Install
+from poetry.installation.operations.update import Update
+
+from poetry_plugin_bundle.utils.report import BundleReport
+from poetry_plugin_bundle.utils.report import ReportingExecutor
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from packaging.utils import NormalizedName
+    from poetry.core.packages.package import Package
+    from poetry.core.packages.utils.link import Link
+    from poetry.installation.operations.operation import Operation
+    from poetry.packages.locker import Locker
+    from poetry.poetry import Poetry
+    from poetry.utils.env import Env
+
+    from poetry_plugin_bundle.utils.wheelhouse import Wheelhouse
+
+
+class PrefetchExecutor(ReportingExecutor):
+    """
+    An executor downloading the archives of the packages to install
+    into the artifact cache, without installing anything.
+
+    Once prefetched, archives are picked up from the artifact cache
+    by the executor actually installing the packages. Archives found
+    in the wheelhouse of the executor are not downloaded.
+    """
+
+    def execute(self, operations: list[Operation]) -> int:
+        tasks = [
+            self._executor.submit(self._prefetch, operation)
+            for operation in operations
+            if isinstance(operation, (Install, Update)) and not operation.skipped
+        ]
+        wait(tasks)
+
+        for task in tasks:
+            task.result()
+
+        return 0
+
+    def _prefetch(self, operation: Install | Update) -> None:
+        package = operation.package
+        if (
+            self._wheelhouse is not None
+            and self._wheelhouse.archive_for(package, self._env) is not None
+        ):
+            return
+
+        link = self._link_for(package)
+        if link is None:
+            return
+
+        self._record_artifact(link)
+        with self._report.span(
+            f"download {package.pretty_name}", "download", url=link.url
+        ):
+            self._artifact_cache.get_cached_archive_for_link(
+                link,
+                strict=True,
+                download_func=functools.partial(self._download_archive, operation),
+            )
+
+    def _link_for(self, package: Package) -> Link | None:
+        """
+        Return the link of the archive to download for package, if any.
+        """
+        from poetry.core.packages.utils.link import Link
+
+        if package.source_type == "url":
+            assert package.source_url is not None
+            return Link(package.source_url)
+
+        if package.source_type in {None, "legacy"}:
+            return self._chooser.choose_for(package)
+
+        # Git, file and directory dependencies are not downloaded
+        return None
+
+
+def prefetch_artifacts(
+    poetry: Poetry,
+    env: Env,
+    locker: Locker,
+    activated_groups: Iterable[NormalizedName] | None = None,
+    report: BundleReport | None = None,
+    executor: PrefetchExecutor | None = None,
+    wheelhouse: Wheelhouse | None = None,
+) -> None:
+    """
+    Download the archives of the locked packages that would be installed
+    into an empty environment matching env, leaving out the ones found
+    in the given wheelhouse.
+    """
+    from cleo.io.null_io import NullIO
+    from poetry.installation.installer import Installer
+    from poetry.repositories.installed_repository import InstalledRepository
+
+    if executor is None:
+        executor = PrefetchExecutor(
+            env,
+            poetry.pool,
+            poetry.config,
+            NullIO(),
+            report=report or BundleReport(),
+            wheelhouse=wheelhouse,
+        )
+    installer = Installer(
+        NullIO(),
+        env,
+        poetry.package,
+        locker,
+        poetry.pool,
+        poetry.config,
+        installed=InstalledRepository(),
+        executor=executor,
+    )
+    if activated_groups is not None:
+        installer.only_groups(activated_groups)
+
+    installer.run()
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import uuid
+
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+    from collections.abc import Iterable
+
+
+PRUNE_RULES = ("tests", "docs", "stubs", "sources", "caches", "bytecode")
+
+# Directories removed along with their whole content by each rule
+PRUNED_DIRECTORIES = {
+    "tests": {"tests", "test"},
+    "docs": {"docs", "doc", "examples"},
+    "caches": {".pytest_cache", ".mypy_cache", ".ruff_cache", ".hypothesis"},
+}
+
+# Suffixes of the files removed by each rule
+PRUNED_SUFFIXES = {
+    "docs": {".md", ".rst"},
+    "stubs": {".pyi"},
+    "sources": {".pyx", ".pxd", ".pxi", ".c", ".cc", ".cpp", ".h", ".hpp"},
+}
+
+PRUNED_NAMES = {
+    "tests": {"conftest.py"},
+    "stubs": {"py.typed"},
+    "caches": {".DS_Store"},
+}
+
+# Documents which must be kept along with the code they cover
+LEGAL_DOCUMENTS = ("LICENSE", "LICENCE", "COPYING", "NOTICE", "AUTHORS")
+
+
+@dataclass
+class PruneResult:
+    size_before: int = 0
+    size_after: int = 0
+    # Number of files and bytes removed by each rule
+    removed: dict[str, tuple[int, int]] = field(default_factory=dict)
+    stripped: int = 0
+    strip_unavailable: bool = False
+
+    @property
+    def files(self) -> int:
+        return sum(files for files, _ in self.removed.values())
+
+
+def prune_env(
+    path: Path,
+    site_packages: Iterable[Path],
+    rules: Collection[str],
+    optimization_levels: Collection[int] = (0,),
+    strip: bool = False,
+    packages: Collection[str] = (),
+) -> PruneResult:
+    """
+    Remove the files of the distributions installed into site-packages which
+    are not needed at runtime according to the given rules, and optionally
+    strip the debug symbols of ELF shared objects.
+
+    Distribution metadata is kept, but the removed files are dropped from
+    the RECORD of their distributions. Bytecode files are removed for the
+    optimization levels other than the given ones.
+
+    Directories which can be imported, i.e. the top-level packages of the
+    distributions and the subpackages with an __init__.py file, may be used
+    at runtime and are only removed when their dotted name, e.g. foo.tests,
+    is part of the given packages.
+    """
+    from poetry_plugin_bundle.utils.files import directory_size
+    from poetry_plugin_bundle.utils.files import update_records
+
+    result = PruneResult(size_before=directory_size(path))
+
+    directories = sorted(set(site_packages))
+    removed: set[Path] = set()
+    for directory in directories:
+        removed.update(
+            _prune_directory(directory, rules, optimization_levels, packages, result)
+        )
+        if removed:
+            update_records(directory, dict.fromkeys(removed))
+
+    if strip:
+        _strip_shared_objects(directories, result)
+
+    result.size_after = directory_size(path)
+
+    return result
+
+
+def _prune_directory(
+    site_packages: Path,
+    rules: Collection[str],
+    optimization_levels: Collection[int],
+    packages: Collection[str],
+    result: PruneResult,
+) -> list[Path]:
+    top_level = _top_level_packages(site_packages)
+    removed = []
+    for root, dirs, files in os.walk(site_packages, topdown=True):
+        if root == str(site_packages):
+            # Distribution metadata is never pruned
+            dirs[:] = [name for name in dirs if not name.endswith(".dist-info")]
+
+        for name in list(dirs):
+            rule = _directory_rule(name, rules)
+            if rule is None:
+                continue
+
+            directory = Path(root, name)
+            package = ".".join(directory.relative_to(site_packages).parts)
+            is_package = (
+                package in top_level or directory.joinpath("__init__.py").exists()
+            )
+            if is_package and package not in packages:
+                continue
+
+            dirs.remove(name)
+            files_ = [
+                Path(parent, file)
+                for parent, _, names in os.walk(directory)
+                for file in names
+            ]
+            _record(result, rule, files_)
+            shutil.rmtree(directory)
+            removed.extend(files_)
+
+        for name in files:
+            file = Path(root, name)
+            rule = _file_rule(file, rules, optimization_levels)
+            if rule is None:
+                continue
+
+            _record(result, rule, [file])
+            file.unlink()
+            removed.append(file)
+
+    return removed
+
+
+def _top_level_packages(site_packages: Path) -> set[str]:
+    """
+    Return the names of the top-level import packages of the distributions
+    installed into site-packages, read from their top_level.txt file or,
+    failing that, from their RECORD.
+    """
+    from importlib.metadata import distributions
+
+    packages: set[str] = set()
+    for distribution in distributions(path=[str(site_packages)]):
+        top_level = distribution.read_text("top_level.txt")
+        if top_level is not None:
+            packages.update(name.strip() for name in top_level.splitlines())
+            continue
+
+        for file in distribution.files or []:
+            if len(file.parts) > 1 and not file.parts[0].endswith(
+                (".dist-info", ".data", "..")
+            ):
+                packages.add(file.parts[0])
+
+    packages.discard("")
+
+    return packages
+
+
+def _directory_rule(name: str, rules: Collection[str]) -> str | None:
+    for rule, names in PRUNED_DIRECTORIES.items():
+        if rule in rules and name in names:
+            return rule
+
+    return None
+
+
+def _file_rule(
+    file: Path, rules: Collection[str], optimization_levels: Collection[int]
+) -> str | None:
+    if (
+        "bytecode" in rules
+        and file.suffix == ".pyc"
+        and file.parent.name == "__pycache__"
+    ):
+        # e.g. module.cpython-312.opt-1.pyc
+        _, _, optimization = file.stem.rpartition(".")
+        level = int(optimization[4:] or 0) if optimization.startswith("opt-") else 0
+        if level not in optimization_levels:
+            return "bytecode"
+
+    for rule, names in PRUNED_NAMES.items():
+        if rule in rules and file.name in names:
+            return rule
+
+    for rule, suffixes in PRUNED_SUFFIXES.items():
+        if rule in rules and file.suffix in suffixes:
+            if rule == "docs" and file.name.upper().startswith(LEGAL_DOCUMENTS):
+                continue
+
+            return rule
+
+    return None
+
+
+def _record(result: PruneResult, rule: str, files: list[Path]) -> None:
+    count, size = result.removed.get(rule, (0, 0))
+    for file in files:
+        if not file.is_symlink():
+            size += file.stat().st_size
+
+    result.removed[rule] = (count + len(files), size)
+
+
+def _strip_shared_objects(directories: list[Path], result: PruneResult) -> None:
+    strip = shutil.which("strip")
+    if strip is None:
+        result.strip_unavailable = True
+        return
+
+    for directory in directories:
+        for root, _, files in os.walk(directory):
+            for name in files:
+                file = Path(root, name)
+                if ".so" not in name or file.is_symlink() or not _is_elf(file):
+                    continue
+
+                # Strip into a new file rather than in place
+                # since the shared object may be linked elsewhere.
+                temporary = file.with_name(f".{name}.{uuid.uuid4().hex}")
+                try:
+                    subprocess.run(
+                        [strip, "--strip-debug", "-o", str(temporary), str(file)],
+                        capture_output=True,
+                        check=True,
+                    )
+                except subprocess.CalledProcessError:
+                    # e.g. a shared object for another architecture
+                    temporary.unlink(missing_ok=True)
+                    continue
+
+                os.chmod(temporary, file.stat().st_mode)
+                os.replace(temporary, file)
+                result.stripped += 1
+
+
+def _is_elf(file: Path) -> bool:
+    with file.open("rb") as f:
+        return f.read(4) == b"\x7fELF"
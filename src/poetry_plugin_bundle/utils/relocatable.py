@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import os
+import re
+import shlex
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+# Runs the interpreter next to the script, wherever the environment lives:
+# /bin/sh executes the second line, which Python reads as a string.
+RELOCATABLE_SHEBANG = """\
+#!/bin/sh
+'''exec' "$(dirname -- "$(realpath -- "$0")")"/{name} "$0" "$@"
+' '''
+"""
+
+# Script shebangs written by installers, either a plain one or the /bin/sh
+# trampoline used for interpreter paths which are too long or hold spaces
+SHEBANG = re.compile(rb"\A#!(?P<executable>[^ \t\r\n]+)[^\n]*\n")
+SH_SHEBANG = re.compile(
+    rb"\A#!/bin/sh\n'''exec' (?P<executable>.+?) \"\$0\" \"\$@\"\n' '''\n?"
+)
+
+# Expressions evaluating to the directory of the environment in the activation
+# scripts of the shells able to locate the script they are sourcing
+ACTIVATION_SCRIPT_VENV_DIRS = {
+    "activate": '"$(cd -- "$(dirname -- "${BASH_SOURCE[0]:-$0}")/.." && pwd)"',
+    "activate.fish": "(builtin realpath (dirname (status filename))/..)",
+}
+
+
+def make_relocatable(venv: Path) -> list[Path]:
+    """
+    Rewrite the files of a virtual environment embedding its absolute path,
+    i.e. its configuration file, activation scripts and script shebangs, so
+    that it keeps working once moved or copied to another path.
+
+    Activation scripts of shells unable to locate themselves are removed.
+    Returns the remaining files which still embed the path of the environment.
+    """
+    prefixes = sorted({str(venv.resolve()), str(venv.absolute())}, key=len)[::-1]
+
+    _rewrite_config(venv / "pyvenv.cfg", prefixes)
+
+    remaining = []
+    bin_dir = venv / ("Scripts" if os.name == "nt" else "bin")
+    for file in sorted(bin_dir.iterdir()) if bin_dir.is_dir() else []:
+        if file.is_symlink() or not file.is_file():
+            continue
+
+        content = file.read_bytes()
+        # Windows launchers are binary files which cannot be rewritten
+        if b"\0" in content[:8192] or not _embeds(content, prefixes):
+            continue
+
+        if file.name in ACTIVATION_SCRIPT_VENV_DIRS:
+            venv_dir = ACTIVATION_SCRIPT_VENV_DIRS[file.name].encode()
+            for prefix in prefixes:
+                for quote in (b"'", b'"', b""):
+                    content = content.replace(quote + prefix.encode() + quote, venv_dir)
+        elif file.name.startswith(("activate", "deactivate")):
+            file.unlink()
+            continue
+        else:
+            content = _relocate_shebang(content, bin_dir, prefixes)
+
+        _replace_file(file, content)
+        if _embeds(content, prefixes):
+            remaining.append(file)
+
+    # Path configuration files, e.g. of editable installs
+    for site_packages in venv.glob("lib*/python*/site-packages"):
+        remaining.extend(
+            file
+            for file in sorted(site_packages.glob("*.pth"))
+            if _embeds(file.read_bytes(), prefixes)
+        )
+
+    return remaining
+
+
+def _rewrite_config(config: Path, prefixes: list[str]) -> None:
+    """
+    Drop the settings of pyvenv.cfg referring to the path of the environment,
+    i.e. the command which created it, and flag the environment as relocatable.
+    """
+    if not config.exists():
+        return
+
+    lines = [
+        line
+        for line in config.read_text(encoding="utf-8").splitlines()
+        if not any(prefix in line for prefix in prefixes)
+        and line.partition("=")[0].strip() != "relocatable"
+    ]
+    lines.append("relocatable = true")
+
+    _replace_file(config, "".join(f"{line}\n" for line in lines).encode())
+
+
+def _relocate_shebang(content: bytes, bin_dir: Path, prefixes: list[str]) -> bytes:
+    for pattern in (SH_SHEBANG, SHEBANG):
+        match = pattern.match(content)
+        if match is None:
+            continue
+
+        executable = match.group("executable").decode()
+        if pattern is SH_SHEBANG:
+            executable = shlex.split(executable)[0]
+
+        directory, name = os.path.split(executable)
+        if not any(
+            directory == os.path.join(prefix, bin_dir.name) for prefix in prefixes
+        ):
+            return content
+
+        shebang = RELOCATABLE_SHEBANG.format(name=shlex.quote(name)).encode()
+
+        return shebang + content[match.end() :]
+
+    return content
+
+
+def _embeds(content: bytes, prefixes: list[str]) -> bool:
+    return any(prefix.encode() in content for prefix in prefixes)
+
+
+def _replace_file(file: Path, content: bytes) -> None:
+    # Write a new file rather than modifying it in place
+    # so that a cloned inode is never shared with its source.
+    mode = file.stat().st_mode
+    file.unlink()
+    file.write_bytes(content)
+    os.chmod(file, mode)
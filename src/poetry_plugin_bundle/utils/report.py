@@ -0,0 +1,454 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import TypeVar
+
+from poetry.installation.executor import Executor
+from poetry.installation.operations.install import Install
+from poetry.installation.operations.update import Update
+from poetry.installation.wheel_installer import WheelInstaller
+
+from poetry_plugin_bundle.utils.files import format_size
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from poetry.core.packages.package import Package
+    from poetry.core.packages.utils.link import Link
+    from poetry.installation.operations.operation import Operation
+    from poetry.utils.env import Env
+
+    from poetry_plugin_bundle.utils.prune import PruneResult
+    from poetry_plugin_bundle.utils.wheelhouse import Wheelhouse
+
+
+T = TypeVar("T")
+
+REPORT_FORMATS = ("text", "json")
+
+
+class BundleReport:
+    """
+    Timings and statistics of a bundle run.
+
+    Phases may run concurrently, so the sum of their durations
+    can exceed the total duration of the run.
+
+    When tracing, spans are also recorded for every phase and every step of the
+    installation of each package, along with the thread running them, and can be
+    exported in the Trace Event Format read by Perfetto and chrome://tracing.
+    """
+
+    def __init__(self, trace: bool = False) -> None:
+        self._lock = threading.Lock()
+        self._trace = trace
+        self._events: list[dict[str, Any]] = []
+        self._threads: dict[int, str] = {}
+        self._start = time.perf_counter()
+        self._duration: float | None = None
+        self._phases: dict[str, float] = {}
+        self._packages: dict[str, float] = {}
+        self._downloads = 0
+        self._downloaded_bytes = 0
+        # Whether the artifact of each link was found in the artifact cache
+        # the first time it was looked up
+        self._artifacts: dict[str, bool] = {}
+        self._files_written = 0
+        self._bytes_written = 0
+        self._pruned: PruneResult | None = None
+
+    def timed(self, name: str, func: Callable[[], T]) -> Callable[[], T]:
+        """
+        Wrap func so that its duration is recorded as the one of the given phase.
+        """
+
+        def run() -> T:
+            start = time.perf_counter()
+            try:
+                with self.span(name, "phase"):
+                    return func()
+            finally:
+                self.record_phase(name, time.perf_counter() - start)
+
+        return run
+
+    @contextmanager
+    def span(self, name: str, category: str, **args: str) -> Iterator[None]:
+        """
+        Record a span of the trace covering the body of the with statement.
+        """
+        if not self._trace:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            thread = threading.current_thread()
+            with self._lock:
+                self._threads.setdefault(thread.ident or 0, thread.name)
+                self._events.append(
+                    {
+                        "name": name,
+                        "cat": category,
+                        "ph": "X",
+                        "ts": round((start - self._start) * 1e6),
+                        "dur": round((end - start) * 1e6),
+                        "pid": os.getpid(),
+                        "tid": thread.ident or 0,
+                        "args": args,
+                    }
+                )
+
+    def record_phase(self, name: str, duration: float) -> None:
+        with self._lock:
+            self._phases[name] = self._phases.get(name, 0.0) + duration
+
+    def record_package(self, name: str, duration: float) -> None:
+        with self._lock:
+            self._packages[name] = self._packages.get(name, 0.0) + duration
+
+    def record_download(self, size: int) -> None:
+        with self._lock:
+            self._downloads += 1
+            self._downloaded_bytes += size
+
+    def record_artifact(self, url: str, cached: bool) -> None:
+        with self._lock:
+            self._artifacts.setdefault(url, cached)
+
+    def record_written(self, files: int, size: int) -> None:
+        with self._lock:
+            self._files_written += files
+            self._bytes_written += size
+
+    def record_prune(self, result: PruneResult) -> None:
+        with self._lock:
+            self._pruned = result
+
+    def finish(self) -> None:
+        self._duration = time.perf_counter() - self._start
+
+    def as_dict(self) -> dict[str, Any]:
+        hits = sum(self._artifacts.values())
+
+        data: dict[str, Any] = {
+            "duration": round(self._duration or 0.0, 3),
+            "phases": {
+                name: round(duration, 3) for name, duration in self._phases.items()
+            },
+            "packages": {
+                name: round(duration, 3)
+                for name, duration in sorted(self._packages.items())
+            },
+            "downloads": {
+                "count": self._downloads,
+                "bytes": self._downloaded_bytes,
+            },
+            "artifact_cache": {
+                "hits": hits,
+                "misses": len(self._artifacts) - hits,
+            },
+            "written": {
+                "files": self._files_written,
+                "bytes": self._bytes_written,
+            },
+        }
+        if self._pruned is not None:
+            data["pruned"] = {
+                "size_before": self._pruned.size_before,
+                "size_after": self._pruned.size_after,
+                "rules": {
+                    rule: {"files": files, "bytes": size}
+                    for rule, (files, size) in self._pruned.removed.items()
+                },
+                "stripped": self._pruned.stripped,
+            }
+
+        return data
+
+    def trace_events(self) -> list[dict[str, Any]]:
+        """
+        Return the spans of the trace, preceded by the names of their threads.
+        """
+        pid = os.getpid()
+        with self._lock:
+            threads = [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": name},
+                }
+                for tid, name in self._threads.items()
+            ]
+
+            return threads + sorted(self._events, key=lambda event: event["ts"])
+
+    def write_trace(self, path: Path) -> None:
+        import json
+
+        path.write_text(
+            json.dumps({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}),
+            encoding="utf-8",
+        )
+
+    def to_json(self) -> str:
+        import json
+
+        return json.dumps(self.as_dict(), indent=2)
+
+    def to_text(self, slowest: int = 5) -> list[str]:
+        """
+        Summarize the report in lines meant to be read by humans.
+        """
+        data = self.as_dict()
+
+        lines = [f"Bundled in <b>{data['duration']:.2f}s</b>"]
+        if data["phases"]:
+            lines.append(
+                "Phases: "
+                + ", ".join(
+                    f"{name} <b>{duration:.2f}s</b>"
+                    for name, duration in data["phases"].items()
+                )
+            )
+        if data["packages"]:
+            packages = sorted(
+                data["packages"].items(), key=lambda item: item[1], reverse=True
+            )
+            lines.append(
+                "Slowest packages: "
+                + ", ".join(
+                    f"<c1>{name}</c1> <b>{duration:.2f}s</b>"
+                    for name, duration in packages[:slowest]
+                )
+            )
+        lines.append(
+            f"Downloaded {data['downloads']['count']} archives"
+            f" ({format_size(data['downloads']['bytes'])}),"
+            f" artifact cache: {data['artifact_cache']['hits']} hits,"
+            f" {data['artifact_cache']['misses']} misses"
+        )
+        lines.append(
+            f"Wrote {data['written']['files']} files"
+            f" ({format_size(data['written']['bytes'])})"
+        )
+        if "pruned" in data:
+            pruned = data["pruned"]
+            lines.append(
+                f"Pruned from {format_size(pruned['size_before'])}"
+                f" to {format_size(pruned['size_after'])}: "
+                + ", ".join(
+                    f"{rule} {removed['files']} files ({format_size(removed['bytes'])})"
+                    for rule, removed in pruned["rules"].items()
+                )
+                + f", {pruned['stripped']} shared objects stripped"
+            )
+
+        return lines
+
+
+class ReportingExecutor(Executor):
+    """
+    An executor recording the duration of the installation of each package,
+    the archives it downloads and its use of the artifact cache.
+
+    The spans of the operations, downloads, builds and installations
+    of wheels are traced on the worker thread running them.
+
+    Archives found in the given wheelhouse are installed from it rather than
+    downloaded, and must all be found there when offline.
+
+    Wheels are installed by Poetry's installer, or by the bundle installer.
+    When deduplicating, the files hardlinked to the shared file store
+    are never modified in place.
+
+    The locked hashes of the archives installed are recorded once verified.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        report: BundleReport,
+        wheelhouse: Wheelhouse | None = None,
+        offline: bool = False,
+        installer: str = "poetry",
+        dedupe: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+
+        self._report = report
+        self._wheelhouse = wheelhouse
+        self._offline = offline
+        self._archive_hashes: dict[str, str] = {}
+        if installer == "bundle":
+            from poetry_plugin_bundle.utils.wheel_installer import BundleWheelInstaller
+
+            self._wheel_installer = BundleWheelInstaller(
+                self._env, report, unlink_shared_files=dedupe
+            )
+        else:
+            self._wheel_installer = ReportingWheelInstaller(
+                self._env, report, unlink_shared_files=dedupe
+            )
+
+    @property
+    def archive_hashes(self) -> dict[str, str]:
+        """
+        The hashes of the archives installed, by name of their package.
+        """
+        return self._archive_hashes
+
+    def _execute_operation(self, operation: Operation) -> None:
+        if not isinstance(operation, (Install, Update)) or operation.skipped:
+            super()._execute_operation(operation)
+            return
+
+        name = operation.package.pretty_name
+        start = time.perf_counter()
+        try:
+            with self._report.span(name, "package", job=operation.job_type):
+                super()._execute_operation(operation)
+        finally:
+            self._report.record_package(name, time.perf_counter() - start)
+
+    def _prepare_archive(
+        self, operation: Install | Update, *, output_dir: Path | None = None
+    ) -> Path:
+        with self._report.span(f"build {operation.package.pretty_name}", "build"):
+            return super()._prepare_archive(operation, output_dir=output_dir)
+
+    def _prepare_git_archive(self, operation: Install | Update) -> Path:
+        with self._report.span(f"build {operation.package.pretty_name}", "build"):
+            return super()._prepare_git_archive(operation)
+
+    def _download(self, operation: Install | Update) -> Path:
+        # The archive is looked up in the wheelhouse before choosing a link,
+        # which requires the repository of the package.
+        archive = self._wheelhouse_archive(operation)
+        if archive is not None:
+            return archive
+
+        return super()._download(operation)
+
+    def _download_link(self, operation: Install | Update, link: Link) -> Path:
+        archive = self._wheelhouse_archive(operation)
+        if archive is not None:
+            return archive
+
+        self._record_artifact(link)
+
+        with self._report.span(
+            f"download {operation.package.pretty_name}", "download", url=link.url
+        ):
+            return super()._download_link(operation, link)
+
+    def _download_archive(
+        self, operation: Install | Update, url: str, dest: Path
+    ) -> None:
+        super()._download_archive(operation, url, dest)
+
+        self._report.record_download(dest.stat().st_size)
+
+    def _populate_hashes_dict(self, archive: Path, package: Package) -> None:
+        super()._populate_hashes_dict(archive, package)
+
+        # The archive was verified against the hashes locked for its file,
+        # which all identify it
+        hashes = sorted(
+            file["hash"] for file in package.files if file["file"] == archive.name
+        )
+        if hashes:
+            self._archive_hashes[package.name] = hashes[0]
+
+    def _record_artifact(self, link: Link) -> None:
+        cached = self._artifact_cache.get_cached_archive_for_link(link, strict=True)
+        self._report.record_artifact(link.url, cached is not None)
+
+    def _wheelhouse_archive(self, operation: Install | Update) -> Path | None:
+        """
+        Return the archive of the wheelhouse to install the package from,
+        verified against the lock file and built into a wheel if needed.
+        """
+        if self._wheelhouse is None:
+            return None
+
+        package = operation.package
+        archive = self._wheelhouse.archive_for(package, self._env)
+        if archive is None:
+            if self._offline:
+                raise RuntimeError(
+                    f"No archive of {package.pretty_name} ({package.pretty_version})"
+                    f" supported by the environment was found in the wheelhouse"
+                    f" {self._wheelhouse.path}, and nothing is downloaded offline"
+                )
+
+            return None
+
+        self._report.record_artifact(archive.as_uri(), True)
+        self._populate_hashes_dict(archive, package)
+
+        if archive.suffix != ".whl":
+            options: dict[str, Any] = {
+                "config_settings": self._build_config_settings.get(package.name)
+            }
+            # Build constraints are not supported by older versions of Poetry
+            if hasattr(self, "_build_constraints"):
+                options["build_constraints"] = self._build_constraints.get(package.name)
+
+            with self._report.span(f"build {package.pretty_name}", "build"):
+                archive = self._chef.prepare(archive, **options)
+
+        return archive
+
+
+class ReportingWheelInstaller(WheelInstaller):
+    """
+    A wheel installer tracing the unpacking and the installation of each wheel,
+    including the compilation of its bytecode if enabled.
+
+    If unlink_shared_files is set, e.g. for deduplicated bundles, files about
+    to be overwritten which are hardlinked elsewhere, e.g. to the shared file
+    store, are removed first since the installer writes them in place.
+    """
+
+    def __init__(
+        self, env: Env, report: BundleReport, unlink_shared_files: bool = False
+    ) -> None:
+        super().__init__(env)
+
+        self._report = report
+        self._unlinks_shared_files = unlink_shared_files
+
+    def install(self, wheel: Path) -> None:
+        with self._report.span("install", "install", wheel=wheel.name):
+            if self._unlinks_shared_files:
+                self._unlink_shared_files(wheel)
+            super().install(wheel)
+
+    def _unlink_shared_files(self, wheel: Path) -> None:
+        from poetry_plugin_bundle.utils.wheels import site_packages_members
+
+        roots = {self._env.purelib, self._env.platlib}
+        for member in site_packages_members(wheel):
+            for root in roots:
+                target = root / member.path
+                try:
+                    if target.lstat().st_nlink > 1:
+                        target.unlink()
+                except FileNotFoundError:
+                    continue
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from typing import TYPE_CHECKING
+from typing import Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
+
+class PhaseError(Exception):
+    """
+    Raised by a phase which could not run because a phase it depends on failed.
+    """
+
+
+class PhaseScheduler:
+    """
+    Run the phases of a bundle concurrently on a thread pool.
+
+    Each phase starts as soon as the phases it depends on have completed,
+    so that the total duration is bound by the longest chain of dependent
+    phases rather than by the sum of all of them. Every phase gets its own
+    worker, which guarantees that waiting on dependencies cannot deadlock.
+    """
+
+    def __init__(self, max_phases: int) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_phases, thread_name_prefix="bundle-phase"
+        )
+        self._max_phases = max_phases
+        self._phases: dict[str, Future[Any]] = {}
+
+    def add(
+        self, name: str, func: Callable[[], Any], after: Iterable[str] = ()
+    ) -> Future[Any]:
+        if len(self._phases) >= self._max_phases:
+            raise ValueError(f"Cannot schedule more than {self._max_phases} phases")
+
+        dependencies = [self._phases[dependency] for dependency in after]
+
+        def run() -> Any:
+            for dependency in dependencies:
+                if dependency.exception() is not None:
+                    raise PhaseError(f"Phase {name} skipped after a failed phase")
+
+            return func()
+
+        future = self._executor.submit(run)
+        self._phases[name] = future
+
+        return future
+
+    def result(self, name: str) -> Any:
+        return self._phases[name].result()
+
+    def join(self) -> None:
+        """
+        Wait for all phases and re-raise the error of the first failed phase,
+        in the order they were added.
+        """
+        wait(self._phases.values())
+
+        for future in self._phases.values():
+            error = future.exception()
+            if error is not None and not isinstance(error, PhaseError):
+                raise error
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
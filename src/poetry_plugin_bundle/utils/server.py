@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import hmac
+import json
+import socketserver
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import TYPE_CHECKING
+from typing import Any
+
+from poetry_plugin_bundle.utils.jobs import BundleJob
+from poetry_plugin_bundle.utils.jobs import ProjectCache
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+    from cleo.io.io import IO
+
+
+DEFAULT_PORT = 8751
+
+# Environment variable holding the token clients must send by default
+TOKEN_ENV_VAR = "POETRY_BUNDLE_SERVE_TOKEN"
+
+
+class BundleServer:
+    """
+    Run bundle jobs in a long-lived process, keeping the projects loaded
+    between jobs.
+
+    Jobs run one at a time, since they share the state of the projects.
+    """
+
+    def __init__(self, io: IO | None = None) -> None:
+        self._io = io
+        self._lock = threading.Lock()
+        self._projects = ProjectCache()
+        self._jobs = 0
+        self._start = time.monotonic()
+
+    def run(self, job: BundleJob) -> tuple[bool, str]:
+        """
+        Run a bundle job, returning whether it succeeded along with its output.
+        """
+        from cleo.io.buffered_io import BufferedIO
+
+        with self._lock:
+            start = time.perf_counter()
+            poetry, locker = self._projects.get(job.project)
+
+            io = BufferedIO()
+            success = job.bundler(poetry, locker).bundle(poetry, io)
+            self._jobs += 1
+
+            if self._io is not None:
+                self._io.write_line(
+                    f"Bundled <c1>{job.project}</c1> into <c2>{job.path}</c2>:"
+                    f" {'<info>succeeded</>' if success else '<error>failed</>'}"
+                    f" in <b>{time.perf_counter() - start:.2f}s</b>"
+                )
+
+            return success, io.fetch_output() + io.fetch_error()
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "jobs": self._jobs,
+            "uptime": round(time.monotonic() - self._start, 3),
+            "projects": [str(project) for project in self._projects.projects],
+        }
+
+
+class BundleRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serve a bundle server over HTTP:
+
+    - POST /bundle runs the bundle job described by the JSON body.
+    - GET /status describes the server.
+
+    Requests must send the token of the server, if any, as a bearer token.
+    Without a token, requests to a TCP server must be addressed to a loopback
+    host, so that web pages cannot reach the server by rebinding their domain.
+    """
+
+    bundle_server: BundleServer
+    token: str | None = None
+    check_host: bool = False
+
+    def do_GET(self) -> None:
+        if not self._authorize():
+            return
+
+        if self.path != "/status":
+            self._respond(404, {"error": f"Unknown path {self.path}"})
+            return
+
+        self._respond(200, self.bundle_server.status())
+
+    def do_POST(self) -> None:
+        if not self._authorize():
+            return
+
+        if self.path != "/bundle":
+            self._respond(404, {"error": f"Unknown path {self.path}"})
+            return
+
+        # Browsers send cross-origin requests with other content types
+        # without asking the server first
+        content_type = self.headers.get_content_type()
+        if content_type != "application/json":
+            self._respond(
+                415,
+                {
+                    "error": f"Invalid Content-Type {content_type},"
+                    " expected application/json"
+                },
+            )
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            data = json.loads(self.rfile.read(length) or b"null")
+            if not isinstance(data, dict):
+                raise TypeError("Invalid bundle job, expected a JSON object")
+
+            job = BundleJob.from_dict(data)
+            check_job_path(job)
+        except (TypeError, ValueError) as e:
+            self._respond(400, {"error": str(e)})
+            return
+
+        try:
+            success, output = self.bundle_server.run(job)
+        except Exception as e:  # noqa: BLE001
+            self._respond(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+
+        self._respond(200, {"success": success, "output": output})
+
+    def address_string(self) -> str:
+        # Clients of Unix sockets have no address
+        if isinstance(self.client_address, tuple):
+            return str(self.client_address[0])
+
+        return "local"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Jobs are reported by the bundle server
+        pass
+
+    def _authorize(self) -> bool:
+        """
+        Check that the request may be served, responding with an error otherwise.
+        """
+        from urllib.parse import urlsplit
+
+        if self.token is not None:
+            authorization = self.headers.get("Authorization", "")
+            if not hmac.compare_digest(
+                authorization.encode(), f"Bearer {self.token}".encode()
+            ):
+                self._respond(401, {"error": "Invalid or missing token"})
+                return False
+        elif self.check_host:
+            host = urlsplit(f"//{self.headers.get('Host', '')}").hostname or ""
+            if not is_loopback(host):
+                self._respond(403, {"error": f"Invalid host {host}"})
+                return False
+
+        return True
+
+    def _respond(self, status: int, data: Mapping[str, Any]) -> None:
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+def check_job_path(job: BundleJob) -> None:
+    """
+    Check that the bundle path of a job sent to the server is inside of its
+    project, since the bundle path is removed along with its content when cleared.
+    """
+    root = job.project.resolve()
+    path = job.path.resolve()
+    if path == root or not path.is_relative_to(root):
+        raise ValueError(
+            f"Invalid bundle job path {job.path}, expected a directory"
+            " inside of the project"
+        )
+
+
+def is_loopback(host: str) -> bool:
+    """
+    Return whether the given host name or address is a loopback one.
+    """
+    import ipaddress
+
+    if host == "localhost":
+        return True
+
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def make_server(
+    bundle_server: BundleServer,
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    socket_path: Path | None = None,
+    token: str | None = None,
+) -> socketserver.BaseServer:
+    """
+    Create an HTTP server for the bundle server, listening on the given
+    Unix socket if any, and on the given host and port otherwise.
+
+    Clients must send the given token, if any, which is required to listen
+    on a host other than a loopback one.
+    """
+    if socket_path is None and token is None and not is_loopback(host):
+        raise ValueError(
+            f"Refusing to listen on the non-loopback host {host} without a token"
+        )
+
+    handler = type(
+        "BundleRequestHandler",
+        (BundleRequestHandler,),
+        {
+            "bundle_server": bundle_server,
+            "token": token,
+            "check_host": socket_path is None,
+        },
+    )
+
+    if socket_path is not None:
+        # A stale socket is left behind by servers which did not shut down
+        if socket_path.is_socket():
+            socket_path.unlink()
+
+        return ThreadingUnixHTTPServer(str(socket_path), handler)
+
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+
+    return server
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import uuid
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from poetry_plugin_bundle.utils.files import clone_tree
+from poetry_plugin_bundle.utils.files import rewrite_prefix
+from poetry_plugin_bundle.utils.files import venv_path_dependent_files
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Mapping
+
+    from poetry.config.config import Config
+
+
+class VenvTemplateCache:
+    """
+    A cache of pristine virtual environments, as created by virtualenv
+    before anything is installed into them, keyed by the interpreter and
+    the options they were created with.
+
+    Cloning a template and rewriting its path-dependent files is much faster
+    than creating and seeding a new virtual environment.
+
+    The templates of interpreters which changed or no longer exist
+    are evicted when adding a template.
+    """
+
+    METADATA_FILE = "template.json"
+
+    def __init__(self, cache_dir: Path) -> None:
+        self._cache_dir = cache_dir
+
+    @classmethod
+    def from_config(cls, config: Config) -> VenvTemplateCache:
+        return cls(Path(config.get("cache-dir")).expanduser() / "bundle-venv-templates")
+
+    @property
+    def path(self) -> Path:
+        return self._cache_dir
+
+    @staticmethod
+    def key(
+        executable: Path,
+        flags: Mapping[str, str | bool],
+        prompt: str | None = None,
+    ) -> str:
+        """
+        Compute the key of the template of the virtual environments
+        created from executable with the given virtualenv options.
+        """
+        import sys
+
+        import virtualenv
+
+        from poetry_plugin_bundle.utils.fingerprint import Fingerprint
+        from poetry_plugin_bundle.utils.fingerprint import file_identity
+
+        return (
+            Fingerprint()
+            .update("platform", sys.platform)
+            .update("interpreter", file_identity(executable))
+            .update("virtualenv", virtualenv.__version__)
+            .update("flags", json.dumps(dict(flags), sort_keys=True))
+            .update("prompt", json.dumps(prompt))
+            .hexdigest()
+        )
+
+    def restore(self, key: str, target: Path) -> bool:
+        """
+        Clone the template identified by key at the target path, which must
+        not exist. Returns False on a cache miss.
+        """
+        directory = self._cache_dir / key
+        try:
+            metadata = json.loads(
+                (directory / self.METADATA_FILE).read_text(encoding="utf-8")
+            )
+        except (OSError, ValueError):
+            return False
+
+        target = target.resolve()
+        clone_tree(directory / "venv", target)
+        rewrite_prefix(
+            venv_path_dependent_files(target), Path(metadata["source"]), target
+        )
+
+        return True
+
+    def put(self, key: str, executable: Path, create: Callable[[Path], object]) -> None:
+        """
+        Create the template identified by key, created from executable,
+        by calling create with the path of the virtual environment to create.
+        """
+        from poetry_plugin_bundle.utils.fingerprint import file_identity
+
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Populate a temporary directory first and move it in place
+        # so that concurrent bundle runs never see a partial template.
+        staging = self._cache_dir / f".tmp-{uuid.uuid4().hex}"
+        try:
+            create(staging / "venv")
+            (staging / self.METADATA_FILE).write_text(
+                # virtualenv embeds the resolved path of the environment
+                json.dumps(
+                    {
+                        "source": str((staging / "venv").resolve()),
+                        "executable": str(executable),
+                        "interpreter": file_identity(executable),
+                    },
+                    indent=2,
+                ),
+                encoding="utf-8",
+            )
+            os.replace(staging, self._cache_dir / key)
+        except OSError:
+            # Another process stored the same template in the meantime.
+            if not (self._cache_dir / key).is_dir():
+                raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        for entry in self._cache_dir.iterdir():
+            if entry.name == key or entry.name.startswith("."):
+                continue
+
+            try:
+                metadata = json.loads(
+                    (entry / self.METADATA_FILE).read_text(encoding="utf-8")
+                )
+            except (OSError, ValueError):
+                continue
+
+            # Templates created before their interpreter was recorded are stale too
+            if metadata.get("interpreter") is None or (
+                file_identity(metadata["executable"]) != metadata["interpreter"]
+            ):
+                shutil.rmtree(entry, ignore_errors=True)
+
+    def clear(self) -> int:
+        """
+        Remove all the templates from the cache.
+        Returns the number of removed templates.
+        """
+        if not self._cache_dir.is_dir():
+            return 0
+
+        removed = 0
+        for entry in self._cache_dir.iterdir():
+            if entry.name.startswith("."):
+                continue
+
+            shutil.rmtree(entry, ignore_errors=True)
+            removed += 1
+
+        return removed
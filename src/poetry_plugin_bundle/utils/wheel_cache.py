@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import os
+import shutil
+import uuid
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from poetry.config.config import Config
+    from poetry.poetry import Poetry
+
+
+class WheelCache:
+    """
+    A cache of the wheels built for root projects,
+    keyed by a hash of their sources, metadata and build configuration.
+
+    Only the latest wheel of each project is kept.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self._cache_dir = cache_dir
+
+    @classmethod
+    def from_config(cls, config: Config) -> WheelCache:
+        return cls(Path(config.get("cache-dir")).expanduser() / "bundle-wheels")
+
+    @property
+    def path(self) -> Path:
+        return self._cache_dir
+
+    @staticmethod
+    def key(
+        poetry: Poetry, sources_hash: Callable[[], str] | None = None
+    ) -> str | None:
+        """
+        Compute the key of the wheel of the root project,
+        or None if the wheel cannot be cached.
+
+        The sources of the project are hashed by sources_hash if given,
+        e.g. to share their hash with the fingerprint of a bundle.
+        """
+        from poetry.core import __version__
+
+        from poetry_plugin_bundle.utils.fingerprint import Fingerprint
+        from poetry_plugin_bundle.utils.fingerprint import project_sources_hash
+
+        # Build scripts may generate files or depend on the interpreter,
+        # which are not covered by the hash of the sources.
+        if poetry.package.build_script:
+            return None
+
+        return (
+            Fingerprint()
+            .update("poetry-core", __version__)
+            .update("name", poetry.package.name)
+            .update("version", poetry.package.version.to_string())
+            .update(
+                "project",
+                sources_hash() if sources_hash else project_sources_hash(poetry),
+            )
+            .hexdigest()
+        )
+
+    def get(self, key: str) -> Path | None:
+        directory = self._cache_dir / key
+        if not directory.is_dir():
+            return None
+
+        return next(directory.glob("*.whl"), None)
+
+    def put(self, key: str, wheel: Path) -> Path:
+        """
+        Add the wheel of a project to the cache,
+        evicting the other wheels of the project.
+        """
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+        staging = self._cache_dir / f".tmp-{uuid.uuid4().hex}"
+        staging.mkdir()
+        shutil.copyfile(wheel, staging / wheel.name)
+
+        directory = self._cache_dir / key
+        try:
+            os.replace(staging, directory)
+        except OSError:
+            # Another process cached the same wheel in the meantime.
+            shutil.rmtree(staging, ignore_errors=True)
+
+        # Wheel names start with the normalized name of their distribution
+        distribution = wheel.name.partition("-")[0]
+        for entry in self._cache_dir.iterdir():
+            if entry.name == key or entry.name.startswith("."):
+                continue
+
+            if any(
+                other.name.partition("-")[0] == distribution
+                for other in entry.glob("*.whl")
+            ):
+                shutil.rmtree(entry, ignore_errors=True)
+
+        return directory / wheel.name
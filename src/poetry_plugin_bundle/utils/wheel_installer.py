@@ -0,0 +1,357 @@
+from __future__ import annotations
+
+import base64
+import csv
+import hashlib
+import io
+import os
+import posixpath
+import zipfile
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import cast
+
+from poetry_plugin_bundle.utils.report import ReportingWheelInstaller
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+    from typing import IO
+    from typing import BinaryIO
+
+
+INSTALLERS = ("poetry", "bundle")
+
+# Wheels with more files than this have them written by a pool of threads
+PARALLEL_FILES = 64
+
+# Files larger than this are copied in chunks of this size rather than at once
+CHUNK_SIZE = 1024 * 1024
+
+# Categories of the .data directory of a wheel, named after install schemes
+DATA_SCHEMES = {"purelib", "platlib", "headers", "scripts", "data"}
+
+
+@dataclass(frozen=True)
+class _WheelFile:
+    info: zipfile.ZipInfo
+    scheme: str
+    # Path of the file within its scheme
+    path: str
+    target: str
+    executable: bool
+    # Hash and size of the file from the RECORD of the wheel
+    record: tuple[str, str] | None
+
+
+class BundleWheelInstaller(ReportingWheelInstaller):
+    """
+    A wheel installer for the environments bundles own, extracting wheels
+    straight into the environment.
+
+    The files of a wheel are written by a pool of threads, and hashed while
+    written to check them against the RECORD of the wheel. The RECORD,
+    INSTALLER and entry point scripts are written at once after the files.
+
+    Wheels without a RECORD listing their files are installed by Poetry, and so
+    are wheels whose files do not match their RECORD, which are reported as
+    invalid as Poetry does. Bytecode is compiled, if enabled, as Poetry does
+    once the wheel is installed.
+    """
+
+    def install(self, wheel: Path) -> None:
+        with zipfile.ZipFile(wheel) as archive:
+            plan = self._plan(wheel, archive)
+            if plan is not None:
+                with self._report.span("install", "install", wheel=wheel.name):
+                    mismatches = self._install(archive, *plan)
+
+                if not mismatches:
+                    return
+
+                # The files written are replaced by Poetry, along with the RECORD
+                self.invalid_wheels[wheel] = [
+                    f"In {wheel}, hash / size of {name} didn't match RECORD"
+                    for name in mismatches
+                ]
+
+        super().install(wheel)
+
+    def _plan(
+        self, wheel: Path, archive: zipfile.ZipFile
+    ) -> tuple[str, str, dict[str, str], list[_WheelFile]] | None:
+        """
+        Return the dist-info directory, the root scheme, the scheme directories
+        and the files of the wheel, or None if the wheel must be installed by Poetry.
+        """
+        from email.parser import HeaderParser
+
+        names = set(archive.namelist())
+        dist_infos = {
+            name.partition("/")[0]
+            for name in names
+            if name.count("/") == 1 and name.endswith(".dist-info/WHEEL")
+        }
+        if len(dist_infos) != 1:
+            return None
+
+        dist_info = dist_infos.pop()
+        record_path = f"{dist_info}/RECORD"
+        if record_path not in names:
+            return None
+
+        metadata = HeaderParser().parsestr(
+            archive.read(f"{dist_info}/WHEEL").decode("utf-8")
+        )
+        root = (
+            "purelib"
+            if metadata.get("Root-Is-Purelib", "").strip().lower() == "true"
+            else "platlib"
+        )
+
+        records = {
+            row[0]: (row[1], row[2])
+            for row in csv.reader(
+                io.StringIO(archive.read(record_path).decode("utf-8"))
+            )
+            if len(row) == 3
+            and row[1].partition("=")[0] in hashlib.algorithms_guaranteed
+        }
+
+        schemes = dict(self._env.scheme_dict)
+        schemes["headers"] = str(
+            Path(schemes["include"]) / wheel.name.partition("-")[0]
+        )
+        directories = {
+            scheme: os.path.abspath(directory) for scheme, directory in schemes.items()
+        }
+
+        files = []
+        for info in archive.infolist():
+            name = info.filename
+            if info.is_dir() or name == record_path:
+                continue
+
+            # Installing bytecode shipped by wheels is a security risk
+            if "__pycache__" in name.split("/")[:-1]:
+                continue
+
+            scheme, path = root, name
+            top, _, rest = name.partition("/")
+            if top.endswith(".data"):
+                scheme, _, path = rest.partition("/")
+                if scheme not in DATA_SCHEMES or not path:
+                    return None
+
+            record = records.get(name)
+            if record is None and scheme != "scripts":
+                return None
+
+            target = os.path.abspath(os.path.join(directories[scheme], path))
+            if not target.startswith(directories[scheme] + os.sep):
+                raise ValueError(
+                    f"Attempting to write {path} outside of the target directory\n"
+                    f"Target directory: {directories[scheme]}\n"
+                    f"Target path: {target}"
+                )
+
+            files.append(
+                _WheelFile(
+                    info=info,
+                    scheme=scheme,
+                    path=path,
+                    target=target,
+                    executable=bool((info.external_attr >> 16) & 0o111),
+                    # Scripts are recorded once their shebang is rewritten
+                    record=record if scheme != "scripts" else None,
+                )
+            )
+
+        return dist_info, root, directories, files
+
+    def _install(
+        self,
+        archive: zipfile.ZipFile,
+        dist_info: str,
+        root: str,
+        directories: Mapping[str, str],
+        files: list[_WheelFile],
+    ) -> list[str]:
+        """
+        Install the files of the wheel, returning the names of the files which
+        do not match the RECORD of the wheel, if any, in which case the wheel
+        is left partially installed.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        from installer.scripts import Script
+        from installer.utils import parse_entrypoints
+        from poetry.__version__ import __version__
+
+        for directory in sorted({os.path.dirname(file.target) for file in files}):
+            os.makedirs(directory, exist_ok=True)
+
+        def write(file: _WheelFile) -> tuple[str, str, tuple[str, str]]:
+            return file.scheme, file.path, self._write_member(archive, file)
+
+        if len(files) > PARALLEL_FILES:
+            with ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 1),
+                thread_name_prefix="bundle-install",
+            ) as pool:
+                rows = list(pool.map(write, files))
+        else:
+            rows = [write(file) for file in files]
+
+        mismatches = [
+            file.info.filename
+            for file, (_, _, record) in zip(files, rows, strict=True)
+            if file.record is not None and record != file.record
+        ]
+        if mismatches:
+            return mismatches
+
+        interpreter = str(self._env.python)
+        generated: dict[tuple[str, str], bytes] = {
+            (root, f"{dist_info}/INSTALLER"): f"Poetry {__version__}".encode()
+        }
+        entry_points = f"{dist_info}/entry_points.txt"
+        if entry_points in archive.namelist():
+            text = archive.read(entry_points).decode("utf-8")
+            for name, module, attr, section in parse_entrypoints(text):
+                script, data = Script(name, module, attr, section).generate(
+                    interpreter, self._script_kind
+                )
+                generated["scripts", script] = data
+
+        os.makedirs(directories["scripts"], exist_ok=True)
+        for (scheme, path), data in generated.items():
+            target = os.path.join(directories[scheme], path)
+            _write_file(target, [data], executable=scheme == "scripts")
+            rows.append((scheme, path, _hash_row(data)))
+
+        rows.append((root, f"{dist_info}/RECORD", ("", "")))
+        _write_record(
+            os.path.join(directories[root], dist_info, "RECORD"),
+            root,
+            directories,
+            rows,
+        )
+
+        self._compile(directories, files)
+
+        return []
+
+    def _compile(self, directories: Mapping[str, str], files: list[_WheelFile]) -> None:
+        import compileall
+
+        for file in files:
+            if file.scheme not in ("purelib", "platlib") or not file.path.endswith(
+                ".py"
+            ):
+                continue
+
+            directory = Path(directories[file.scheme], file.path).parent
+            for level in self._bytecode_optimization_levels:
+                compileall.compile_file(
+                    file.target, optimize=level, quiet=1, ddir=directory
+                )
+
+    def _write_member(
+        self, archive: zipfile.ZipFile, file: _WheelFile
+    ) -> tuple[str, str]:
+        """
+        Write a file of the wheel, returning its hash and size for the RECORD,
+        hashed with the algorithm of the RECORD of the wheel.
+        """
+        from installer.utils import fix_shebang
+
+        with archive.open(file.info) as source:
+            if file.scheme == "scripts":
+                with fix_shebang(
+                    cast("BinaryIO", source), str(self._env.python)
+                ) as stream:
+                    data = stream.read()
+
+                _write_file(file.target, [data], file.executable)
+
+                return _hash_row(data)
+
+            assert file.record is not None
+
+            algorithm, _, _ = file.record[0].partition("=")
+            digest = hashlib.new(algorithm)
+            _write_file(file.target, _hashed(_chunks(source), digest), file.executable)
+
+        encoded = base64.urlsafe_b64encode(digest.digest()).rstrip(b"=").decode()
+
+        # The size of the file is checked by zipfile once read
+        return f"{algorithm}={encoded}", str(file.info.file_size)
+
+
+def _chunks(source: IO[bytes]) -> Iterable[bytes]:
+    while chunk := source.read(CHUNK_SIZE):
+        yield chunk
+
+
+def _hashed(chunks: Iterable[bytes], digest: hashlib._Hash) -> Iterable[bytes]:
+    for chunk in chunks:
+        digest.update(chunk)
+        yield chunk
+
+
+def _write_file(target: str, chunks: Iterable[bytes], executable: bool) -> None:
+    """
+    Write a new file, replacing any existing one rather than writing
+    into it since it may be hardlinked elsewhere.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    try:
+        fd = os.open(target, flags, 0o666)
+    except FileExistsError:
+        os.unlink(target)
+        fd = os.open(target, flags, 0o666)
+
+    with os.fdopen(fd, "wb") as f:
+        for chunk in chunks:
+            f.write(chunk)
+
+    if executable:
+        mode = os.stat(target).st_mode
+        os.chmod(target, mode | (mode & 0o444) >> 2)
+
+
+def _hash_row(data: bytes) -> tuple[str, str]:
+    digest = base64.urlsafe_b64encode(hashlib.sha256(data).digest()).rstrip(b"=")
+
+    return f"sha256={digest.decode()}", str(len(data))
+
+
+def _write_record(
+    target: str,
+    root: str,
+    directories: Mapping[str, str],
+    rows: Iterable[tuple[str, str, tuple[str, str]]],
+) -> None:
+    """
+    Write the RECORD of a wheel, with the paths of the files written outside
+    of its root scheme relative to it, as Poetry's installer does.
+    """
+    from poetry.utils._compat import WINDOWS
+
+    stream = io.StringIO()
+    writer = csv.writer(stream, delimiter=",", quotechar='"', lineterminator="\n")
+    for scheme, path, record in sorted(rows, key=lambda row: row[1]):
+        if scheme != root:
+            if WINDOWS:
+                prefix = directories[scheme]
+            else:
+                prefix = os.path.relpath(directories[scheme], directories[root])
+            path = posixpath.join(prefix.replace(os.sep, "/"), path)
+
+        writer.writerow([path, *record])
+
+    _write_file(target, [stream.getvalue().encode("utf-8")], executable=False)
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+
+from dataclasses import dataclass
+from dataclasses import field
+from functools import cached_property
+from typing import TYPE_CHECKING
+from typing import Any
+
+from poetry_plugin_bundle.utils.prefetch import PrefetchExecutor
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from packaging.utils import NormalizedName
+    from poetry.core.packages.package import Package
+    from poetry.core.packages.utils.link import Link
+    from poetry.installation.operations.install import Install
+    from poetry.installation.operations.update import Update
+    from poetry.packages.locker import Locker
+    from poetry.poetry import Poetry
+    from poetry.utils.authenticator import Authenticator
+    from poetry.utils.env import Env
+
+
+# Suffix of the archives being downloaded into a wheelhouse, whose download
+# resumes from where it stopped when interrupted
+PARTIAL_SUFFIX = ".part"
+
+CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class WheelhouseStats:
+    archives: int = 0
+    downloaded: int = 0
+    cached: int = 0
+    present: int = 0
+    # Bytes downloaded, leaving out the resumed parts of archives
+    size: int = 0
+    # Source distributions, built into wheels by bundles
+    sdists: list[str] = field(default_factory=list)
+    # Git dependencies, which are cloned by bundles
+    unavailable: list[str] = field(default_factory=list)
+
+
+class Wheelhouse:
+    """
+    A directory of the archives of locked packages, which bundles install
+    from instead of downloading them, e.g. with no network access.
+
+    Archives keep the file names they are locked with, which identify
+    them, and are verified against the hashes of the lock file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._stats = WheelhouseStats()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def stats(self) -> WheelhouseStats:
+        return self._stats
+
+    def archive_for(self, package: Package, env: Env) -> Path | None:
+        """
+        Return the archive of the wheelhouse to install package from into env:
+        the wheel with the most specific tags supported by env, or else a source
+        distribution, among the files the package is locked with.
+        """
+        from poetry.utils.wheel import Wheel
+
+        wheels: list[tuple[int, str]] = []
+        sdists: list[str] = []
+        for file in package.files:
+            name = file["file"]
+            if name not in self._archives:
+                continue
+
+            if not name.endswith(".whl"):
+                sdists.append(name)
+                continue
+
+            index = Wheel(name).get_minimum_supported_index(env.supported_tags)
+            if index is not None:
+                wheels.append((index, name))
+
+        if wheels:
+            return self._path / min(wheels)[1]
+
+        if sdists:
+            return self._path / min(sdists)
+
+        return None
+
+    def add(
+        self,
+        package: Package,
+        link: Link,
+        session: Authenticator,
+        cached: Path | None = None,
+        max_retries: int = 0,
+    ) -> Path:
+        """
+        Add the archive of package behind link to the wheelhouse, unless it is
+        there already, copying it from cached if given and downloading it otherwise.
+
+        Archives are only added once verified, and interrupted downloads
+        resume from where they stopped.
+        """
+        archive = self._path / link.filename
+        if archive.exists():
+            verify_archive(archive, link.filename, package)
+            self._count(archive, present=1)
+
+            return archive
+
+        self._path.mkdir(parents=True, exist_ok=True)
+        partial = archive.with_name(archive.name + PARTIAL_SUFFIX)
+        size = 0
+        if cached is not None:
+            shutil.copyfile(cached, partial)
+        else:
+            size = download_resumable(session, link.url, partial, max_retries)
+
+        try:
+            verify_archive(partial, link.filename, package)
+        except RuntimeError:
+            partial.unlink()
+            raise
+
+        os.replace(partial, archive)
+        if cached is not None:
+            self._count(archive, cached=1)
+        else:
+            self._count(archive, downloaded=1, size=size)
+
+        return archive
+
+    def skip(self, package: Package) -> None:
+        """
+        Record a package whose archive cannot be added to the wheelhouse.
+        """
+        if package.source_type == "git":
+            with self._lock:
+                self._stats.unavailable.append(package.pretty_name)
+
+    @cached_property
+    def _archives(self) -> set[str]:
+        try:
+            return {entry.name for entry in os.scandir(self._path) if entry.is_file()}
+        except FileNotFoundError:
+            return set()
+
+    def _count(self, archive: Path, **counts: int) -> None:
+        with self._lock:
+            self._stats.archives += 1
+            for name, count in counts.items():
+                setattr(self._stats, name, getattr(self._stats, name) + count)
+
+            if archive.suffix != ".whl" and archive.name not in self._stats.sdists:
+                self._stats.sdists.append(archive.name)
+
+
+class WheelhouseExecutor(PrefetchExecutor):
+    """
+    An executor adding the archives of the packages to install to a wheelhouse,
+    without installing anything.
+
+    Archives are downloaded concurrently over the pooled connections of the
+    authenticator of the executor, unless found in the artifact cache.
+    """
+
+    def __init__(self, *args: Any, wheelhouse: Wheelhouse, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+
+        # Archives are added to this wheelhouse rather than read from it
+        self._target = wheelhouse
+
+    def _prefetch(self, operation: Install | Update) -> None:
+        package = operation.package
+        link = self._link_for(package)
+        if link is None:
+            self._target.skip(package)
+            return
+
+        cached = self._artifact_cache.get_cached_archive_for_link(link, strict=True)
+        self._target.add(package, link, self._authenticator, cached, self._max_retries)
+
+
+def download_wheelhouse(
+    poetry: Poetry,
+    env: Env,
+    locker: Locker,
+    wheelhouse: Wheelhouse,
+    activated_groups: Iterable[NormalizedName] | None = None,
+) -> None:
+    """
+    Add the archives of the locked packages that would be installed
+    into an empty environment matching env to the wheelhouse.
+    """
+    from cleo.io.null_io import NullIO
+
+    from poetry_plugin_bundle.utils.prefetch import prefetch_artifacts
+    from poetry_plugin_bundle.utils.report import BundleReport
+
+    executor = WheelhouseExecutor(
+        env,
+        poetry.pool,
+        poetry.config,
+        NullIO(),
+        report=BundleReport(),
+        wheelhouse=wheelhouse,
+    )
+    prefetch_artifacts(poetry, env, locker, activated_groups, executor=executor)
+
+
+def download_resumable(
+    session: Authenticator, url: str, dest: Path, max_retries: int = 0
+) -> int:
+    """
+    Download url into dest, resuming from the content already in dest if the
+    server supports range requests, and return the number of bytes downloaded.
+    """
+    from requests.exceptions import ChunkedEncodingError
+    from requests.exceptions import ConnectionError
+
+    downloaded = 0
+    retries = 0
+    while True:
+        start = dest.stat().st_size if dest.exists() else 0
+        headers = {"Accept-Encoding": "identity"}
+        if start:
+            headers["Range"] = f"bytes={start}-"
+
+        response = session.get(
+            url, stream=True, headers=headers, raise_for_status=False
+        )
+        with response:
+            # The partial archive is complete, or does not match the archive
+            if start and response.status_code == 416:
+                dest.unlink()
+                continue
+
+            response.raise_for_status()
+
+            # Servers ignoring the range send the whole archive
+            mode = "ab" if response.status_code == 206 else "wb"
+            try:
+                with dest.open(mode) as f:
+                    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                        f.write(chunk)
+                        downloaded += len(chunk)
+            except (ChunkedEncodingError, ConnectionError):
+                if retries >= max_retries:
+                    raise
+
+                retries += 1
+                continue
+
+        return downloaded
+
+
+def verify_archive(archive: Path, name: str, package: Package) -> None:
+    """
+    Check the hash of an archive of package named name against the lock file,
+    unless the package is locked without hashes.
+    """
+    from poetry.utils.helpers import get_file_hash
+    from poetry.utils.helpers import get_highest_priority_hash_type
+
+    if not package.files:
+        return
+
+    known_hashes = {f["hash"] for f in package.files if f["file"] == name}
+    if not known_hashes:
+        raise RuntimeError(
+            f"The archive {name} of {package} is not listed in the lock file,"
+            " so its hash cannot be verified"
+        )
+
+    hash_type = get_highest_priority_hash_type(
+        {known_hash.split(":")[0] for known_hash in known_hashes}, name
+    )
+    if (
+        hash_type is None
+        or f"{hash_type}:{get_file_hash(archive, hash_type)}" not in known_hashes
+    ):
+        raise RuntimeError(
+            f"Hash for {package} from archive {name} not found in known hashes"
+        )
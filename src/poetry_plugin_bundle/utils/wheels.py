@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import functools
+import os
+import stat
+import time
+import zipfile
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+    from pathlib import Path
+    from typing import IO
+
+    from poetry_plugin_bundle.utils.compression import BinaryWriter
+
+
+# Earliest timestamp a ZIP archive can store (1980-01-01 00:00:00 UTC)
+ZIP_EPOCH = 315532800
+
+# Categories of the .data directory of a wheel installed into site-packages
+SITE_PACKAGES_CATEGORIES = {"purelib", "platlib"}
+
+
+@dataclass(frozen=True)
+class WheelMember:
+    wheel: Path
+    name: str
+    path: str
+    executable: bool
+    size: int
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    path: str
+    executable: bool
+    size: int
+    open: Callable[[], IO[bytes]]
+
+
+class WheelReader:
+    """
+    Read the members of wheels, keeping every wheel open until closed.
+    """
+
+    def __init__(self) -> None:
+        self._archives: dict[Path, zipfile.ZipFile] = {}
+
+    def open(self, member: WheelMember) -> IO[bytes]:
+        archive = self._archives.get(member.wheel)
+        if archive is None:
+            archive = self._archives[member.wheel] = zipfile.ZipFile(member.wheel)
+
+        return archive.open(member.name)
+
+    def close(self) -> None:
+        for archive in self._archives.values():
+            archive.close()
+
+        self._archives.clear()
+
+
+def site_packages_members(wheel: Path) -> list[WheelMember]:
+    """
+    Return the files of a wheel that are installed into site-packages,
+    along with their path relative to it.
+
+    Scripts, headers and data files are left out since they are installed
+    outside of site-packages.
+    """
+    members = []
+    with zipfile.ZipFile(wheel) as archive:
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+
+            path = info.filename
+            top, _, rest = path.partition("/")
+            if top.endswith(".data"):
+                category, _, path = rest.partition("/")
+                if category not in SITE_PACKAGES_CATEGORIES or not path:
+                    continue
+
+            members.append(
+                WheelMember(
+                    wheel=wheel,
+                    name=info.filename,
+                    path=path,
+                    executable=bool((info.external_attr >> 16) & stat.S_IXUSR),
+                    size=info.file_size,
+                )
+            )
+
+    return members
+
+
+def site_packages_layout(
+    wheels: Iterable[Path],
+) -> tuple[list[WheelMember], list[str]]:
+    """
+    Merge the site-packages files of the given wheels, sorted by path.
+
+    Returns the merged files and the paths provided by more than one wheel,
+    for which the first wheel wins.
+    """
+    layout: dict[str, WheelMember] = {}
+    conflicts = []
+    for wheel in wheels:
+        for member in site_packages_members(wheel):
+            if member.path in layout:
+                conflicts.append(member.path)
+                continue
+
+            layout[member.path] = member
+
+    return [layout[path] for path in sorted(layout)], sorted(set(conflicts))
+
+
+def archive_entries(
+    members: Iterable[WheelMember], pycs: Mapping[str, Path], reader: WheelReader
+) -> list[ArchiveEntry]:
+    """
+    Return the entries of an archive holding the given wheel members
+    and bytecode files, sorted by path.
+    """
+    entries = [
+        ArchiveEntry(
+            member.path,
+            member.executable,
+            member.size,
+            functools.partial(reader.open, member),
+        )
+        for member in members
+    ]
+    entries.extend(
+        ArchiveEntry(
+            path, False, pyc.stat().st_size, functools.partial(_open_file, pyc)
+        )
+        for path, pyc in pycs.items()
+    )
+
+    return sorted(entries, key=lambda entry: entry.path)
+
+
+def archive_timestamp() -> int:
+    """
+    Return the timestamp of the entries of reproducible archives: the one set
+    by SOURCE_DATE_EPOCH, if any, and the earliest one a ZIP archive can store
+    otherwise.
+    """
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch is None:
+        return ZIP_EPOCH
+
+    return max(int(epoch), ZIP_EPOCH)
+
+
+def write_tar(
+    fileobj: BinaryWriter, entries: Iterable[ArchiveEntry], timestamp: int
+) -> None:
+    """
+    Stream the given entries into a tar archive written to fileobj,
+    with normalized ownership and permissions.
+    """
+    import tarfile
+
+    # Streams written to only need to be writable
+    with tarfile.open(  # type: ignore[call-overload]
+        fileobj=fileobj, mode="w|", format=tarfile.PAX_FORMAT
+    ) as archive:
+        for entry in entries:
+            info = tarfile.TarInfo(entry.path)
+            info.size = entry.size
+            info.mtime = timestamp
+            info.mode = 0o755 if entry.executable else 0o644
+            with entry.open() as src:
+                archive.addfile(info, src)
+
+
+def zip_date_time(timestamp: int) -> tuple[int, int, int, int, int, int]:
+    return time.gmtime(timestamp)[:6]
+
+
+def _open_file(path: Path) -> IO[bytes]:
+    return path.open("rb")
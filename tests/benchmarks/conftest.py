@@ -0,0 +1,130 @@
+"""
+Benchmarks of the bundlers, run with:
+
+    pytest tests/benchmarks --benchmark --benchmark-json results.json
+
+Projects depending on synthetic packages are bundled from an index served on the
+loopback interface, so that no network access is needed. Comparing the results
+of two releases shows performance regressions.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import sys
+import time
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+
+from tests.benchmarks.index import IndexServer
+from tests.benchmarks.index import build_index
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterator
+
+    from tests.benchmarks.index import SyntheticPackage
+
+
+RESULTS = pytest.StashKey[list[dict[str, Any]]]()
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    if config.getoption("--benchmark"):
+        return
+
+    skip = pytest.mark.skip(reason="benchmarks only run with --benchmark")
+    for item in items:
+        if Path(__file__).parent in item.path.parents:
+            item.add_marker(skip)
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "size" in metafunc.fixturenames:
+        sizes = metafunc.config.getoption("--benchmark-sizes")
+        metafunc.parametrize("size", [int(size) for size in sizes.split(",")])
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    results = session.config.stash.get(RESULTS, [])
+    output = session.config.getoption("--benchmark-json")
+    if not results or output is None:
+        return
+
+    from poetry.__version__ import __version__
+
+    Path(output).write_text(
+        json.dumps(
+            {
+                "python": platform.python_version(),
+                "implementation": sys.implementation.name,
+                "platform": platform.platform(),
+                "poetry": __version__,
+                "results": results,
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+
+
+def pytest_terminal_summary(terminalreporter: Any, config: pytest.Config) -> None:
+    results = config.stash.get(RESULTS, [])
+    if not results:
+        return
+
+    terminalreporter.section("benchmarks")
+    for result in results:
+        terminalreporter.write_line(
+            f"{result['name']:<48} {result['size']:>6} {result['seconds']:>10.3f}s"
+        )
+
+
+@pytest.fixture()
+def record(request: pytest.FixtureRequest) -> Callable[..., None]:
+    """
+    Record the duration of a benchmark, along with any additional data.
+    """
+    results = request.config.stash.setdefault(RESULTS, [])
+
+    def record(name: str, size: int, seconds: float, **data: Any) -> None:
+        results.append({"name": name, "size": size, "seconds": seconds, **data})
+
+    return record
+
+
+@pytest.fixture()
+def timer() -> Callable[[Callable[[], Any]], float]:
+    def timer(func: Callable[[], Any]) -> float:
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
+
+    return timer
+
+
+@pytest.fixture()
+def index(
+    tmp_path: Path, size: int
+) -> Iterator[tuple[str, dict[str, list[SyntheticPackage]]]]:
+    """
+    Serve an index of synthetic packages from the loopback interface,
+    so that no network access is needed.
+    """
+    root = tmp_path / "index"
+    packages = build_index(root, size)
+
+    server = IndexServer(root)
+    server.start()
+    try:
+        yield server.url, packages
+    finally:
+        server.stop()
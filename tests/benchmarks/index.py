@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import base64
+import functools
+import hashlib
+import threading
+import zipfile
+
+from dataclasses import dataclass
+from http.server import SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+
+# Number of modules of each synthetic package, along with their size in lines
+MODULES = 5
+MODULE_LINES = 200
+
+
+@dataclass(frozen=True)
+class SyntheticPackage:
+    name: str
+    version: str
+    wheel: Path
+    hash: str
+
+
+def build_wheel(directory: Path, name: str, version: str) -> SyntheticPackage:
+    """
+    Build a pure Python wheel with a few modules of dummy functions.
+    """
+    module = name.replace("-", "_")
+    dist_info = f"{module}-{version}.dist-info"
+    files = {
+        f"{module}/__init__.py": f'__version__ = "{version}"\n',
+        **{
+            f"{module}/module_{i}.py": "".join(
+                f"def function_{j}(value):\n    return value + {j}\n\n\n"
+                for j in range(MODULE_LINES // 4)
+            )
+            for i in range(MODULES)
+        },
+        f"{dist_info}/METADATA": (
+            f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+        ),
+        f"{dist_info}/WHEEL": (
+            "Wheel-Version: 1.0\nGenerator: benchmarks\n"
+            "Root-Is-Purelib: true\nTag: py3-none-any\n"
+        ),
+    }
+
+    record = []
+    for path, content in files.items():
+        digest = hashlib.sha256(content.encode()).digest()
+        encoded = base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+        record.append(f"{path},sha256={encoded},{len(content.encode())}")
+    record.append(f"{dist_info}/RECORD,,")
+    files[f"{dist_info}/RECORD"] = "\n".join(record) + "\n"
+
+    wheel = directory / f"{module}-{version}-py3-none-any.whl"
+    with zipfile.ZipFile(wheel, "w", zipfile.ZIP_DEFLATED) as archive:
+        for path, content in files.items():
+            archive.writestr(path, content)
+
+    return SyntheticPackage(
+        name, version, wheel, hashlib.sha256(wheel.read_bytes()).hexdigest()
+    )
+
+
+def build_index(root: Path, count: int) -> dict[str, list[SyntheticPackage]]:
+    """
+    Build a PEP 503 simple index of count synthetic packages under root.
+
+    The first package also gets a second version, to benchmark upgrades.
+    """
+    packages: dict[str, list[SyntheticPackage]] = {}
+    for i in range(count):
+        name = f"bench-{i:04d}"
+        directory = root / "simple" / name
+        directory.mkdir(parents=True)
+
+        versions = ["1.0.0", "1.0.1"] if i == 0 else ["1.0.0"]
+        packages[name] = [build_wheel(directory, name, v) for v in versions]
+
+        links = "".join(
+            f'<a href="{p.wheel.name}#sha256={p.hash}">{p.wheel.name}</a>\n'
+            for p in packages[name]
+        )
+        (directory / "index.html").write_text(
+            f"<!DOCTYPE html>\n<html><body>\n{links}</body></html>\n"
+        )
+
+    return packages
+
+
+class IndexServer:
+    """
+    Serve a local index over HTTP on the loopback interface.
+    """
+
+    def __init__(self, root: Path) -> None:
+        handler = functools.partial(_QuietHandler, directory=str(root))
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._thread = threading.Thread(target=self._server.serve_forever)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}/simple"
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """
+    Serve the files of the index, along with the open-ended range requests
+    used to resume downloads, as real indexes do.
+    """
+
+    def do_GET(self) -> None:
+        range_ = self.headers.get("Range", "")
+        path = Path(self.translate_path(self.path))
+        if not range_.startswith("bytes=") or not path.is_file():
+            super().do_GET()
+            return
+
+        content = path.read_bytes()
+        start = int(range_.removeprefix("bytes=").removesuffix("-"))
+        if start >= len(content):
+            self.send_error(416)
+            return
+
+        self.send_response(206)
+        self.send_header("Content-Range", f"bytes {start}-{len(content) - 1}/*")
+        self.send_header("Content-Length", str(len(content) - start))
+        self.end_headers()
+        self.wfile.write(content[start:])
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def write_project(
+    path: Path,
+    url: str,
+    packages: dict[str, list[SyntheticPackage]],
+    upgraded: bool = False,
+) -> None:
+    """
+    Write a project depending on every package of the index, along with its
+    lock file, pinning the first package to its latest version if upgraded.
+    """
+    from poetry.factory import Factory
+
+    path.mkdir(parents=True, exist_ok=True)
+    module = path / "benchmark_project"
+    module.mkdir(exist_ok=True)
+    (module / "__init__.py").write_text(f"UPGRADED = {upgraded}\n")
+
+    locked = [
+        versions[-1] if upgraded and i == 0 else versions[0]
+        for i, versions in enumerate(packages.values())
+    ]
+    dependencies = "".join(f'    "{p.name}=={p.version}",\n' for p in locked)
+    (path / "pyproject.toml").write_text(
+        f"""\
+[project]
+name = "benchmark-project"
+version = "1.0.0"
+requires-python = ">=3.10"
+dependencies = [
+{dependencies}]
+
+[[tool.poetry.source]]
+name = "bench"
+url = "{url}"
+priority = "primary"
+"""
+    )
+
+    content_hash = Factory().create_poetry(path).locker._get_content_hash()
+    lock = "".join(
+        f"""\
+[[package]]
+name = "{p.name}"
+version = "{p.version}"
+description = ""
+optional = false
+python-versions = "*"
+groups = ["main"]
+files = [
+    {{file = "{p.wheel.name}", hash = "sha256:{p.hash}"}},
+]
+
+[package.source]
+type = "legacy"
+url = "{url}"
+reference = "bench"
+
+"""
+        for p in locked
+    )
+    (path / "poetry.lock").write_text(
+        lock
+        + f"""\
+[metadata]
+lock-version = "2.1"
+python-versions = ">=3.10"
+content-hash = "{content_hash}"
+"""
+    )
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+
+from poetry.utils.env import MockEnv
+
+from poetry_plugin_bundle.utils.platforms import create_supported_tags
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+ITERATIONS = 100
+
+
+@pytest.mark.parametrize(
+    "platform",
+    ["manylinux_2_28_x86_64", "musllinux_1_2_aarch64", "macosx_14_0_arm64"],
+)
+def test_create_supported_tags(
+    platform: str,
+    record: Callable[..., None],
+    timer: Callable[[Callable[[], Any]], float],
+) -> None:
+    env = MockEnv(version_info=(3, 12, 1))
+
+    def create() -> None:
+        for _ in range(ITERATIONS):
+            create_supported_tags(platform, env)
+
+    record(
+        f"create_supported_tags ({platform})",
+        ITERATIONS,
+        timer(create),
+        tags=len(create_supported_tags(platform, env)),
+    )
+
+
+def test_rank_wheels(
+    record: Callable[..., None],
+    timer: Callable[[Callable[[], Any]], float],
+) -> None:
+    from poetry.utils.wheel import Wheel
+
+    from poetry_plugin_bundle.utils.platforms import IndexedTags
+    from poetry_plugin_bundle.utils.platforms import supported_tag_index
+
+    env = MockEnv(version_info=(3, 12, 1))
+    tags = IndexedTags(supported_tag_index("manylinux_2_28_x86_64", env))
+    wheels = [
+        Wheel(f"demo-1.0-{tag}.whl") for tag in ("py3-none-any", "cp312-abi3-win32")
+    ]
+
+    def rank() -> None:
+        for _ in range(ITERATIONS):
+            for wheel in wheels:
+                wheel.get_minimum_supported_index(tags)
+
+    record(
+        "rank wheels (manylinux_2_28_x86_64)",
+        ITERATIONS * len(wheels),
+        timer(rank),
+        tags=len(tags),
+    )
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from cleo.io.null_io import NullIO
+from poetry.factory import Factory
+
+from poetry_plugin_bundle.bundlers.venv_bundler import VenvBundler
+from tests.benchmarks.index import write_project
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from poetry.config.config import Config
+    from poetry.poetry import Poetry
+
+    from tests.benchmarks.index import SyntheticPackage
+
+
+def create_poetry(path: Path, config: Config) -> Poetry:
+    poetry = Factory().create_poetry(path)
+    poetry.set_config(config)
+
+    return poetry
+
+
+def test_bundle_venv(
+    tmp_path: Path,
+    config: Config,
+    size: int,
+    index: tuple[str, dict[str, list[SyntheticPackage]]],
+    record: Callable[..., None],
+    timer: Callable[[Callable[[], Any]], float],
+) -> None:
+    url, packages = index
+    project = tmp_path / "project"
+    write_project(project, url, packages)
+    poetry = create_poetry(project, config)
+
+    def bundle(
+        name: str, path: Path, installer: str = "poetry", **options: bool
+    ) -> None:
+        report = tmp_path / f"{name}.json"
+        bundler = VenvBundler().set_path(path).set_report("json", report)
+        bundler.set_compile(options.get("compile", False))
+        bundler.set_installer(installer)
+
+        seconds = timer(lambda: bundler.bundle(poetry, NullIO()))
+
+        data = json.loads(report.read_text())
+        assert len(data["packages"]) > 0
+        record(
+            f"bundle venv ({name})",
+            size,
+            seconds,
+            phases=data["phases"],
+            downloads=data["downloads"],
+        )
+
+    # Nothing is cached
+    bundle("cold", tmp_path / "cold")
+
+    # Every archive is in the artifact cache
+    bundle("warm", tmp_path / "warm")
+
+    # The same, with wheels installed by the bundle installer
+    bundle("bundle installer", tmp_path / "bundle-installer", installer="bundle")
+
+    # A dependency is upgraded and the project changed
+    write_project(project, url, packages, upgraded=True)
+    poetry = create_poetry(project, config)
+    bundle("incremental", tmp_path / "warm")
+
+    bundle("compile", tmp_path / "compile", compile=True)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import zipfile
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cleo.formatters.style import Style
+from cleo.io.buffered_io import BufferedIO
+from poetry.core.packages.package import Package
+from poetry.factory import Factory
+from poetry.repositories.repository import Repository
+from poetry.repositories.repository_pool import RepositoryPool
+
+
+if TYPE_CHECKING:
+    from poetry.config.config import Config
+    from poetry.poetry import Poetry
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture()
+def io() -> BufferedIO:
+    io = BufferedIO()
+
+    io.output.formatter.set_style("success", Style("green", options=["dark"]))
+    io.output.formatter.set_style("warning", Style("yellow", options=["dark"]))
+
+    return io
+
+
+@pytest.fixture()
+def project() -> Path:
+    return Path(__file__).parent.parent / "fixtures" / "simple_project"
+
+
+@pytest.fixture()
+def poetry(config: Config, project: Path) -> Poetry:
+    poetry = Factory().create_poetry(project)
+    poetry.set_config(config)
+
+    pool = RepositoryPool()
+    repository = Repository("repo")
+    repository.add_package(Package("foo", "1.0.0"))
+    pool.add_repository(repository)
+    poetry.set_pool(pool)
+
+    return poetry
+
+
+@pytest.fixture()
+def foo_wheel(tmp_path: Path, mocker: MockerFixture) -> Path:
+    wheel = tmp_path / "foo-1.0.0-py3-none-any.whl"
+    with zipfile.ZipFile(wheel, "w") as archive:
+        archive.writestr("foo/__init__.py", "VALUE = 1\n")
+        archive.writestr("foo/broken.py", "def broken(:\n")
+        archive.writestr("foo-1.0.0.data/purelib/foo_extra.py", "")
+        archive.writestr("foo-1.0.0.data/scripts/foo", "#!python\n")
+        archive.writestr("foo-1.0.0.dist-info/METADATA", "Name: foo\nVersion: 1.0.0\n")
+
+    mocker.patch("poetry.installation.executor.Executor._download", return_value=wheel)
+
+    return wheel
@@ -2,13 +2,21 @@ from __future__ import annotations
 
 import re
 
+from importlib.metadata import EntryPoint
+from typing import TYPE_CHECKING
+
 import pytest
 
 from poetry_plugin_bundle.bundlers.bundler import Bundler
+from poetry_plugin_bundle.bundlers.bundler_manager import BUNDLER_ENTRY_POINT_GROUP
 from poetry_plugin_bundle.bundlers.bundler_manager import BundlerManager
 from poetry_plugin_bundle.exceptions import BundlerManagerError
 
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
 class MockBundler(Bundler):
     name = "mock"
 
@@ -48,3 +56,25 @@ def test_register_bundler_class_cannot_register_existing_bundler_classes() -> No
         match=re.escape('A bundler class with the name "mock" already exists.'),
     ):
         manager.register_bundler_class(MockBundler)
+
+
+def test_bundler_loads_bundler_classes_from_entry_points(
+    mocker: MockerFixture,
+) -> None:
+    entry_points = mocker.patch(
+        "importlib.metadata.entry_points",
+        return_value=[
+            EntryPoint(
+                name="mock",
+                value=f"{__name__}:MockBundler",
+                group=BUNDLER_ENTRY_POINT_GROUP,
+            )
+        ],
+    )
+    manager = BundlerManager()
+
+    assert isinstance(manager.bundler("venv"), Bundler)
+    entry_points.assert_not_called()
+
+    assert isinstance(manager.bundler("Mock"), MockBundler)
+    entry_points.assert_called_once_with(group=BUNDLER_ENTRY_POINT_GROUP)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+import shutil
+import sys
+import tarfile
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from poetry_plugin_bundle.bundlers.oci_bundler import OciBundler
+
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from cleo.io.buffered_io import BufferedIO
+    from poetry.poetry import Poetry
+
+
+@pytest.fixture()
+def project(tmp_path: Path) -> Path:
+    # The sources of the project are modified by the tests
+    return Path(
+        shutil.copytree(
+            Path(__file__).parent.parent / "fixtures" / "simple_project",
+            tmp_path / "simple_project",
+        )
+    )
+
+
+def read_blob(layout: Path, digest: str) -> Any:
+    return json.loads(layout.joinpath("blobs", *digest.split(":")).read_bytes())
+
+
+def layer_names(layout: Path, digest: str) -> list[str]:
+    with tarfile.open(layout.joinpath("blobs", *digest.split(":"))) as archive:
+        return archive.getnames()
+
+
+def test_bundler_writes_an_oci_image_layout(
+    io: BufferedIO, tmp_path: Path, poetry: Poetry, foo_wheel: Path
+) -> None:
+    path = tmp_path / "image"
+
+    bundler = OciBundler()
+    bundler.set_path(path)
+    bundler.set_executable(sys.executable)
+    bundler.set_platform("manylinux_2_28_aarch64")
+    bundler.set_tag("latest")
+
+    assert bundler.bundle(poetry, io)
+
+    assert json.loads(path.joinpath("oci-layout").read_text()) == {
+        "imageLayoutVersion": "1.0.0"
+    }
+    index = json.loads(path.joinpath("index.json").read_text())
+    assert index["manifests"][0]["annotations"] == {
+        "org.opencontainers.image.ref.name": "latest"
+    }
+
+    manifest = read_blob(path, index["manifests"][0]["digest"])
+    config = read_blob(path, manifest["config"]["digest"])
+    assert config["architecture"] == "arm64"
+    assert config["config"]["Env"] == ["PYTHONPATH=/app"]
+    assert len(config["rootfs"]["diff_ids"]) == len(manifest["layers"]) == 2
+
+    dependencies, application = (layer["digest"] for layer in manifest["layers"])
+    assert "app/foo/__init__.py" in layer_names(path, dependencies)
+    assert not [
+        name
+        for name in layer_names(path, dependencies)
+        if name.startswith("app/simple_project")
+    ]
+    assert "app/simple_project/__init__.py" in layer_names(path, application)
+    assert "app/foo/__init__.py" not in layer_names(path, application)
+
+
+def test_bundler_keeps_the_dependency_layer_across_project_changes(
+    io: BufferedIO, tmp_path: Path, project: Path, poetry: Poetry, foo_wheel: Path
+) -> None:
+    path = tmp_path / "image"
+
+    bundler = OciBundler().set_path(path)
+    bundler.set_executable(sys.executable)
+
+    def layers() -> list[str]:
+        index = json.loads(path.joinpath("index.json").read_text())
+        manifest = read_blob(path, index["manifests"][0]["digest"])
+        return [layer["digest"] for layer in manifest["layers"]]
+
+    assert bundler.bundle(poetry, io)
+    first = layers()
+
+    assert bundler.bundle(poetry, io)
+    assert layers() == first
+
+    project.joinpath("simple_project", "__init__.py").write_text("VALUE = 2\n")
+    assert bundler.bundle(poetry, io)
+    second = layers()
+
+    assert second[0] == first[0]
+    assert second[1] != first[1]
+    # Stale blobs are not kept around
+    assert not path.joinpath("blobs", *first[1].split(":")).exists()
+
+
+def test_bundler_rejects_relative_targets() -> None:
+    with pytest.raises(ValueError, match="must be absolute"):
+        OciBundler().set_target("app")
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import sys
+import tarfile
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from poetry_plugin_bundle.bundlers.tar_bundler import TarBundler
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from cleo.io.buffered_io import BufferedIO
+    from poetry.poetry import Poetry
+
+
+def test_bundler_streams_wheels_into_a_deterministic_tarball(
+    io: BufferedIO, tmp_path: Path, poetry: Poetry, foo_wheel: Path
+) -> None:
+    path = tmp_path / "dist" / "bundle.tar.gz"
+
+    bundler = TarBundler()
+    bundler.set_path(path)
+    bundler.set_executable(sys.executable)
+
+    assert bundler.bundle(poetry, io)
+
+    expected = f"""\
+  • Bundling simple-project (1.2.3) into {path}
+  • Bundling simple-project (1.2.3) into {path}: Collecting dependencies for Python {sys.executable}
+  • Bundling simple-project (1.2.3) into {path}: Building simple-project (1.2.3)
+  • Bundling simple-project (1.2.3) into {path}: Writing archive
+  • Bundled simple-project (1.2.3) into {path}
+"""
+    assert expected == io.fetch_output()
+
+    with tarfile.open(path) as archive:
+        members = archive.getmembers()
+        names = [member.name for member in members]
+        content = archive.extractfile("foo/__init__.py")
+        assert content is not None
+        assert content.read() == b"VALUE = 1\n"
+
+    assert names == sorted(names)
+    assert {"foo/__init__.py", "foo_extra.py", "simple_project/__init__.py"} <= set(
+        names
+    )
+    assert {(m.mtime, m.uid, m.gid, m.mode) for m in members} == {
+        (315532800, 0, 0, 0o644)
+    }
+    assert list(tmp_path.joinpath("dist").iterdir()) == [path]
+
+    # Bundling again produces the exact same archive
+    other = tmp_path / "other.tar.gz"
+    assert bundler.set_path(other).bundle(poetry, io)
+    assert other.read_bytes() == path.read_bytes()
+
+
+def test_bundler_writes_zstd_tarballs(
+    io: BufferedIO, tmp_path: Path, poetry: Poetry, foo_wheel: Path
+) -> None:
+    zstandard = pytest.importorskip("zstandard")
+    path = tmp_path / "bundle.tar.zst"
+
+    bundler = TarBundler()
+    bundler.set_path(path)
+    bundler.set_executable(sys.executable)
+
+    assert bundler.bundle(poetry, io)
+
+    with (
+        path.open("rb") as f,
+        zstandard.ZstdDecompressor().stream_reader(f) as src,
+        tarfile.open(fileobj=src, mode="r|") as archive,
+    ):
+        names = {member.name for member in archive}
+
+    assert "foo/__init__.py" in names
+
+
+def test_bundler_rejects_unsupported_extensions(
+    io: BufferedIO, tmp_path: Path, poetry: Poetry
+) -> None:
+    bundler = TarBundler().set_path(tmp_path / "bundle.tar.bz2")
+
+    with pytest.raises(ValueError, match=r"Unsupported archive bundle\.tar\.bz2"):
+        bundler.bundle(poetry, io)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import json
+import marshal
+import os
 import shutil
 import sys
 
@@ -8,12 +11,12 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from cleo.formatters.style import Style
-from cleo.io.buffered_io import BufferedIO
+from poetry.core.masonry.builders.wheel import WheelBuilder
 from poetry.core.packages.dependency_group import MAIN_GROUP
 from poetry.core.packages.package import Package
 from poetry.core.packages.utils.link import Link
 from poetry.factory import Factory
+from poetry.installation.installer import Installer
 from poetry.installation.operations.install import Install
 from poetry.puzzle.exceptions import SolverProblemError
 from poetry.repositories.repository import Repository
@@ -23,40 +26,21 @@ from poetry.utils.env import MockEnv
 from poetry.utils.env import VirtualEnv
 
 from poetry_plugin_bundle.bundlers.venv_bundler import VenvBundler
+from poetry_plugin_bundle.utils import fingerprint
+from poetry_plugin_bundle.utils.env import InterpreterEnv
+from poetry_plugin_bundle.utils.locker import BundleLocker
+from poetry_plugin_bundle.utils.manifest import BundleManifest
+from poetry_plugin_bundle.utils.manifest import InstalledDistribution
+from poetry_plugin_bundle.utils.matrix import bundle_matrix
 
 
 if TYPE_CHECKING:
+    from cleo.io.buffered_io import BufferedIO
     from poetry.config.config import Config
     from poetry.poetry import Poetry
     from pytest_mock import MockerFixture
 
 
-@pytest.fixture()
-def io() -> BufferedIO:
-    io = BufferedIO()
-
-    io.output.formatter.set_style("success", Style("green", options=["dark"]))
-    io.output.formatter.set_style("warning", Style("yellow", options=["dark"]))
-
-    return io
-
-
-@pytest.fixture()
-def poetry(config: Config) -> Poetry:
-    poetry = Factory().create_poetry(
-        Path(__file__).parent.parent / "fixtures" / "simple_project"
-    )
-    poetry.set_config(config)
-
-    pool = RepositoryPool()
-    repository = Repository("repo")
-    repository.add_package(Package("foo", "1.0.0"))
-    pool.add_repository(repository)
-    poetry.set_pool(pool)
-
-    return poetry
-
-
 def _create_venv_marker_file(tempdir: str | Path) -> Path:
     marker_file = Path(tempdir) / "existing-venv-marker.txt"
     marker_file.write_text("This file should get deleted as part of venv recreation.")
@@ -491,3 +475,526 @@ def test_bundler_platform_override(
     assert "musllinux_1_2_aarch64" in installed_link_by_package["cryptography"]
     assert "musllinux_1_2_aarch64" in installed_link_by_package["cffi"]
     assert "py3-none-any.whl" in installed_link_by_package["pycparser"]
+
+
+def test_bundler_reuses_cached_bundle(
+    io: BufferedIO, tmp_path: Path, poetry: Poetry, mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.installation.executor.Executor._execute_operation")
+
+    first_path = tmp_path / "first"
+    bundler = VenvBundler()
+    bundler.set_path(first_path)
+    bundler.set_cache(True)
+
+    assert bundler.bundle(poetry, io)
+
+    expected = f"""\
+  • Bundling simple-project (1.2.3) into {first_path}
+  • Bundling simple-project (1.2.3) into {first_path}: Creating a virtual environment using Poetry-determined Python
+  • Bundling simple-project (1.2.3) into {first_path}: Installing dependencies
+  • Bundling simple-project (1.2.3) into {first_path}: Installing simple-project (1.2.3)
+  • Bundling simple-project (1.2.3) into {first_path}: Storing bundle in cache
+  • Bundled simple-project (1.2.3) into {first_path}
+"""
+    assert expected == io.fetch_output()
+
+    create_venv = mocker.patch("poetry.utils.env.EnvManager.create_venv")
+    second_path = tmp_path / "second"
+    bundler.set_path(second_path)
+
+    assert bundler.bundle(poetry, io)
+
+    create_venv.assert_not_called()
+    output = io.fetch_output()
+    assert f"{second_path}: Using cached bundle" in output
+
+    bundled_venv = VirtualEnv(second_path)
+    assert bundled_venv.is_sane()
+    activate = (bundled_venv.bin_dir / "activate").read_text(encoding="utf-8")
+    assert str(second_path) in activate
+    assert str(first_path) not in activate
+
+    # Existing bundles are only replaced by cached bundles with --clear
+    mocker.stop(create_venv)
+    assert bundler.bundle(poetry, io)
+    assert "Using cached bundle" not in io.fetch_output()
+
+    bundler.set_remove(True)
+    assert bundler.bundle(poetry, io)
+    assert "Using cached bundle" in io.fetch_output()
+
+
+def test_bundler_dedupes_cached_bundles(
+    io: BufferedIO, tmp_path: Path, poetry: Poetry, mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.installation.executor.Executor._execute_operation")
+
+    bundler = VenvBundler()
+    bundler.set_cache(True)
+    bundler.set_dedupe(True)
+    for path in (tmp_path / "first", tmp_path / "second"):
+        bundler.set_path(path)
+        assert bundler.bundle(poetry, io)
+
+    output = io.fetch_output()
+    assert "second: Using cached bundle" in output
+    assert "second: Deduplicating files" in output
+
+    # The environments are seeded with pip, which the manifests list
+    first, second = (
+        next(tmp_path.glob(f"{name}/lib/python*/site-packages")) / "pip" / "__init__.py"
+        for name in ("first", "second")
+    )
+    assert os.path.samefile(first, second)
+
+
+def test_bundler_recompiles_cached_bundles_for_their_path(
+    io: BufferedIO, tmp_path: Path, poetry: Poetry, mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.installation.executor.Executor._execute_operation")
+
+    bundler = VenvBundler()
+    bundler.set_cache(True)
+    bundler.set_compile(True)
+    bundler.set_compile_options("unchecked-hash")
+    for path in (tmp_path / "first", tmp_path / "second"):
+        bundler.set_path(path)
+        assert bundler.bundle(poetry, io)
+
+    assert "second: Using cached bundle" in io.fetch_output()
+
+    site_packages = next((tmp_path / "second").glob("lib/python*/site-packages"))
+    pycs = list(site_packages.glob("**/__pycache__/*.pyc"))
+    assert pycs
+    for pyc in pycs:
+        code = marshal.loads(pyc.read_bytes()[16:])
+        assert code.co_filename.startswith(str(site_packages))
+
+
+def test_bundler_skips_distributions_unchanged_since_last_bundle(
+    io: BufferedIO, tmp_venv: VirtualEnv, poetry: Poetry, mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.installation.executor.Executor._execute_operation")
+
+    bundler = VenvBundler()
+    bundler.set_path(tmp_venv.path)
+
+    assert bundler.bundle(poetry, io)
+
+    manifest = BundleManifest.read(tmp_venv.path)
+    assert manifest is not None
+    manifest.distributions["foo"] = InstalledDistribution(
+        name="foo", version="1.0.0", hash="sha256:foo", files=[]
+    )
+    manifest.write(tmp_venv.path)
+    mocker.patch(
+        "poetry_plugin_bundle.utils.manifest.locked_hashes",
+        return_value={"sha256:foo"},
+    )
+    load_installed = mocker.patch(
+        "poetry.repositories.installed_repository.InstalledRepository.load"
+    )
+    installer_init = mocker.spy(Installer, "__init__")
+
+    assert bundler.bundle(poetry, io)
+
+    load_installed.assert_not_called()
+    installed = installer_init.call_args.kwargs["installed"]
+    assert [package.name for package in installed.packages] == ["foo"]
+
+
+def test_bundler_keeps_seeded_pip_across_bundles(
+    io: BufferedIO, tmp_path: Path, poetry: Poetry, mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.installation.executor.Executor._execute_operation")
+
+    path = tmp_path / "bundle"
+    bundler = VenvBundler()
+    bundler.set_path(path)
+
+    assert bundler.bundle(poetry, io)
+
+    site_packages = next(path.glob("lib/python*/site-packages"))
+    assert (site_packages / "pip" / "__init__.py").exists()
+
+    assert bundler.bundle(poetry, io)
+
+    assert (site_packages / "pip" / "__init__.py").exists()
+    assert list(site_packages.glob("pip-*.dist-info"))
+
+
+def test_bundler_skips_up_to_date_bundles_if_stale_only(
+    io: BufferedIO, tmp_venv: VirtualEnv, poetry: Poetry, mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.installation.executor.Executor._execute_operation")
+
+    bundler = VenvBundler()
+    bundler.set_path(tmp_venv.path)
+    bundler.set_if_stale(True)
+
+    assert bundler.bundle(poetry, io)
+    io.clear_output()
+
+    env_manager = mocker.spy(EnvManager, "__init__")
+    assert bundler.bundle(poetry, io)
+
+    env_manager.assert_not_called()
+    path = str(tmp_venv.path)
+    expected = f"""\
+  • Bundled simple-project (1.2.3) into {path}: Already up to date
+"""
+    assert expected == io.fetch_output()
+
+    bundler.set_compile(True)
+    assert bundler.bundle(poetry, io)
+
+    env_manager.assert_called_once()
+    assert "Already up to date" not in io.fetch_output()
+
+
+def test_bundler_hashes_project_sources_once(
+    io: BufferedIO, tmp_venv: VirtualEnv, poetry: Poetry, mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.installation.executor.Executor._execute_operation")
+    project_sources_hash = mocker.spy(fingerprint, "project_sources_hash")
+
+    bundler = VenvBundler()
+    bundler.set_path(tmp_venv.path)
+
+    assert bundler.bundle(poetry, io)
+
+    # The fingerprint is only computed for --if-stale and --cache
+    assert project_sources_hash.call_count == 1
+    assert fingerprint.read_bundle_fingerprint(tmp_venv.path) is None
+
+    bundler.set_if_stale(True)
+    bundler.set_cache(True)
+    assert bundler.bundle(poetry, io)
+
+    assert project_sources_hash.call_count == 2
+    assert fingerprint.read_bundle_fingerprint(tmp_venv.path) is not None
+
+
+def test_bundler_reuses_cached_root_wheel(
+    io: BufferedIO, tmp_venv: VirtualEnv, poetry: Poetry, mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.installation.executor.Executor._execute_operation")
+    make_in = mocker.spy(WheelBuilder, "make_in")
+
+    bundler = VenvBundler()
+    bundler.set_path(tmp_venv.path)
+
+    assert bundler.bundle(poetry, io)
+    io.clear_output()
+    assert bundler.bundle(poetry, io)
+
+    assert make_in.call_count == 1
+    path = str(tmp_venv.path)
+    expected = f"""\
+  • Bundling simple-project (1.2.3) into {path}
+  • Bundling simple-project (1.2.3) into {path}: Creating a virtual environment using Poetry-determined Python
+  • Bundling simple-project (1.2.3) into {path}: Installing dependencies
+  • Bundling simple-project (1.2.3) into {path}: Installing simple-project (1.2.3) from cached wheel
+  • Bundled simple-project (1.2.3) into {path}
+"""
+    assert expected == io.fetch_output()
+
+
+def test_bundler_prefetches_artifacts_for_new_venvs_only(
+    io: BufferedIO, tmpdir: str, poetry: Poetry, mocker: MockerFixture
+) -> None:
+    shutil.rmtree(tmpdir)
+    mocker.patch("poetry.installation.executor.Executor._execute_operation")
+    prefetch = mocker.patch("poetry_plugin_bundle.utils.prefetch.prefetch_artifacts")
+
+    bundler = VenvBundler()
+    bundler.set_path(Path(tmpdir))
+    bundler.set_executable(sys.executable)
+
+    assert bundler.bundle(poetry, io)
+
+    prefetch.assert_called_once()
+    env = prefetch.call_args.args[1]
+    assert isinstance(env, InterpreterEnv)
+    assert env.marker_env["python_full_version"] == ".".join(
+        str(v) for v in sys.version_info[:3]
+    )
+
+    prefetch.reset_mock()
+    assert bundler.bundle(poetry, io)
+
+    prefetch.assert_not_called()
+
+
+def test_bundler_caches_interpreter_probes(
+    io: BufferedIO, tmp_path: Path, poetry: Poetry, mocker: MockerFixture
+) -> None:
+    from poetry.utils.env.script_strings import GET_ENVIRONMENT_DATA
+
+    mocker.patch("poetry.installation.executor.Executor._execute_operation")
+    run_python_script = mocker.spy(VirtualEnv, "run_python_script")
+
+    bundler = VenvBundler()
+    bundler.set_path(tmp_path / "bundle")
+    bundler.set_executable(sys.executable)
+
+    assert bundler.bundle(poetry, io)
+    assert any(
+        call.args[1] == GET_ENVIRONMENT_DATA
+        for call in run_python_script.call_args_list
+    )
+
+    run_python_script.reset_mock()
+    assert bundler.bundle(poetry, io)
+
+    assert not any(
+        call.args[1] == GET_ENVIRONMENT_DATA
+        for call in run_python_script.call_args_list
+    )
+
+
+def test_bundler_clones_virtual_environments_from_templates(
+    io: BufferedIO, tmp_path: Path, poetry: Poetry, mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.installation.executor.Executor._execute_operation")
+    build_venv = mocker.spy(EnvManager, "build_venv")
+
+    for name in ("first", "second"):
+        bundler = VenvBundler()
+        bundler.set_path(tmp_path / name)
+        bundler.set_executable(sys.executable)
+        assert bundler.bundle(poetry, io)
+
+    assert build_venv.call_count == 1
+    second = tmp_path / "second"
+    assert str(second) in (second / "bin" / "activate").read_text(encoding="utf-8")
+    assert VirtualEnv(second).marker_env["sys_platform"] == sys.platform
+
+
+def test_bundler_makes_relocatable_bundles(
+    io: BufferedIO, tmp_path: Path, poetry: Poetry, mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.installation.executor.Executor._execute_operation")
+
+    path = tmp_path / "bundle"
+    bundler = VenvBundler()
+    bundler.set_path(path)
+    bundler.set_executable(sys.executable)
+    bundler.set_relocatable(True)
+
+    assert bundler.bundle(poetry, io)
+
+    config = (path / "pyvenv.cfg").read_text(encoding="utf-8")
+    assert "relocatable = true" in config
+    assert str(path) not in config
+
+    moved = tmp_path / "moved"
+    shutil.move(path, moved)
+    assert VirtualEnv(moved).sys_path[-1].startswith(str(moved))
+
+
+def test_bundler_compiles_the_whole_environment(
+    io: BufferedIO, tmp_venv: VirtualEnv, poetry: Poetry, mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.installation.executor.Executor._execute_operation")
+    enable_bytecode_compilation = mocker.patch(
+        "poetry.installation.executor.Executor.enable_bytecode_compilation"
+    )
+    module = tmp_venv.purelib / "bundled_module.py"
+    module.write_text("VALUE = 1\n", encoding="utf-8")
+
+    bundler = VenvBundler()
+    bundler.set_path(tmp_venv.path)
+    bundler.set_compile(True)
+    bundler.set_compile_options("unchecked-hash", [2, 0])
+
+    assert bundler.bundle(poetry, io)
+
+    enable_bytecode_compilation.assert_called_once_with(False)
+
+    tag = sys.implementation.cache_tag
+    pycache = tmp_venv.purelib / "__pycache__"
+    for name in (f"bundled_module.{tag}.pyc", f"bundled_module.{tag}.opt-2.pyc"):
+        # Flags of unchecked hash-based bytecode files
+        assert (pycache / name).read_bytes()[4:8] == b"\x01\x00\x00\x00"
+    assert not (pycache / f"bundled_module.{tag}.opt-1.pyc").exists()
+
+    path = str(tmp_venv.path)
+    expected = f"""\
+  • Bundling simple-project (1.2.3) into {path}
+  • Bundling simple-project (1.2.3) into {path}: Creating a virtual environment using Poetry-determined Python
+  • Bundling simple-project (1.2.3) into {path}: Installing dependencies
+  • Bundling simple-project (1.2.3) into {path}: Installing simple-project (1.2.3)
+  • Bundling simple-project (1.2.3) into {path}: Compiling bytecode
+  • Bundled simple-project (1.2.3) into {path}
+"""
+    assert expected == io.fetch_output()
+
+
+def test_bundler_replaces_sources_by_bytecode(
+    io: BufferedIO, tmp_venv: VirtualEnv, poetry: Poetry, mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.installation.executor.Executor._execute_operation")
+    purelib = tmp_venv.purelib
+    for name in ("bundled_package", "templated_package"):
+        (purelib / name).mkdir()
+        (purelib / name / "__init__.py").write_text("VALUE = 1\n", encoding="utf-8")
+        dist_info = purelib / f"{name}-1.0.dist-info"
+        dist_info.mkdir()
+        (dist_info / "METADATA").write_text(
+            f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n", encoding="utf-8"
+        )
+        (dist_info / "RECORD").write_text(
+            f"{name}/__init__.py,,\n{dist_info.name}/RECORD,,\n", encoding="utf-8"
+        )
+    (purelib / "bundled_package" / "template.py").write_text(
+        "{% if value %}\n", encoding="utf-8"
+    )
+
+    bundler = VenvBundler()
+    bundler.set_path(tmp_venv.path)
+    bundler.set_compile(True)
+    bundler.set_sourceless(True, ["Templated_Package"])
+
+    assert bundler.bundle(poetry, io)
+
+    assert not (purelib / "bundled_package" / "__init__.py").exists()
+    assert (purelib / "bundled_package" / "__init__.pyc").exists()
+    assert not list(purelib.glob("bundled_package/__pycache__/__init__.*"))
+    # Sources failing to compile are kept
+    assert (purelib / "bundled_package" / "template.py").exists()
+    assert (purelib / "templated_package" / "__init__.py").exists()
+    assert not (purelib / "templated_package" / "__init__.pyc").exists()
+    assert (purelib / "bundled_package-1.0.dist-info" / "RECORD").read_text(
+        encoding="utf-8"
+    ) == "bundled_package/__init__.pyc,,\nbundled_package-1.0.dist-info/RECORD,,\n"
+    assert tmp_venv.run_python_script(
+        "import bundled_package; print(bundled_package.__file__)"
+    ).strip() == str(purelib / "bundled_package" / "__init__.pyc")
+
+
+def test_bundler_prunes_the_environment_within_a_size_budget(
+    io: BufferedIO, tmp_venv: VirtualEnv, poetry: Poetry, mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.installation.executor.Executor._execute_operation")
+    tests = tmp_venv.purelib / "bundled_package" / "tests"
+    tests.mkdir(parents=True)
+    (tests / "test_module.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (tmp_venv.purelib / "bundled_package" / "__init__.pyi").write_text(
+        "VALUE: int\n", encoding="utf-8"
+    )
+
+    bundler = VenvBundler()
+    bundler.set_path(tmp_venv.path)
+    bundler.set_prune(["tests"])
+    bundler.set_size_budget(1024**3)
+
+    assert bundler.bundle(poetry, io)
+
+    assert not tests.exists()
+    assert (tmp_venv.purelib / "bundled_package" / "__init__.pyi").exists()
+    assert "Pruned 1 file(s) and stripped 0 shared object(s)" in io.fetch_output()
+
+    bundler.set_size_budget(1024)
+
+    assert not bundler.bundle(poetry, io)
+    assert "exceeds the budget of 1.0 KiB" in io.fetch_output()
+
+
+def test_bundler_rejects_unknown_prune_rules() -> None:
+    with pytest.raises(ValueError, match="Invalid prune rules licenses"):
+        VenvBundler().set_prune(["tests", "licenses"])
+
+
+def test_bundler_reports_phases_and_statistics(
+    io: BufferedIO, tmpdir: str, poetry: Poetry, mocker: MockerFixture
+) -> None:
+    shutil.rmtree(tmpdir)
+    mocker.patch("poetry.installation.executor.Executor._execute_operation")
+    report = Path(tmpdir).parent / "report.json"
+
+    bundler = VenvBundler()
+    bundler.set_path(Path(tmpdir))
+    bundler.set_report("json", report)
+
+    assert bundler.bundle(poetry, io)
+
+    data = json.loads(report.read_text())
+    assert {"lock", "venv", "dependencies", "wheel", "root"} <= set(data["phases"])
+    assert set(data["packages"]) == {"foo", "simple-project"}
+    assert data["downloads"] == {"count": 0, "bytes": 0}
+    assert data["duration"] >= max(data["phases"].values())
+
+    bundler.set_report("text")
+    assert bundler.bundle(poetry, io)
+
+    assert "Slowest packages: foo" in io.fetch_output()
+
+
+def test_bundler_writes_a_trace_of_phases_and_packages(
+    io: BufferedIO, tmpdir: str, poetry: Poetry, mocker: MockerFixture
+) -> None:
+    shutil.rmtree(tmpdir)
+    mocker.patch("poetry.installation.executor.Executor._execute_operation")
+    trace = Path(tmpdir).parent / "trace.json"
+
+    bundler = VenvBundler()
+    bundler.set_path(Path(tmpdir))
+    bundler.set_trace(trace)
+
+    assert bundler.bundle(poetry, io)
+
+    events = json.loads(trace.read_text())["traceEvents"]
+    threads = {
+        event["tid"]: event["args"]["name"] for event in events if event["ph"] == "M"
+    }
+    spans = {
+        (event["cat"], event["name"]): event for event in events if event["ph"] == "X"
+    }
+
+    assert {("phase", "venv"), ("phase", "dependencies"), ("package", "foo")} <= set(
+        spans
+    )
+    # Packages are installed on the worker threads of the executor
+    assert spans["package", "foo"]["tid"] != spans["phase", "dependencies"]["tid"]
+    assert all(event["tid"] in threads for event in spans.values())
+
+
+def test_bundlers_of_a_matrix_share_the_lock_file(
+    io: BufferedIO, tmp_path: Path, poetry: Poetry, mocker: MockerFixture
+) -> None:
+    mocker.patch("poetry.installation.executor.Executor._execute_operation")
+    get_lock_data = mocker.spy(BundleLocker, "_get_lock_data")
+
+    locker = BundleLocker.from_poetry(poetry)
+    bundlers = [
+        VenvBundler().set_path(tmp_path / name).set_locker(locker)
+        for name in ["first", "second"]
+    ]
+
+    assert bundle_matrix(poetry, io, bundlers)
+
+    assert get_lock_data.call_count == 1
+    for name in ["first", "second"]:
+        assert BundleManifest.read(tmp_path / name) is not None
+
+
+def test_bundler_rejects_invalid_compile_options() -> None:
+    bundler = VenvBundler()
+
+    with pytest.raises(ValueError, match="invalidation mode 'sometimes'"):
+        bundler.set_compile_options("sometimes")
+
+    with pytest.raises(ValueError, match="optimization levels 0, 3"):
+        bundler.set_compile_options(optimization_levels=[3, 0])
+
+
+def test_bundler_rejects_invalid_report_formats() -> None:
+    with pytest.raises(ValueError, match="report format 'xml'"):
+        VenvBundler().set_report("xml")
+
+
+def test_bundler_rejects_unknown_installers() -> None:
+    with pytest.raises(ValueError, match="installer 'pip', expected one of"):
+        VenvBundler().set_installer("pip")
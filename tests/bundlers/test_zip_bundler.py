@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import sys
+import zipfile
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from poetry_plugin_bundle.bundlers.zip_bundler import ZipBundler
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from cleo.io.buffered_io import BufferedIO
+    from poetry.poetry import Poetry
+
+
+def test_bundler_streams_wheels_into_a_deterministic_archive(
+    io: BufferedIO, tmp_path: Path, poetry: Poetry, foo_wheel: Path
+) -> None:
+    path = tmp_path / "dist" / "bundle.zip"
+
+    bundler = ZipBundler()
+    bundler.set_path(path)
+    bundler.set_executable(sys.executable)
+
+    assert bundler.bundle(poetry, io)
+
+    expected = f"""\
+  • Bundling simple-project (1.2.3) into {path}
+  • Bundling simple-project (1.2.3) into {path}: Collecting dependencies for Python {sys.executable}
+  • Bundling simple-project (1.2.3) into {path}: Building simple-project (1.2.3)
+  • Bundling simple-project (1.2.3) into {path}: Writing archive
+  • Bundled simple-project (1.2.3) into {path}
+"""
+    assert expected == io.fetch_output()
+
+    with zipfile.ZipFile(path) as archive:
+        names = archive.namelist()
+        infos = archive.infolist()
+
+        assert archive.read("foo/__init__.py") == b"VALUE = 1\n"
+
+    assert names == sorted(names)
+    assert {"foo/__init__.py", "foo_extra.py", "simple_project/__init__.py"} <= set(
+        names
+    )
+    assert not [name for name in names if ".data/" in name]
+    assert {info.date_time for info in infos} == {(1980, 1, 1, 0, 0, 0)}
+
+    # Bundling again produces the exact same archive
+    other = tmp_path / "other.zip"
+    assert bundler.set_path(other).bundle(poetry, io)
+    assert other.read_bytes() == path.read_bytes()
+
+
+def test_bundler_includes_hash_based_bytecode(
+    io: BufferedIO, tmp_path: Path, poetry: Poetry, foo_wheel: Path
+) -> None:
+    path = tmp_path / "bundle.zip"
+
+    bundler = ZipBundler()
+    bundler.set_path(path)
+    bundler.set_executable(sys.executable)
+    bundler.set_compile(invalidation_mode="unchecked-hash")
+
+    assert bundler.bundle(poetry, io)
+
+    assert "Compiling bytecode" in io.fetch_output()
+
+    tag = sys.implementation.cache_tag
+    with zipfile.ZipFile(path) as archive:
+        names = set(archive.namelist())
+        pyc = archive.read(f"foo/__pycache__/__init__.{tag}.pyc")
+
+    # Flags of unchecked hash-based bytecode files
+    assert pyc[4:8] == b"\x01\x00\x00\x00"
+    assert f"simple_project/__pycache__/__init__.{tag}.pyc" in names
+    assert f"foo/__pycache__/broken.{tag}.pyc" not in names
+
+
+def test_bundler_rejects_timestamp_bytecode() -> None:
+    with pytest.raises(ValueError, match="invalidation mode 'timestamp'"):
+        ZipBundler().set_compile(invalidation_mode="timestamp")
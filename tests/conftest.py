@@ -19,6 +19,25 @@ if TYPE_CHECKING:
     from pytest_mock import MockerFixture
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        help="Run the benchmarks of tests/benchmarks, which are skipped otherwise.",
+    )
+    group.addoption(
+        "--benchmark-sizes",
+        default="10,100,1000",
+        help="Comma-separated numbers of packages of the benchmarked projects.",
+    )
+    group.addoption(
+        "--benchmark-json",
+        default=None,
+        help="Write the results of the benchmarks to the given JSON file.",
+    )
+
+
 @pytest.fixture
 def config_cache_dir(tmp_path: Path) -> Path:
     path = tmp_path / ".cache" / "pypoetry"
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from cleo.testers.application_tester import ApplicationTester
+    from pytest_mock import MockerFixture
+
+
+def test_batch_bundles_the_projects_of_a_manifest(
+    app_tester: ApplicationTester, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    bundle_batch = mocker.patch(
+        "poetry_plugin_bundle.console.commands.bundle.batch.bundle_batch",
+        return_value=True,
+    )
+    manifest = tmp_path / "bundles.toml"
+    manifest.write_text(
+        'workers = 3\n[[bundle]]\nproject = "api"\npath = "venv"\n', encoding="utf-8"
+    )
+
+    assert app_tester.execute(f"bundle batch {manifest}") == 0
+    assert app_tester.execute(f"bundle batch {manifest} --workers 2") == 0
+
+    assert [call.args[2] for call in bundle_batch.call_args_list] == [3, 2]
+    assert [job.path for job in bundle_batch.call_args_list[0].args[0]] == [
+        tmp_path / "api" / "venv"
+    ]
+
+    manifest.write_text("[[bundle]]\n", encoding="utf-8")
+    assert app_tester.execute(f"bundle batch {manifest}") == 1
+    assert "Invalid bundle job" in app_tester.io.fetch_error()
+
+
+def test_batch_rejects_invalid_workers(
+    app_tester: ApplicationTester, tmp_path: Path
+) -> None:
+    manifest = tmp_path / "bundles.toml"
+    manifest.write_text(
+        '[[bundle]]\nproject = "api"\npath = "venv"\n', encoding="utf-8"
+    )
+
+    assert app_tester.execute(f"bundle batch {manifest} --workers 0") == 1
+    assert "Invalid workers 0, expected a positive integer" in (
+        app_tester.io.fetch_error()
+    )
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from poetry_plugin_bundle.utils.bundle_cache import BundleCache
+from poetry_plugin_bundle.utils.dedupe import FileStore
+from poetry_plugin_bundle.utils.venv_templates import VenvTemplateCache
+
+
+if TYPE_CHECKING:
+    from cleo.testers.application_tester import ApplicationTester
+    from poetry.config.config import Config
+
+
+def test_cache_lists_and_prunes_bundles(
+    app_tester: ApplicationTester, config: Config, tmp_path: Path
+) -> None:
+    source = tmp_path / "venv"
+    source.mkdir()
+    (source / "data").write_bytes(b"x" * 2048)
+
+    cache = BundleCache.from_config(config)
+    cache.put("0123456789abcdef", source, "simple-project", "1.2.3")
+
+    assert app_tester.execute("bundle cache") == 0
+    output = app_tester.io.fetch_output()
+    assert "0123456789ab simple-project (1.2.3) 2.0 KiB" in output
+    assert f"1 bundle(s), 2.0 KiB in {cache.path}" in output
+
+    assert app_tester.execute("bundle cache --prune") == 1
+
+    assert app_tester.execute("bundle cache --prune --max-size 1K") == 0
+    assert "Removed 1 bundle(s) from the cache, freeing 2.0 KiB." in (
+        app_tester.io.fetch_output()
+    )
+    assert cache.entries() == []
+
+
+def test_cache_clear_removes_bundles_and_templates(
+    app_tester: ApplicationTester, config: Config, tmp_path: Path
+) -> None:
+    import sys
+
+    source = tmp_path / "venv"
+    source.mkdir()
+    BundleCache.from_config(config).put(
+        "0123456789abcdef", source, "simple-project", "1.2.3"
+    )
+
+    templates = VenvTemplateCache.from_config(config)
+    executable = Path(sys.executable)
+    templates.put(
+        VenvTemplateCache.key(executable, {}),
+        executable,
+        lambda path: path.mkdir(parents=True),
+    )
+
+    assert app_tester.execute("bundle cache --clear") == 0
+    assert (
+        "Removed 1 bundle(s), 1 virtual environment template(s)"
+        " and 0 shared file(s) from the cache." in app_tester.io.fetch_output()
+    )
+    assert BundleCache.from_config(config).entries() == []
+    assert list(templates.path.iterdir()) == []
+
+
+def test_cache_prune_removes_unused_shared_files(
+    app_tester: ApplicationTester, config: Config, tmp_path: Path
+) -> None:
+    store = FileStore.from_config(config)
+    module = tmp_path / "venv" / "module.py"
+    module.parent.mkdir()
+    module.write_bytes(b"x" * 2048)
+    store.link_files([module])
+
+    assert app_tester.execute("bundle cache --prune --max-age 30") == 0
+    assert "Removed 0 unused file(s) from the shared file store, freeing 0 B." in (
+        app_tester.io.fetch_output()
+    )
+
+    module.unlink()
+
+    assert app_tester.execute("bundle cache --prune --max-age 30") == 0
+    assert "Removed 1 unused file(s) from the shared file store, freeing 2.0 KiB." in (
+        app_tester.io.fetch_output()
+    )
+    assert list(store.path.iterdir()) == []
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import os
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from cleo.testers.application_tester import ApplicationTester
+
+
+def test_dedupe_links_identical_files_of_bundles(
+    app_tester: ApplicationTester, tmp_path: Path
+) -> None:
+    for bundle in ("first", "second"):
+        (tmp_path / bundle).mkdir()
+        (tmp_path / bundle / "data").write_bytes(b"x" * 2048)
+
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    assert app_tester.execute(f"bundle dedupe {first} {second}") == 0
+    assert "Linked 1 of 2 file(s), freeing 2.0 KiB." in app_tester.io.fetch_output()
+    assert os.path.samefile(first / "data", second / "data")
+
+    assert app_tester.execute(f"bundle dedupe {tmp_path / 'missing'}") == 1
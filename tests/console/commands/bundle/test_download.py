@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import sys
+
+from typing import TYPE_CHECKING
+
+from packaging.tags import Tag
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from cleo.testers.application_tester import ApplicationTester
+    from pytest_mock import MockerFixture
+
+
+def test_download_downloads_for_every_python_and_platform(
+    app_tester: ApplicationTester, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    download_wheelhouse = mocker.patch(
+        "poetry_plugin_bundle.console.commands.bundle.download.download_wheelhouse"
+    )
+
+    app_tester.application.catch_exceptions(False)
+    assert (
+        app_tester.execute(
+            f"bundle download {tmp_path} --only main --python {sys.executable}"
+            " --platform manylinux_2_28_x86_64 --platform macosx_11_0_arm64"
+        )
+        == 0
+    )
+
+    assert download_wheelhouse.call_count == 2
+    platforms = [
+        call.args[1].supported_tags_set for call in download_wheelhouse.call_args_list
+    ]
+    version = f"{sys.version_info[0]}{sys.version_info[1]}"
+    assert Tag(f"py{version}", "none", "manylinux_2_28_x86_64") in platforms[0]
+    assert Tag(f"py{version}", "none", "macosx_11_0_arm64") in platforms[1]
+    assert {call.args[3].path for call in download_wheelhouse.call_args_list} == {
+        tmp_path
+    }
+    assert download_wheelhouse.call_args_list[0].args[4] == {"main"}
+    assert "Added 0 archive(s)" in app_tester.io.fetch_output()
+
+
+def test_download_requires_a_lock_file(
+    app_tester: ApplicationTester, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    mocker.patch(
+        "poetry_plugin_bundle.utils.locker.BundleLocker.is_locked", return_value=False
+    )
+
+    assert app_tester.execute(f"bundle download {tmp_path}") == 1
+    assert "The project has no lock file" in app_tester.io.fetch_error()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from poetry_plugin_bundle.bundlers.oci_bundler import OciBundler
+
+
+if TYPE_CHECKING:
+    from cleo.testers.application_tester import ApplicationTester
+    from pytest_mock import MockerFixture
+
+
+def test_zip_calls_oci_bundler(
+    app_tester: ApplicationTester, mocker: MockerFixture
+) -> None:
+    mock = mocker.patch(
+        "poetry_plugin_bundle.bundlers.oci_bundler.OciBundler.bundle",
+        side_effect=[True, False],
+    )
+    set_path = mocker.spy(OciBundler, "set_path")
+    set_executable = mocker.spy(OciBundler, "set_executable")
+    set_compile = mocker.spy(OciBundler, "set_compile")
+    set_platform = mocker.spy(OciBundler, "set_platform")
+    set_activated_groups = mocker.spy(OciBundler, "set_activated_groups")
+    set_target = mocker.spy(OciBundler, "set_target")
+    set_tag = mocker.spy(OciBundler, "set_tag")
+
+    app_tester.application.catch_exceptions(False)
+    assert app_tester.execute("bundle oci /image") == 0
+    assert (
+        app_tester.execute(
+            "bundle oci /image --python python3.12 --compile-mode unchecked-hash"
+            " --platform manylinux_2_28_x86_64 --only main --target /opt/app --tag latest"
+        )
+        == 1
+    )
+
+    assert mock.call_count == 2
+    assert set_path.call_args_list == [
+        mocker.call(mocker.ANY, Path("/image")),
+        mocker.call(mocker.ANY, Path("/image")),
+    ]
+    assert set_executable.call_args_list == [
+        mocker.call(mocker.ANY, None),
+        mocker.call(mocker.ANY, "python3.12"),
+    ]
+    assert set_compile.call_args_list == [
+        mocker.call(mocker.ANY, False, None),
+        mocker.call(mocker.ANY, False, "unchecked-hash"),
+    ]
+    assert set_platform.call_args_list == [
+        mocker.call(mocker.ANY, None),
+        mocker.call(mocker.ANY, "manylinux_2_28_x86_64"),
+    ]
+    assert set_activated_groups.call_args_list == [
+        mocker.call(mocker.ANY, {"main"}),
+        mocker.call(mocker.ANY, {"main"}),
+    ]
+    assert set_target.call_args_list == [
+        mocker.call(mocker.ANY, "/app"),
+        mocker.call(mocker.ANY, "/opt/app"),
+    ]
+    assert set_tag.call_args_list == [
+        mocker.call(mocker.ANY, "1.2.3"),
+        mocker.call(mocker.ANY, "latest"),
+    ]
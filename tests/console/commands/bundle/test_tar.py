@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from poetry_plugin_bundle.bundlers.tar_bundler import TarBundler
+
+
+if TYPE_CHECKING:
+    from cleo.testers.application_tester import ApplicationTester
+    from pytest_mock import MockerFixture
+
+
+def test_zip_calls_tar_bundler(
+    app_tester: ApplicationTester, mocker: MockerFixture
+) -> None:
+    mock = mocker.patch(
+        "poetry_plugin_bundle.bundlers.tar_bundler.TarBundler.bundle",
+        side_effect=[True, False],
+    )
+    set_path = mocker.spy(TarBundler, "set_path")
+    set_executable = mocker.spy(TarBundler, "set_executable")
+    set_compile = mocker.spy(TarBundler, "set_compile")
+    set_platform = mocker.spy(TarBundler, "set_platform")
+    set_activated_groups = mocker.spy(TarBundler, "set_activated_groups")
+    set_compression_level = mocker.spy(TarBundler, "set_compression_level")
+
+    app_tester.application.catch_exceptions(False)
+    assert app_tester.execute("bundle tar /foo.tar.zst") == 0
+    assert (
+        app_tester.execute(
+            "bundle tar /foo.tar.zst --python python3.12 --compile-mode unchecked-hash"
+            " --platform manylinux_2_28_x86_64 --only main --compression-level 19"
+        )
+        == 1
+    )
+
+    assert mock.call_count == 2
+    assert set_path.call_args_list == [
+        mocker.call(mocker.ANY, Path("/foo.tar.zst")),
+        mocker.call(mocker.ANY, Path("/foo.tar.zst")),
+    ]
+    assert set_executable.call_args_list == [
+        mocker.call(mocker.ANY, None),
+        mocker.call(mocker.ANY, "python3.12"),
+    ]
+    assert set_compile.call_args_list == [
+        mocker.call(mocker.ANY, False, None),
+        mocker.call(mocker.ANY, False, "unchecked-hash"),
+    ]
+    assert set_platform.call_args_list == [
+        mocker.call(mocker.ANY, None),
+        mocker.call(mocker.ANY, "manylinux_2_28_x86_64"),
+    ]
+    assert set_activated_groups.call_args_list == [
+        mocker.call(mocker.ANY, {"main"}),
+        mocker.call(mocker.ANY, {"main"}),
+    ]
+    assert set_compression_level.call_args_list == [
+        mocker.call(mocker.ANY, None),
+        mocker.call(mocker.ANY, 19),
+    ]
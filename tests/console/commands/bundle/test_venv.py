@@ -3,7 +3,10 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import pytest
+
 from poetry.console.application import Application
+from poetry.console.exceptions import GroupNotFoundError
 
 from poetry_plugin_bundle.bundlers.venv_bundler import VenvBundler
 
@@ -81,3 +84,279 @@ def test_venv_calls_venv_bundler(
         mocker.call(mocker.ANY, False),
         mocker.call(mocker.ANY, True),
     ]
+
+
+def test_venv_passes_compile_options(
+    app_tester: ApplicationTester, mocker: MockerFixture
+) -> None:
+    mocker.patch(
+        "poetry_plugin_bundle.bundlers.venv_bundler.VenvBundler.bundle",
+        return_value=True,
+    )
+    set_compile_options = mocker.spy(VenvBundler, "set_compile_options")
+
+    app_tester.application.catch_exceptions(False)
+    assert app_tester.execute("bundle venv /foo") == 0
+    assert (
+        app_tester.execute(
+            "bundle venv /foo --compile-mode unchecked-hash --optimize 2 --optimize 0"
+        )
+        == 0
+    )
+
+    assert set_compile_options.call_args_list == [
+        mocker.call(mocker.ANY, None, []),
+        mocker.call(mocker.ANY, "unchecked-hash", [2, 0]),
+    ]
+
+    assert app_tester.execute("bundle venv /foo --optimize 1 --optimize abc") == 1
+    assert set_compile_options.call_count == 2
+    assert (
+        app_tester.io.fetch_error()
+        == "Invalid bytecode optimization levels abc, expected some of: 0, 1, 2\n"
+    )
+
+
+def test_venv_passes_report_options(
+    app_tester: ApplicationTester, mocker: MockerFixture
+) -> None:
+    mocker.patch(
+        "poetry_plugin_bundle.bundlers.venv_bundler.VenvBundler.bundle",
+        return_value=True,
+    )
+    set_report = mocker.spy(VenvBundler, "set_report")
+    set_trace = mocker.spy(VenvBundler, "set_trace")
+
+    app_tester.application.catch_exceptions(False)
+    assert app_tester.execute("bundle venv /foo") == 0
+    assert app_tester.execute("bundle venv /foo --report json") == 0
+    assert (
+        app_tester.execute(
+            "bundle venv /foo --report-file /report.txt --trace /trace.json"
+        )
+        == 0
+    )
+
+    assert set_report.call_args_list == [
+        mocker.call(mocker.ANY, None, None),
+        mocker.call(mocker.ANY, "json", None),
+        mocker.call(mocker.ANY, "text", Path("/report.txt")),
+    ]
+    assert set_trace.call_args_list == [
+        mocker.call(mocker.ANY, None),
+        mocker.call(mocker.ANY, None),
+        mocker.call(mocker.ANY, Path("/trace.json")),
+    ]
+
+
+def test_venv_passes_relocatable_option(
+    app_tester: ApplicationTester, mocker: MockerFixture
+) -> None:
+    mocker.patch(
+        "poetry_plugin_bundle.bundlers.venv_bundler.VenvBundler.bundle",
+        return_value=True,
+    )
+    set_relocatable = mocker.spy(VenvBundler, "set_relocatable")
+
+    app_tester.application.catch_exceptions(False)
+    assert app_tester.execute("bundle venv /foo") == 0
+    assert app_tester.execute("bundle venv /foo --relocatable") == 0
+
+    assert set_relocatable.call_args_list == [
+        mocker.call(mocker.ANY, False),
+        mocker.call(mocker.ANY, True),
+    ]
+
+
+def test_venv_passes_dedupe_option(
+    app_tester: ApplicationTester, mocker: MockerFixture
+) -> None:
+    mocker.patch(
+        "poetry_plugin_bundle.bundlers.venv_bundler.VenvBundler.bundle",
+        return_value=True,
+    )
+    set_dedupe = mocker.spy(VenvBundler, "set_dedupe")
+
+    app_tester.application.catch_exceptions(False)
+    assert app_tester.execute("bundle venv /foo") == 0
+    assert app_tester.execute("bundle venv /foo --dedupe") == 0
+
+    assert set_dedupe.call_args_list == [
+        mocker.call(mocker.ANY, False),
+        mocker.call(mocker.ANY, True),
+    ]
+
+
+def test_venv_passes_prune_and_sourceless_options(
+    app_tester: ApplicationTester, mocker: MockerFixture
+) -> None:
+    mocker.patch(
+        "poetry_plugin_bundle.bundlers.venv_bundler.VenvBundler.bundle",
+        return_value=True,
+    )
+    set_prune = mocker.spy(VenvBundler, "set_prune")
+    set_prune_packages = mocker.spy(VenvBundler, "set_prune_packages")
+    set_size_budget = mocker.spy(VenvBundler, "set_size_budget")
+    set_sourceless = mocker.spy(VenvBundler, "set_sourceless")
+
+    app_tester.application.catch_exceptions(False)
+    assert (
+        app_tester.execute(
+            "bundle venv /foo --prune tests --prune docs --strip --size-budget 250M"
+            " --sourceless --keep-sources jinja2 --prune-package foo.tests"
+        )
+        == 0
+    )
+
+    set_prune.assert_called_once_with(mocker.ANY, ["tests", "docs"], True)
+    set_prune_packages.assert_called_once_with(mocker.ANY, ["foo.tests"])
+    set_size_budget.assert_called_once_with(mocker.ANY, 250 * 1024**2)
+    set_sourceless.assert_called_once_with(mocker.ANY, True, ["jinja2"])
+
+
+def test_venv_bundles_a_matrix_of_targets(
+    app_tester: ApplicationTester, mocker: MockerFixture
+) -> None:
+    mock = mocker.patch(
+        "poetry_plugin_bundle.bundlers.venv_bundler.VenvBundler.bundle",
+        side_effect=[True, True, True, False],
+    )
+    set_path = mocker.spy(VenvBundler, "set_path")
+    set_locker = mocker.spy(VenvBundler, "set_locker")
+
+    app_tester.application.catch_exceptions(False)
+    assert (
+        app_tester.execute(
+            "bundle venv /dist/{python}-{platform} --python python3.11"
+            " --python python3.12 --platform manylinux_2_28_x86_64"
+            " --platform musllinux_1_2_x86_64"
+        )
+        == 1
+    )
+
+    assert mock.call_count == 4
+    assert {call.args[1] for call in set_path.call_args_list} >= {
+        Path("/dist/python3.11-manylinux_2_28_x86_64"),
+        Path("/dist/python3.11-musllinux_1_2_x86_64"),
+        Path("/dist/python3.12-manylinux_2_28_x86_64"),
+        Path("/dist/python3.12-musllinux_1_2_x86_64"),
+    }
+    # Every bundle shares the same lock file
+    assert len({id(call.args[1]) for call in set_locker.call_args_list}) == 1
+
+
+def test_venv_bundles_each_group_set(
+    app_tester: ApplicationTester, mocker: MockerFixture
+) -> None:
+    mocker.patch(
+        "poetry_plugin_bundle.bundlers.venv_bundler.VenvBundler.bundle",
+        return_value=True,
+    )
+    set_path = mocker.spy(VenvBundler, "set_path")
+    set_activated_groups = mocker.spy(VenvBundler, "set_activated_groups")
+
+    app_tester.application.catch_exceptions(False)
+    assert (
+        app_tester.execute(
+            "bundle venv /dist/{groups} --group-set main --group-set main,dev"
+        )
+        == 0
+    )
+
+    paths = [call.args[1] for call in set_path.call_args_list]
+    groups = [call.args[1] for call in set_activated_groups.call_args_list]
+    assert dict(zip(paths, groups, strict=True)) == {
+        Path("/dist/main"): {"main"},
+        Path("/dist/dev-main"): {"main", "dev"},
+    }
+
+    with pytest.raises(GroupNotFoundError, match="Group\\(s\\) not found: docs"):
+        app_tester.execute("bundle venv /dist/{groups} --group-set main,docs")
+
+
+def test_venv_passes_find_links_options(
+    app_tester: ApplicationTester, mocker: MockerFixture
+) -> None:
+    mocker.patch(
+        "poetry_plugin_bundle.bundlers.venv_bundler.VenvBundler.bundle",
+        return_value=True,
+    )
+    set_find_links = mocker.spy(VenvBundler, "set_find_links")
+
+    app_tester.application.catch_exceptions(False)
+    assert app_tester.execute("bundle venv /foo") == 0
+    assert app_tester.execute("bundle venv /foo --find-links /wheels --offline") == 0
+
+    assert set_find_links.call_args_list == [
+        mocker.call(mocker.ANY, None, False),
+        mocker.call(mocker.ANY, Path("/wheels"), True),
+    ]
+
+    with pytest.raises(ValueError, match="Offline bundles require a wheelhouse"):
+        app_tester.execute("bundle venv /foo --offline")
+
+
+def test_venv_passes_installer_option(
+    app_tester: ApplicationTester, mocker: MockerFixture
+) -> None:
+    mocker.patch(
+        "poetry_plugin_bundle.bundlers.venv_bundler.VenvBundler.bundle",
+        return_value=True,
+    )
+    set_installer = mocker.spy(VenvBundler, "set_installer")
+
+    app_tester.application.catch_exceptions(False)
+    assert app_tester.execute("bundle venv /foo") == 0
+    assert app_tester.execute("bundle venv /foo --installer bundle") == 0
+
+    assert set_installer.call_args_list == [
+        mocker.call(mocker.ANY, "poetry"),
+        mocker.call(mocker.ANY, "bundle"),
+    ]
+
+    with pytest.raises(ValueError, match="Invalid installer 'pip'"):
+        app_tester.execute("bundle venv /foo --installer pip")
+
+
+def test_venv_substitutes_placeholders_for_a_single_target(
+    app_tester: ApplicationTester, mocker: MockerFixture
+) -> None:
+    mocker.patch(
+        "poetry_plugin_bundle.bundlers.venv_bundler.VenvBundler.bundle",
+        return_value=True,
+    )
+    set_path = mocker.spy(VenvBundler, "set_path")
+    set_report = mocker.spy(VenvBundler, "set_report")
+
+    app_tester.application.catch_exceptions(False)
+    assert (
+        app_tester.execute(
+            "bundle venv /dist/{python}-{platform} --python python3.12"
+            " --report-file /reports/{python}.txt"
+        )
+        == 0
+    )
+
+    set_path.assert_called_once_with(mocker.ANY, Path("/dist/python3.12-native"))
+    set_report.assert_called_once_with(
+        mocker.ANY, "text", Path("/reports/python3.12.txt")
+    )
+
+
+def test_venv_requires_distinct_report_and_trace_files_for_a_matrix(
+    app_tester: ApplicationTester, mocker: MockerFixture
+) -> None:
+    bundle = mocker.patch(
+        "poetry_plugin_bundle.bundlers.venv_bundler.VenvBundler.bundle",
+        return_value=True,
+    )
+
+    app_tester.application.catch_exceptions(False)
+    for option in ("--report-file", "--trace"):
+        with pytest.raises(ValueError, match=r"path /reports/bundle.json must tell"):
+            app_tester.execute(
+                "bundle venv /dist/{python} --python python3.11 --python python3.12"
+                f" {option} /reports/bundle.json"
+            )
+
+    bundle.assert_not_called()
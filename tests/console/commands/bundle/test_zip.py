@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from poetry_plugin_bundle.bundlers.zip_bundler import ZipBundler
+
+
+if TYPE_CHECKING:
+    from cleo.testers.application_tester import ApplicationTester
+    from pytest_mock import MockerFixture
+
+
+def test_zip_calls_zip_bundler(
+    app_tester: ApplicationTester, mocker: MockerFixture
+) -> None:
+    mock = mocker.patch(
+        "poetry_plugin_bundle.bundlers.zip_bundler.ZipBundler.bundle",
+        side_effect=[True, False],
+    )
+    set_path = mocker.spy(ZipBundler, "set_path")
+    set_executable = mocker.spy(ZipBundler, "set_executable")
+    set_compile = mocker.spy(ZipBundler, "set_compile")
+    set_platform = mocker.spy(ZipBundler, "set_platform")
+    set_activated_groups = mocker.spy(ZipBundler, "set_activated_groups")
+
+    app_tester.application.catch_exceptions(False)
+    assert app_tester.execute("bundle zip /foo.zip") == 0
+    assert (
+        app_tester.execute(
+            "bundle zip /foo.zip --python python3.12 --compile-mode unchecked-hash"
+            " --platform manylinux_2_28_x86_64 --only main"
+        )
+        == 1
+    )
+
+    assert mock.call_count == 2
+    assert set_path.call_args_list == [
+        mocker.call(mocker.ANY, Path("/foo.zip")),
+        mocker.call(mocker.ANY, Path("/foo.zip")),
+    ]
+    assert set_executable.call_args_list == [
+        mocker.call(mocker.ANY, None),
+        mocker.call(mocker.ANY, "python3.12"),
+    ]
+    assert set_compile.call_args_list == [
+        mocker.call(mocker.ANY, False, None),
+        mocker.call(mocker.ANY, False, "unchecked-hash"),
+    ]
+    assert set_platform.call_args_list == [
+        mocker.call(mocker.ANY, None),
+        mocker.call(mocker.ANY, "manylinux_2_28_x86_64"),
+    ]
+    assert set_activated_groups.call_args_list == [
+        mocker.call(mocker.ANY, {"main"}),
+        mocker.call(mocker.ANY, {"main"}),
+    ]
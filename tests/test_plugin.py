@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from poetry_plugin_bundle.plugin import COMMANDS
+from poetry_plugin_bundle.plugin import BundleApplicationPlugin
+from poetry_plugin_bundle.plugin import load_command
+
+
+# Imports the plugin and activates it, as Poetry does for every command,
+# then lists the modules it imported on top of the ones of Poetry.
+ACTIVATE_PLUGIN = """\
+import sys
+
+from poetry.console.application import Application
+
+application = Application()
+modules = set(sys.modules)
+
+from poetry_plugin_bundle.plugin import BundleApplicationPlugin
+
+BundleApplicationPlugin().activate(application)
+
+print("\\n".join(sorted(set(sys.modules) - modules)))
+"""
+
+
+def test_plugin_activation_does_not_import_commands_or_bundlers() -> None:
+    output = subprocess.run(
+        [sys.executable, "-c", ACTIVATE_PLUGIN],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+    # Poetry imports its plugin base classes anyway to load plugins
+    imported = [
+        name for name in output.split() if not name.startswith("poetry.plugins")
+    ]
+    assert imported == ["poetry_plugin_bundle", "poetry_plugin_bundle.plugin"]
+
+
+def test_plugin_commands_match_the_command_names() -> None:
+    commands = BundleApplicationPlugin().commands
+
+    assert [command.name for command in commands] == COMMANDS
+
+
+def test_loaded_bundle_commands_have_a_bundler_manager() -> None:
+    command = load_command("bundle venv")()
+
+    assert getattr(command, "bundler_manager", None) is not None
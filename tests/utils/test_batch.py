@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import shutil
+import threading
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cleo.io.buffered_io import BufferedIO
+from poetry.factory import Factory
+
+from poetry_plugin_bundle.bundlers.venv_bundler import VenvBundler
+from poetry_plugin_bundle.utils.batch import BatchManifest
+from poetry_plugin_bundle.utils.batch import bundle_batch
+
+
+if TYPE_CHECKING:
+    from cleo.io.io import IO
+    from poetry.config.config import Config
+    from poetry.poetry import Poetry
+    from pytest_mock import MockerFixture
+
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+def test_batch_manifest_reads_jobs(tmp_path: Path) -> None:
+    manifest = tmp_path / "bundles.toml"
+    manifest.write_text(
+        """\
+workers = 2
+
+[[bundle]]
+project = "services/api"
+path = "dist/venv"
+groups = ["main"]
+
+[[bundle]]
+project = "services/api"
+path = "dist/venv-3.12"
+python = "python3.12"
+""",
+        encoding="utf-8",
+    )
+
+    batch = BatchManifest.read(manifest)
+
+    assert batch.workers == 2
+    assert [job.path for job in batch.jobs] == [
+        tmp_path / "services" / "api" / "dist" / "venv",
+        tmp_path / "services" / "api" / "dist" / "venv-3.12",
+    ]
+    assert batch.jobs[0].groups == frozenset({"main"})
+    assert batch.jobs[1].python == "python3.12"
+
+
+@pytest.mark.parametrize(
+    ("content", "error"),
+    [
+        ("", "expected at least one [[bundle]]"),
+        ("workers = 0\n[[bundle]]\n", "workers must be a positive integer"),
+        ("[[bundle]]\nproject = 'api'\n", "bundle 1: Invalid bundle job"),
+        (
+            "[[bundle]]\nproject = 'api'\npath = 'venv'\n" * 2,
+            "bundle paths must be unique",
+        ),
+    ],
+)
+def test_batch_manifest_rejects_invalid_manifests(
+    tmp_path: Path, content: str, error: str
+) -> None:
+    manifest = tmp_path / "bundles.toml"
+    manifest.write_text(content, encoding="utf-8")
+
+    with pytest.raises(ValueError, match=f"Invalid batch manifest {manifest}: ") as e:
+        BatchManifest.read(manifest)
+
+    assert error in str(e.value)
+
+
+def test_bundle_batch_loads_each_project_once(
+    tmp_path: Path, config: Config, mocker: MockerFixture
+) -> None:
+    for name in ("api", "worker"):
+        shutil.copytree(FIXTURES / "simple_project", tmp_path / name)
+    manifest = tmp_path / "bundles.toml"
+    manifest.write_text(
+        "".join(
+            f'[[bundle]]\nproject = "{project}"\npath = "{path}"\n'
+            for project, path in (("api", "a"), ("api", "b"), ("worker", "a"))
+        ),
+        encoding="utf-8",
+    )
+    bundle = mocker.patch.object(VenvBundler, "bundle", side_effect=[True, True, True])
+    create_poetry = mocker.spy(Factory, "create_poetry")
+
+    assert bundle_batch(BatchManifest.read(manifest).jobs, BufferedIO(), workers=2)
+
+    assert create_poetry.call_count == 2
+    pools = {id(call.args[0].pool) for call in bundle.call_args_list}
+    assert len(pools) == 2
+    artifact_caches = {
+        id(call.args[0].pool.artifact_cache) for call in bundle.call_args_list
+    }
+    assert len(artifact_caches) == 1
+
+
+def test_bundle_batch_accepts_paths_outside_of_the_project(
+    tmp_path: Path, config: Config, mocker: MockerFixture
+) -> None:
+    shutil.copytree(FIXTURES / "simple_project", tmp_path / "api")
+    output = tmp_path / "dist" / "api"
+    manifest = tmp_path / "bundles.toml"
+    manifest.write_text(
+        f'[[bundle]]\nproject = "api"\npath = "{output.as_posix()}"\n',
+        encoding="utf-8",
+    )
+    bundle = mocker.patch.object(VenvBundler, "bundle", return_value=True)
+    set_path = mocker.spy(VenvBundler, "set_path")
+
+    jobs = BatchManifest.read(manifest).jobs
+
+    assert [job.path for job in jobs] == [output]
+    assert bundle_batch(jobs, BufferedIO())
+    assert bundle.call_count == 1
+    set_path.assert_called_once_with(mocker.ANY, output)
+
+
+def test_bundle_batch_writes_the_output_of_each_bundle_at_once(
+    tmp_path: Path, config: Config, mocker: MockerFixture
+) -> None:
+    shutil.copytree(FIXTURES / "simple_project", tmp_path / "api")
+    manifest = tmp_path / "bundles.toml"
+    manifest.write_text(
+        '[[bundle]]\nproject = "api"\npath = "a"\n'
+        '[[bundle]]\nproject = "api"\npath = "b"\n',
+        encoding="utf-8",
+    )
+    barrier = threading.Barrier(2, timeout=10)
+    names = ["b", "a"]
+
+    def bundle(bundler: VenvBundler, poetry: Poetry, io: IO) -> bool:
+        name = names.pop()
+        for i in range(3):
+            # Bundles write their lines in turns
+            barrier.wait()
+            io.write_line(f"{name} {i}")
+
+        return True
+
+    mocker.patch.object(VenvBundler, "bundle", autospec=True, side_effect=bundle)
+    io = BufferedIO()
+
+    assert bundle_batch(BatchManifest.read(manifest).jobs, io, workers=2)
+
+    output = io.fetch_output().splitlines()
+    assert sorted(output) == ["a 0", "a 1", "a 2", "b 0", "b 1", "b 2"]
+    assert output in (sorted(output), sorted(output)[3:] + sorted(output)[:3])
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import os
+import time
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from poetry_plugin_bundle.utils.bundle_cache import BundleCache
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _create_bundle(path: Path, size: int) -> Path:
+    (path / "bin").mkdir(parents=True)
+    (path / "pyvenv.cfg").write_text("home = /usr/bin\n", encoding="utf-8")
+    (path / "bin" / "script").write_text(f"#!{path}/bin/python\n", encoding="utf-8")
+    (path / "data").write_bytes(b"x" * size)
+
+    return path
+
+
+def test_put_and_restore_rewrites_bundle_path(tmp_path: Path) -> None:
+    cache = BundleCache(tmp_path / "cache")
+    source = _create_bundle(tmp_path / "source", 10)
+
+    cache.put("key", source, "foo", "1.0.0")
+
+    target = tmp_path / "target"
+    assert cache.restore("key", target)
+    assert not cache.restore("unknown", tmp_path / "other")
+
+    assert (target / "data").read_bytes() == b"x" * 10
+    assert (target / "bin" / "script").read_text(encoding="utf-8") == (
+        f"#!{target}/bin/python\n"
+    )
+    assert (source / "bin" / "script").read_text(encoding="utf-8") == (
+        f"#!{source}/bin/python\n"
+    )
+
+
+def test_restore_replaces_existing_bundles_only_if_asked(tmp_path: Path) -> None:
+    cache = BundleCache(tmp_path / "cache")
+    cache.put("key", _create_bundle(tmp_path / "source", 10), "foo", "1.0.0")
+    target = _create_bundle(tmp_path / "target", 20)
+
+    with pytest.raises(FileExistsError):
+        cache.restore("key", target)
+
+    assert (target / "data").read_bytes() == b"x" * 20
+
+    assert cache.restore("key", target, replace=True)
+    assert (target / "data").read_bytes() == b"x" * 10
+
+
+def test_prune_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    cache = BundleCache(tmp_path / "cache")
+    now = time.time()
+    for i, key in enumerate(["old", "middle", "new"]):
+        entry = cache.put(key, _create_bundle(tmp_path / key, 1000), key, "1.0.0")
+        last_used = now - (3 - i) * 86400
+        os.utime(entry.path / BundleCache.METADATA_FILE, (last_used, last_used))
+
+    removed = cache.prune(max_age=2.5 * 86400)
+    assert [entry.key for entry in removed] == ["old"]
+
+    size = cache.entries()[0].size
+    removed = cache.prune(max_size=size)
+    assert [entry.key for entry in removed] == ["middle"]
+    assert [entry.key for entry in cache.entries()] == ["new"]
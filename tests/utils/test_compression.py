@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import gzip
+import io
+
+from pathlib import Path
+
+import pytest
+
+from poetry_plugin_bundle.utils.compression import ParallelCompressor
+from poetry_plugin_bundle.utils.compression import block_compressor
+from poetry_plugin_bundle.utils.compression import tar_compression
+
+
+def test_parallel_compressor_writes_a_single_gzip_stream() -> None:
+    data = b"".join(f"{i}\n".encode() for i in range(100_000))
+    output = io.BytesIO()
+
+    compressor = ParallelCompressor(
+        output, block_compressor("gzip"), block_size=1024, workers=4
+    )
+    for start in range(0, len(data), 1000):
+        compressor.write(data[start : start + 1000])
+    compressor.close()
+
+    assert gzip.decompress(output.getvalue()) == data
+
+
+@pytest.mark.parametrize(
+    ("name", "compression"),
+    [
+        ("bundle.tar", None),
+        ("bundle.tar.gz", "gzip"),
+        ("bundle.tgz", "gzip"),
+        ("bundle.tar.zst", "zstd"),
+    ],
+)
+def test_tar_compression(name: str, compression: str | None) -> None:
+    assert tar_compression(Path(name)) == compression
+
+
+def test_tar_compression_rejects_unsupported_extensions() -> None:
+    with pytest.raises(ValueError, match=r"Unsupported archive bundle\.zip"):
+        tar_compression(Path("bundle.zip"))
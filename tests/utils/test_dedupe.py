@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import os
+import py_compile
+import sys
+
+from typing import TYPE_CHECKING
+
+from poetry_plugin_bundle.utils.dedupe import FileStore
+from poetry_plugin_bundle.utils.dedupe import dedupe_bundles
+from poetry_plugin_bundle.utils.manifest import BUNDLE_METADATA_DIR
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write(path: Path, content: str, mtime: int = 1_000_000_000) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+    return path
+
+
+def test_file_store_links_identical_files(tmp_path: Path) -> None:
+    store = FileStore(tmp_path / "store")
+    first = _write(tmp_path / "first" / "module.py", "VALUE = 1\n")
+    second = _write(tmp_path / "second" / "module.py", "VALUE = 1\n")
+    other = _write(tmp_path / "second" / "other.py", "VALUE = 2\n")
+    executable = _write(tmp_path / "second" / "script", "VALUE = 1\n")
+    executable.chmod(0o755)
+
+    stats = store.link_files([first])
+    assert (stats.files, stats.linked, stats.saved) == (1, 0, 0)
+    assert first.stat().st_nlink == 2
+
+    stats = store.link_files([second, other, executable])
+    assert (stats.files, stats.linked, stats.saved) == (3, 1, 10)
+    assert os.path.samefile(first, second)
+    assert not os.path.samefile(first, executable)
+    assert other.stat().st_nlink == 2
+    assert second.read_text(encoding="utf-8") == "VALUE = 1\n"
+    assert not stats.unsupported
+
+
+def test_file_store_prunes_files_no_bundle_links(tmp_path: Path) -> None:
+    store = FileStore(tmp_path / "store")
+
+    assert store.prune() == (0, 0)
+
+    kept = _write(tmp_path / "first" / "module.py", "VALUE = 1\n")
+    removed = _write(tmp_path / "second" / "module.py", "VALUE = 22\n")
+    store.link_files([kept, removed])
+    removed.unlink()
+
+    assert store.prune() == (1, 11)
+    assert [entry.stat().st_nlink for entry in store.path.glob("*/*")] == [2]
+    assert len(list(store.path.iterdir())) == 1
+
+    assert store.clear() == 1
+    assert list(store.path.iterdir()) == []
+    assert kept.read_text(encoding="utf-8") == "VALUE = 1\n"
+
+
+def test_dedupe_bundles_folds_identical_files(tmp_path: Path) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    for bundle in (first, second):
+        _write(bundle / "lib" / "module.py", "VALUE = 1\n")
+        _write(bundle / BUNDLE_METADATA_DIR / "manifest.json", "{}\n")
+    _write(second / "lib" / "other.py", "VALUE = 2\n")
+
+    stats = dedupe_bundles([first, second])
+
+    assert (stats.files, stats.linked, stats.saved) == (3, 1, 10)
+    assert os.path.samefile(first / "lib" / "module.py", second / "lib" / "module.py")
+    assert not os.path.samefile(
+        first / BUNDLE_METADATA_DIR / "manifest.json",
+        second / BUNDLE_METADATA_DIR / "manifest.json",
+    )
+
+    stats = dedupe_bundles([first, second])
+    assert (stats.linked, stats.saved) == (0, 0)
+
+
+def test_dedupe_bundles_refreshes_timestamp_bytecode(tmp_path: Path) -> None:
+    first = _write(tmp_path / "first" / "module.py", "VALUE = 1\n", mtime=1_000)
+    second = _write(tmp_path / "second" / "module.py", "VALUE = 1\n", mtime=2_000)
+    pyc = (
+        tmp_path
+        / "second"
+        / "__pycache__"
+        / f"module.{sys.implementation.cache_tag}.pyc"
+    )
+    py_compile.compile(str(second), cfile=str(pyc))
+
+    dedupe_bundles([tmp_path / "first", tmp_path / "second"])
+
+    assert os.path.samefile(first, second)
+    assert pyc.read_bytes()[8:12] == (1_000).to_bytes(4, "little")
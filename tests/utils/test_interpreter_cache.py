@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from poetry.utils.env.virtual_env import VirtualEnv
+
+from poetry_plugin_bundle.utils.env import CachedPython
+from poetry_plugin_bundle.utils.env import CachedVirtualEnv
+from poetry_plugin_bundle.utils.env import InterpreterEnv
+from poetry_plugin_bundle.utils.interpreter_cache import InterpreterCache
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_entries_are_invalidated_when_the_interpreter_changes(tmp_path: Path) -> None:
+    cache = InterpreterCache(tmp_path / "cache")
+    executable = tmp_path / "python"
+    executable.write_text("", encoding="utf-8")
+
+    cache.put(executable, "python", {"version": "3.12.1"})
+
+    assert cache.get(executable, "python") == {"version": "3.12.1"}
+    assert cache.get(executable, "environment") is None
+    assert cache.get(tmp_path / "missing", "python") is None
+
+    stat = executable.stat()
+    os.utime(executable, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert cache.get(executable, "python") is None
+
+
+def test_entries_are_keyed_by_unresolved_path(tmp_path: Path) -> None:
+    cache = InterpreterCache(tmp_path / "cache")
+    executable = tmp_path / "python"
+    executable.write_text("", encoding="utf-8")
+    link = tmp_path / "venv" / "bin" / "python"
+    link.parent.mkdir(parents=True)
+    link.symlink_to(executable)
+
+    cache.put(executable, "environment", {"base_prefix": "/usr"})
+
+    assert cache.get(link, "environment") is None
+
+
+def test_cached_python_probes_the_interpreter_once(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    cache = InterpreterCache(tmp_path / "cache")
+    executable = Path(sys.executable)
+
+    python = CachedPython(executable, cache)
+
+    run = mocker.patch("subprocess.run")
+    cached = CachedPython(executable, cache)
+
+    run.assert_not_called()
+    for candidate in (python, cached):
+        assert candidate.executable == Path(sys.executable)
+        assert candidate.implementation == sys.implementation.name
+        assert candidate.patch_version.to_string() == ".".join(
+            str(v) for v in sys.version_info[:3]
+        )
+
+
+def test_environment_data_is_read_from_cache(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    cache = InterpreterCache(tmp_path / "cache")
+    executable = Path(sys.executable)
+
+    env = InterpreterEnv(executable, cache=cache)
+    marker_env = env.marker_env
+
+    spy = mocker.spy(VirtualEnv, "run_python_script")
+    cached_env = InterpreterEnv(executable, cache=cache)
+
+    assert cached_env.marker_env == marker_env
+    assert cached_env.paths == env.paths
+    spy.assert_not_called()
+
+
+def test_supported_tags_are_read_from_cache(
+    tmp_path: Path, tmp_venv: VirtualEnv, mocker: MockerFixture
+) -> None:
+    cache = InterpreterCache(tmp_path / "cache")
+    supported_tags = CachedVirtualEnv(tmp_venv.path, cache=cache).supported_tags
+
+    tags_spy = mocker.spy(VirtualEnv, "get_supported_tags")
+    script_spy = mocker.spy(VirtualEnv, "run_python_script")
+    popen_spy = mocker.spy(subprocess, "Popen")
+    cached_env = CachedVirtualEnv(tmp_venv.path, cache=cache)
+
+    assert cached_env.supported_tags == supported_tags
+    tags_spy.assert_not_called()
+    script_spy.assert_not_called()
+    popen_spy.assert_not_called()
+
+
+def test_environment_data_is_invalidated_when_the_venv_is_recreated(
+    tmp_path: Path, tmp_venv: VirtualEnv, mocker: MockerFixture
+) -> None:
+    cache = InterpreterCache(tmp_path / "cache")
+    paths = CachedVirtualEnv(tmp_venv.path, cache=cache).paths
+
+    spy = mocker.spy(VirtualEnv, "run_python_script")
+    assert CachedVirtualEnv(tmp_venv.path, cache=cache).paths == paths
+    spy.assert_not_called()
+
+    pyvenv = tmp_venv.path / "pyvenv.cfg"
+    stat = pyvenv.stat()
+    os.utime(pyvenv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert CachedVirtualEnv(tmp_venv.path, cache=cache).paths == paths
+    spy.assert_called()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from poetry_plugin_bundle.utils.manifest import BundleManifest
+from poetry_plugin_bundle.utils.manifest import InstalledDistribution
+from poetry_plugin_bundle.utils.manifest import locked_package_infos
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from poetry.utils.env import VirtualEnv
+
+
+def _install_distribution(env: VirtualEnv, name: str, version: str) -> None:
+    dist_info = env.purelib / f"{name}-{version}.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n", encoding="utf-8"
+    )
+    (env.purelib / name).mkdir()
+    (env.purelib / name / "__init__.py").write_text("", encoding="utf-8")
+    (env.purelib / name / "__pycache__").mkdir()
+    (dist_info / "RECORD").write_text(
+        f"{name}/__init__.py,,\n{name}-{version}.dist-info/METADATA,,\n"
+        f"{name}-{version}.dist-info/RECORD,,\n",
+        encoding="utf-8",
+    )
+
+
+def test_manifest_records_installed_distributions(tmp_venv: VirtualEnv) -> None:
+    _install_distribution(tmp_venv, "foo", "1.0.0")
+
+    manifest = BundleManifest.from_env(
+        tmp_venv, {"python": "3.x"}, {"foo": "sha256:abc"}
+    )
+    manifest.write(tmp_venv.path)
+
+    read = BundleManifest.read(tmp_venv.path)
+    assert read is not None
+    assert read.environment == {"python": "3.x"}
+
+    site_packages = tmp_venv.purelib.relative_to(tmp_venv.path).as_posix()
+    assert read.distributions == {
+        "foo": InstalledDistribution(
+            name="foo",
+            version="1.0.0",
+            hash="sha256:abc",
+            files=[
+                f"{site_packages}/foo-1.0.0.dist-info/METADATA",
+                f"{site_packages}/foo-1.0.0.dist-info/RECORD",
+                f"{site_packages}/foo/__init__.py",
+            ],
+        )
+    }
+
+
+def test_manifest_diff_detects_changed_distributions(tmp_venv: VirtualEnv) -> None:
+    _install_distribution(tmp_venv, "foo", "1.0.0")
+    _install_distribution(tmp_venv, "bar", "1.0.0")
+    _install_distribution(tmp_venv, "baz", "1.0.0")
+
+    hashes = {"foo": "sha256:foo", "bar": "sha256:bar", "baz": "sha256:baz"}
+    manifest = BundleManifest.from_env(tmp_venv, {}, hashes)
+
+    lock_data = {
+        "package": [
+            {"name": "foo", "version": "1.0.0"},
+            {"name": "bar", "version": "2.0.0"},
+        ],
+        "metadata": {
+            "files": {
+                "foo": [{"file": "foo-1.0.0.whl", "hash": "sha256:foo"}],
+                "bar": [{"file": "bar-2.0.0.whl", "hash": "sha256:bar2"}],
+            }
+        },
+    }
+    unchanged, stale = manifest.diff(tmp_venv.path, locked_package_infos(lock_data))
+
+    assert [(p.name, p.version.text) for p in unchanged] == [("foo", "1.0.0")]
+    assert sorted(d.name for d in stale) == ["bar", "baz"]
+
+    BundleManifest.remove_distributions(tmp_venv.path, stale)
+
+    assert (tmp_venv.purelib / "foo").exists()
+    assert not (tmp_venv.purelib / "bar").exists()
+    assert not (tmp_venv.purelib / "bar-1.0.0.dist-info").exists()
+    assert not (tmp_venv.purelib / "baz").exists()
+
+
+def test_manifest_diff_keeps_preserved_distributions_and_the_root_project(
+    tmp_venv: VirtualEnv,
+) -> None:
+    _install_distribution(tmp_venv, "pip", "24.0")
+    _install_distribution(tmp_venv, "project", "1.0.0")
+
+    manifest = BundleManifest.from_env(tmp_venv, {}, {})
+    unchanged, stale = manifest.diff(tmp_venv.path, [], "project")
+
+    assert unchanged == []
+    assert stale == []
+
+
+def test_manifest_diff_detects_missing_files(tmp_venv: VirtualEnv) -> None:
+    _install_distribution(tmp_venv, "foo", "1.0.0")
+
+    manifest = BundleManifest.from_env(tmp_venv, {}, {"foo": "sha256:foo"})
+    lock_data = {
+        "package": [{"name": "foo", "version": "1.0.0"}],
+        "metadata": {"files": {"foo": [{"file": "foo.whl", "hash": "sha256:foo"}]}},
+    }
+    (tmp_venv.purelib / "foo" / "__init__.py").unlink()
+
+    unchanged, stale = manifest.diff(tmp_venv.path, locked_package_infos(lock_data))
+
+    assert unchanged == []
+    assert [d.name for d in stale] == ["foo"]
+
+
+def test_manifest_read_ignores_missing_or_invalid_manifests(tmp_path: Path) -> None:
+    assert BundleManifest.read(tmp_path) is None
+
+    (tmp_path / BundleManifest.FILE).parent.mkdir()
+    (tmp_path / BundleManifest.FILE).write_text("{", encoding="utf-8")
+
+    assert BundleManifest.read(tmp_path) is None
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import threading
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import cast
+
+import pytest
+
+from cleo.io.buffered_io import BufferedIO
+
+from poetry_plugin_bundle.bundlers.bundler import Bundler
+from poetry_plugin_bundle.utils.matrix import MatrixTarget
+from poetry_plugin_bundle.utils.matrix import bundle_matrix
+from poetry_plugin_bundle.utils.matrix import expand_matrix
+
+
+if TYPE_CHECKING:
+    from cleo.io.io import IO
+    from poetry.poetry import Poetry
+
+
+def test_expand_matrix_combines_pythons_and_platforms() -> None:
+    targets = expand_matrix(
+        "dist/{python}/{platform}",
+        ["/usr/bin/python3.11", "python3.12"],
+        ["manylinux_2_28_x86_64", "musllinux_1_2_x86_64"],
+    )
+
+    assert targets == [
+        (
+            MatrixTarget("/usr/bin/python3.11", "manylinux_2_28_x86_64"),
+            Path("dist/python3.11/manylinux_2_28_x86_64"),
+        ),
+        (
+            MatrixTarget("/usr/bin/python3.11", "musllinux_1_2_x86_64"),
+            Path("dist/python3.11/musllinux_1_2_x86_64"),
+        ),
+        (
+            MatrixTarget("python3.12", "manylinux_2_28_x86_64"),
+            Path("dist/python3.12/manylinux_2_28_x86_64"),
+        ),
+        (
+            MatrixTarget("python3.12", "musllinux_1_2_x86_64"),
+            Path("dist/python3.12/musllinux_1_2_x86_64"),
+        ),
+    ]
+
+
+def test_expand_matrix_defaults_to_a_single_target() -> None:
+    assert expand_matrix("dist/{python}-{platform}", [], []) == [
+        (MatrixTarget(None, None), Path("dist/python-native"))
+    ]
+
+
+def test_expand_matrix_requires_distinct_paths() -> None:
+    with pytest.raises(ValueError, match="must tell the bundles apart"):
+        expand_matrix("dist/{python}", ["python3.11", "python3.12"], ["a", "b"])
+
+
+def test_expand_matrix_combines_group_sets() -> None:
+    targets = expand_matrix(
+        "dist/{groups}", [], [], [frozenset({"main"}), frozenset({"main", "dev"})]
+    )
+
+    assert targets == [
+        (MatrixTarget(None, None, frozenset({"main"})), Path("dist/main")),
+        (MatrixTarget(None, None, frozenset({"main", "dev"})), Path("dist/dev-main")),
+    ]
+    assert expand_matrix("dist/{groups}", [], []) == [
+        (MatrixTarget(None, None), Path("dist/default"))
+    ]
+
+
+def test_bundle_matrix_writes_the_output_of_each_bundle_at_once() -> None:
+    barrier = threading.Barrier(2, timeout=10)
+
+    class LineBundler(Bundler):
+        def __init__(self, name: str) -> None:
+            self._name = name
+
+        def bundle(self, poetry: Poetry, io: IO) -> bool:
+            for i in range(3):
+                # Bundles write their lines in turns
+                barrier.wait()
+                io.write_line(f"<info>{self._name} {i}</info>")
+
+            io.write_error_line(f"{self._name} done")
+
+            return self._name == "a"
+
+    io = BufferedIO()
+    poetry = cast("Poetry", None)
+
+    assert not bundle_matrix(
+        poetry, io, [LineBundler("a"), LineBundler("b")], workers=2
+    )
+
+    output = io.fetch_output().splitlines()
+    assert sorted(output) == ["a 0", "a 1", "a 2", "b 0", "b 1", "b 2"]
+    assert output in (sorted(output), sorted(output)[3:] + sorted(output)[:3])
+    assert sorted(io.fetch_error().splitlines()) == ["a done", "b done"]
@@ -162,3 +162,50 @@ def test_create_supported_tags_malformed_platforms() -> None:
     for platform in malformed_platforms:
         with pytest.raises(ValueError):
             platforms.create_supported_tags(platform, env)
+
+
+def test_supported_tag_index_is_cached_per_interpreter() -> None:
+    env = MockEnv(version_info=(3, 12, 1))
+
+    index = platforms.supported_tag_index("manylinux_2_28_x86_64", env)
+
+    assert (
+        platforms.supported_tag_index(
+            "manylinux_2_28_x86_64", MockEnv(version_info=(3, 12, 7))
+        )
+        is index
+    )
+    assert (
+        platforms.supported_tag_index(
+            "manylinux_2_28_x86_64", MockEnv(version_info=(3, 13, 0))
+        )
+        is not index
+    )
+    assert platforms.create_supported_tags("manylinux_2_28_x86_64", env) == list(
+        index.tags
+    )
+    assert index.tag_set == set(index.tags)
+
+
+def test_indexed_tags_match_list_lookups() -> None:
+    from packaging.tags import Tag
+
+    env = MockEnv(version_info=(3, 12, 1))
+    index = platforms.supported_tag_index("musllinux_1_2_aarch64", env)
+    tags = platforms.IndexedTags(index)
+    expected = list(index.tags)
+
+    assert tags == expected
+    for tag in expected[:: len(expected) // 10]:
+        assert tag in tags
+        assert tags.index(tag) == expected.index(tag) == index.priorities[tag]
+
+    unsupported = Tag("cp312", "cp312", "win_amd64")
+    assert unsupported not in tags
+    with pytest.raises(ValueError):
+        tags.index(unsupported)
+
+    tag = expected[5]
+    with pytest.raises(ValueError):
+        tags.index(tag, 6)
+    assert tags.index(tag, -len(expected)) == 5
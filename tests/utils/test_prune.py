@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import _json
+import importlib
+import shutil
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from poetry_plugin_bundle.utils.prune import prune_env
+
+
+def _write(path: Path, content: str = "x") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def test_prune_env_removes_files_matching_rules(tmp_path: Path) -> None:
+    site_packages = tmp_path / "lib" / "site-packages"
+    kept = [
+        "foo/__init__.py",
+        "foo/__pycache__/__init__.cpython-312.pyc",
+        "foo/LICENSE.md",
+        "foo/_speedups.pyx",
+        "foo-1.0.dist-info/METADATA",
+        "foo-1.0.dist-info/README.md",
+    ]
+    pruned = [
+        "foo/tests/test_foo.py",
+        "foo/tests/__pycache__/test_foo.cpython-312.pyc",
+        "foo/docs/index.rst",
+        "foo/CHANGES.md",
+        "foo/__init__.pyi",
+        "foo/py.typed",
+        "foo/__pycache__/__init__.cpython-312.opt-1.pyc",
+    ]
+    for file in kept + pruned:
+        _write(site_packages / file)
+    _write(
+        site_packages / "foo-1.0.dist-info" / "RECORD",
+        "".join(f"{file},,\n" for file in kept + pruned)
+        + "foo-1.0.dist-info/RECORD,,\n",
+    )
+
+    result = prune_env(
+        tmp_path, [site_packages, site_packages], ["tests", "docs", "stubs", "bytecode"]
+    )
+
+    for file in kept:
+        assert (site_packages / file).exists()
+    for file in pruned:
+        assert not (site_packages / file).exists()
+
+    assert result.removed == {
+        "tests": (2, 2),
+        "docs": (2, 2),
+        "stubs": (2, 2),
+        "bytecode": (1, 1),
+    }
+    assert result.files == 7
+    assert result.size_before - result.size_after > 7
+    assert (site_packages / "foo-1.0.dist-info" / "RECORD").read_text(
+        encoding="utf-8"
+    ) == "".join(f"{file},,\n" for file in kept) + "foo-1.0.dist-info/RECORD,,\n"
+
+
+def test_prune_env_keeps_import_packages_unless_allowed(tmp_path: Path) -> None:
+    site_packages = tmp_path / "site-packages"
+    _write(
+        site_packages / "foo" / "__init__.py",
+        "from foo.tests.helpers import VALUE\n",
+    )
+    _write(site_packages / "foo" / "tests" / "__init__.py", "")
+    _write(site_packages / "foo" / "tests" / "helpers.py", "VALUE = 1\n")
+    _write(site_packages / "foo" / "examples" / "__init__.py", "")
+    _write(site_packages / "foo-1.0.dist-info" / "METADATA", "Name: foo\n")
+    _write(site_packages / "foo-1.0.dist-info" / "top_level.txt", "foo\n")
+    # A distribution whose import package is named like a pruned directory
+    _write(site_packages / "docs" / "__init__.py", "")
+    _write(site_packages / "docs-1.0.dist-info" / "METADATA", "Name: docs\n")
+    _write(
+        site_packages / "docs-1.0.dist-info" / "RECORD",
+        "docs/__init__.py,,\ndocs-1.0.dist-info/RECORD,,\n",
+    )
+    # Top-level directories which no distribution owns, e.g. left by sdists
+    _write(site_packages / "tests" / "__init__.py", "")
+    _write(site_packages / "examples" / "example.py")
+
+    result = prune_env(tmp_path, [site_packages], ["tests", "docs"])
+
+    assert result.files == 1
+    assert (site_packages / "foo" / "tests" / "helpers.py").exists()
+    assert (site_packages / "foo" / "examples" / "__init__.py").exists()
+    assert (site_packages / "docs" / "__init__.py").exists()
+    assert (site_packages / "tests" / "__init__.py").exists()
+    assert not (site_packages / "examples").exists()
+
+    sys.path.insert(0, str(site_packages))
+    try:
+        assert importlib.import_module("foo").VALUE == 1
+    finally:
+        sys.path.remove(str(site_packages))
+        for name in [name for name in sys.modules if name.split(".")[0] == "foo"]:
+            del sys.modules[name]
+
+    result = prune_env(
+        tmp_path, [site_packages], ["tests", "docs"], packages=["foo.tests", "tests"]
+    )
+
+    assert result.files == 3
+    assert not (site_packages / "foo" / "tests").exists()
+    assert not (site_packages / "tests").exists()
+    assert (site_packages / "foo" / "examples" / "__init__.py").exists()
+
+
+@pytest.mark.skipif(
+    shutil.which("strip") is None or not _json.__file__.endswith(".so"),
+    reason="Requires strip and ELF shared objects",
+)
+def test_prune_env_strips_shared_objects(tmp_path: Path) -> None:
+    site_packages = tmp_path / "site-packages"
+    site_packages.mkdir()
+    shared_object = site_packages / Path(_json.__file__).name
+    shutil.copy(_json.__file__, shared_object)
+    (site_packages / "fake.so").write_bytes(b"not a shared object")
+
+    result = prune_env(tmp_path, [site_packages], [], strip=True)
+
+    assert result.stripped == 1
+    assert result.removed == {}
+    assert result.size_after <= result.size_before
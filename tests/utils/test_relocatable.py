@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+
+from pathlib import Path
+
+from poetry.utils.env import EnvManager
+
+from poetry_plugin_bundle.utils.relocatable import make_relocatable
+
+
+SCRIPT = """\
+# -*- coding: utf-8 -*-
+import sys
+print(sys.prefix)
+"""
+
+
+def test_make_relocatable_rewrites_scripts_and_config(tmp_path: Path) -> None:
+    venv = tmp_path / "venv"
+    EnvManager.build_venv(venv, executable=Path(sys.executable), prompt="demo")
+    bin_dir = venv / "bin"
+    (bin_dir / "simple").write_text(f"#!{bin_dir}/python\n{SCRIPT}", encoding="utf-8")
+    (bin_dir / "complex").write_text(
+        f"#!/bin/sh\n'''exec' '{bin_dir}/python' \"$0\" \"$@\"\n' '''\n{SCRIPT}",
+        encoding="utf-8",
+    )
+    (bin_dir / "other").write_text(
+        f"#!/usr/bin/env python\nprint({str(venv)!r})\n", encoding="utf-8"
+    )
+    for script in ("simple", "complex", "other"):
+        (bin_dir / script).chmod(0o755)
+
+    remaining = make_relocatable(venv)
+
+    assert remaining == [bin_dir / "other"]
+    assert "relocatable = true" in (venv / "pyvenv.cfg").read_text(encoding="utf-8")
+    assert not (bin_dir / "activate.csh").exists()
+
+    moved = tmp_path / "moved"
+    shutil.move(venv, moved)
+    for script in ("simple", "complex"):
+        output = subprocess.run(
+            [moved / "bin" / script], capture_output=True, check=True, text=True
+        ).stdout
+        assert output.strip() == str(moved)
+
+    if shutil.which("bash"):
+        output = subprocess.run(
+            ["bash", "-c", f"source {moved}/bin/activate && echo $VIRTUAL_ENV"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        assert output.strip() == str(moved)
+
+    for file in (moved / "pyvenv.cfg", *(moved / "bin").glob("activate*")):
+        if file.name != "activate.ps1":
+            assert str(venv) not in file.read_text(encoding="utf-8")
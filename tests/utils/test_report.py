@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import zipfile
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cleo.io.null_io import NullIO
+from poetry.core.packages.package import Package
+from poetry.installation.operations import Install
+from poetry.repositories.repository_pool import RepositoryPool
+
+from poetry_plugin_bundle.utils.prune import PruneResult
+from poetry_plugin_bundle.utils.report import BundleReport
+from poetry_plugin_bundle.utils.report import ReportingExecutor
+from poetry_plugin_bundle.utils.report import ReportingWheelInstaller
+from poetry_plugin_bundle.utils.wheelhouse import Wheelhouse
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from poetry.config.config import Config
+    from poetry.utils.env import VirtualEnv
+    from pytest_mock import MockerFixture
+
+
+def test_report_counts_artifacts_once() -> None:
+    report = BundleReport()
+
+    # Prefetched artifacts are cache misses, even once found by the installer
+    report.record_artifact("https://example.com/foo.whl", False)
+    report.record_artifact("https://example.com/foo.whl", True)
+    report.record_artifact("https://example.com/bar.whl", True)
+    report.record_download(2048)
+    report.record_written(3, 1536)
+    report.finish()
+
+    data = report.as_dict()
+
+    assert data["artifact_cache"] == {"hits": 1, "misses": 1}
+    assert data["downloads"] == {"count": 1, "bytes": 2048}
+    assert data["written"] == {"files": 3, "bytes": 1536}
+
+
+def test_report_records_pruned_sizes() -> None:
+    report = BundleReport()
+    report.record_prune(
+        PruneResult(size_before=4096, size_after=1024, removed={"tests": (3, 3072)})
+    )
+    report.finish()
+
+    assert report.as_dict()["pruned"] == {
+        "size_before": 4096,
+        "size_after": 1024,
+        "rules": {"tests": {"files": 3, "bytes": 3072}},
+        "stripped": 0,
+    }
+    assert report.to_text()[-1] == (
+        "Pruned from 4.0 KiB to 1.0 KiB: tests 3 files (3.0 KiB),"
+        " 0 shared objects stripped"
+    )
+
+
+def test_report_summarizes_slowest_packages() -> None:
+    report = BundleReport()
+    report.record_phase("venv", 1.5)
+    report.record_phase("venv", 0.5)
+    for i, name in enumerate(["a", "b", "c"]):
+        report.record_package(name, i)
+    report.finish()
+
+    lines = report.to_text(slowest=2)
+
+    assert "Phases: venv <b>2.00s</b>" in lines
+    assert "Slowest packages: <c1>c</c1> <b>2.00s</b>, <c1>b</c1> <b>1.00s</b>" in lines
+    assert lines[-1] == "Wrote 0 files (0 B)"
+
+
+def test_report_only_traces_spans_if_enabled() -> None:
+    report = BundleReport()
+    report.timed("venv", lambda: None)()
+
+    assert report.trace_events() == []
+
+    report = BundleReport(trace=True)
+    report.timed("venv", lambda: None)()
+    with report.span("foo", "package", job="install"):
+        pass
+
+    events = report.trace_events()
+
+    assert [(event["ph"], event["name"]) for event in events] == [
+        ("M", "thread_name"),
+        ("X", "venv"),
+        ("X", "foo"),
+    ]
+    assert events[2]["args"] == {"job": "install"}
+
+
+def test_wheel_installer_does_not_overwrite_linked_files(
+    tmp_path: Path, tmp_venv: VirtualEnv
+) -> None:
+    wheel = tmp_path / "foo-1.0.0-py3-none-any.whl"
+    with zipfile.ZipFile(wheel, "w") as archive:
+        archive.writestr("foo.py", "VALUE = 2\n")
+        archive.writestr(
+            "foo-1.0.0.dist-info/METADATA", "Metadata-Version: 2.1\nName: foo\n"
+        )
+        archive.writestr(
+            "foo-1.0.0.dist-info/WHEEL",
+            "Wheel-Version: 1.0\nRoot-Is-Purelib: true\nTag: py3-none-any\n",
+        )
+        archive.writestr("foo-1.0.0.dist-info/RECORD", "")
+
+    installed = tmp_venv.purelib / "foo.py"
+    installed.write_text("VALUE = 1\n", encoding="utf-8")
+    stored = tmp_path / "stored.py"
+    os.link(installed, stored)
+
+    ReportingWheelInstaller(tmp_venv, BundleReport(), unlink_shared_files=True).install(
+        wheel
+    )
+
+    assert installed.read_text(encoding="utf-8") == "VALUE = 2\n"
+    assert stored.read_text(encoding="utf-8") == "VALUE = 1\n"
+
+
+def test_wheel_installer_only_unlinks_shared_files_when_deduping(
+    tmp_path: Path, tmp_venv: VirtualEnv, mocker: MockerFixture
+) -> None:
+    wheel = tmp_path / "foo-1.0.0-py3-none-any.whl"
+    with zipfile.ZipFile(wheel, "w") as archive:
+        archive.writestr("foo.py", "VALUE = 2\n")
+        archive.writestr(
+            "foo-1.0.0.dist-info/METADATA", "Metadata-Version: 2.1\nName: foo\n"
+        )
+        archive.writestr(
+            "foo-1.0.0.dist-info/WHEEL",
+            "Wheel-Version: 1.0\nRoot-Is-Purelib: true\nTag: py3-none-any\n",
+        )
+        archive.writestr("foo-1.0.0.dist-info/RECORD", "")
+
+    unlink_shared_files = mocker.spy(ReportingWheelInstaller, "_unlink_shared_files")
+
+    ReportingWheelInstaller(tmp_venv, BundleReport()).install(wheel)
+
+    unlink_shared_files.assert_not_called()
+    assert (tmp_venv.purelib / "foo.py").read_text(encoding="utf-8") == "VALUE = 2\n"
+
+
+@pytest.mark.parametrize("build_constraints", [True, False])
+def test_executor_builds_sdists_of_the_wheelhouse(
+    tmp_path: Path,
+    tmp_venv: VirtualEnv,
+    config: Config,
+    mocker: MockerFixture,
+    build_constraints: bool,
+) -> None:
+    sdist = tmp_path / "wheelhouse" / "foo-1.0.0.tar.gz"
+    sdist.parent.mkdir()
+    sdist.write_bytes(b"sdist")
+    wheel = tmp_path / "foo-1.0.0-py3-none-any.whl"
+    package = Package("foo", "1.0.0")
+    package.files = [
+        {"file": sdist.name, "hash": f"sha256:{hashlib.sha256(b'sdist').hexdigest()}"}
+    ]
+
+    executor = ReportingExecutor(
+        tmp_venv,
+        RepositoryPool(),
+        config,
+        NullIO(),
+        report=BundleReport(),
+        wheelhouse=Wheelhouse(sdist.parent),
+    )
+    if not build_constraints:
+        # Build constraints are not supported by older versions of Poetry
+        del executor._build_constraints
+    prepare = mocker.patch.object(executor._chef, "prepare", return_value=wheel)
+
+    assert executor._wheelhouse_archive(Install(package)) == wheel
+    assert executor.archive_hashes == {"foo": package.files[0]["hash"]}
+
+    options = {"build_constraints": None} if build_constraints else {}
+    prepare.assert_called_once_with(sdist, config_settings=None, **options)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from poetry_plugin_bundle.utils.scheduler import PhaseScheduler
+
+
+def test_phases_run_concurrently_and_after_their_dependencies() -> None:
+    barrier = threading.Barrier(2, timeout=5)
+    order = []
+
+    def independent(name: str) -> str:
+        # Both phases must be running at the same time to pass the barrier
+        barrier.wait()
+        order.append(name)
+        return name
+
+    scheduler = PhaseScheduler(3)
+    try:
+        scheduler.add("a", lambda: independent("a"))
+        scheduler.add("b", lambda: independent("b"))
+        scheduler.add("c", lambda: order.append("c"), after=["a", "b"])
+        scheduler.join()
+    finally:
+        scheduler.shutdown()
+
+    assert scheduler.result("a") == "a"
+    assert sorted(order[:2]) == ["a", "b"]
+    assert order[2] == "c"
+
+
+def test_join_reraises_the_error_of_the_failed_phase() -> None:
+    ran = []
+
+    def fail() -> None:
+        raise RuntimeError("boom")
+
+    scheduler = PhaseScheduler(3)
+    try:
+        scheduler.add("a", fail)
+        scheduler.add("b", lambda: ran.append("b"), after=["a"])
+        scheduler.add("c", lambda: ran.append("c"))
+
+        with pytest.raises(RuntimeError, match="boom"):
+            scheduler.join()
+    finally:
+        scheduler.shutdown()
+
+    assert ran == ["c"]
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import shutil
+import threading
+import urllib.error
+import urllib.request
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import cast
+
+import pytest
+
+from poetry.factory import Factory
+from poetry.repositories.repository import Repository
+from poetry.repositories.repository_pool import Priority
+from poetry.repositories.repository_pool import RepositoryPool
+from poetry.utils.cache import ArtifactCache
+
+from poetry_plugin_bundle.bundlers.venv_bundler import VenvBundler
+from poetry_plugin_bundle.utils.jobs import BundleJob
+from poetry_plugin_bundle.utils.jobs import SharedArtifactCachePool
+from poetry_plugin_bundle.utils.server import BundleServer
+from poetry_plugin_bundle.utils.server import make_server
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+
+    from poetry.config.config import Config
+    from pytest_mock import MockerFixture
+
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+@pytest.fixture
+def project(tmp_path: Path, config: Config) -> Path:
+    project = tmp_path / "project"
+    shutil.copytree(FIXTURES / "simple_project", project)
+
+    return project
+
+
+@pytest.fixture
+def server_url(project: Path, mocker: MockerFixture) -> Iterator[str]:
+    mocker.patch.object(VenvBundler, "bundle", return_value=True)
+    with _serve() as url:
+        yield url
+
+
+@contextlib.contextmanager
+def _serve(token: str | None = None) -> Iterator[str]:
+    server = make_server(BundleServer(), port=0, token=token)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    host, port = cast("tuple[str, int]", server.server_address)
+    yield f"http://{host}:{port}"
+
+    server.shutdown()
+    server.server_close()
+
+
+def _request(
+    url: str, data: Any = None, headers: Mapping[str, str] | None = None
+) -> tuple[int, dict[str, Any]]:
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(data).encode() if data is not None else None,
+        headers={"Content-Type": "application/json", **(headers or {})},
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_bundle_job_from_dict(tmp_path: Path) -> None:
+    job = BundleJob.from_dict(
+        {"project": str(tmp_path), "path": "dist/venv", "groups": ["main"]}
+    )
+
+    assert job.path == tmp_path / "dist" / "venv"
+    assert job.groups == frozenset({"main"})
+    assert not job.clear
+
+    with pytest.raises(ValueError, match="Invalid bundle job fields target"):
+        BundleJob.from_dict({"project": str(tmp_path), "path": "", "target": ""})
+
+    with pytest.raises(TypeError, match="expected a string 'path'"):
+        BundleJob.from_dict({"project": str(tmp_path)})
+
+
+@pytest.mark.parametrize("path", ["", ".", "../venv", "dist/../..", "/tmp/venv"])
+def test_bundle_server_rejects_paths_outside_of_the_project(
+    project: Path, server_url: str, path: str
+) -> None:
+    status, data = _request(
+        f"{server_url}/bundle", {"project": str(project), "path": path}
+    )
+
+    assert status == 400
+    assert data["error"].startswith("Invalid bundle job path")
+    assert data["error"].endswith("expected a directory inside of the project")
+
+
+def test_shared_artifact_cache_pool_keeps_the_repositories_of_the_pool(
+    config: Config,
+) -> None:
+    pool = RepositoryPool(config=config)
+    pool.add_repository(Repository("foo"))
+    pool.add_repository(Repository("bar"), priority=Priority.EXPLICIT)
+    artifact_cache = ArtifactCache(cache_dir=config.artifacts_cache_directory)
+
+    shared = SharedArtifactCachePool.from_pool(pool, artifact_cache, config=config)
+
+    assert shared.artifact_cache is artifact_cache
+    assert shared.all_repositories == pool.all_repositories
+    assert shared.get_priority("bar") is Priority.EXPLICIT
+
+
+def test_bundle_server_reuses_projects_until_they_change(
+    project: Path, mocker: MockerFixture
+) -> None:
+    bundle = mocker.patch.object(VenvBundler, "bundle", return_value=True)
+    set_activated_groups = mocker.spy(VenvBundler, "set_activated_groups")
+    create_poetry = mocker.spy(Factory, "create_poetry")
+    server = BundleServer()
+    job = BundleJob.from_dict({"project": str(project), "path": "venv"})
+
+    assert server.run(job) == (True, "")
+    assert server.run(job) == (True, "")
+
+    assert bundle.call_count == 2
+    assert bundle.call_args_list[0].args[0] is bundle.call_args_list[1].args[0]
+    assert create_poetry.call_count == 1
+    set_activated_groups.assert_called_with(mocker.ANY, {"main"})
+
+    stat = (project / "poetry.lock").stat()
+    os.utime(project / "poetry.lock", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    server.run(job)
+
+    assert create_poetry.call_count == 2
+    assert server.status()["jobs"] == 3
+    assert server.status()["projects"] == [str(project.resolve())]
+
+
+def test_bundle_server_serves_jobs_over_http(project: Path, server_url: str) -> None:
+    status, data = _request(
+        f"{server_url}/bundle", {"project": str(project), "path": "venv"}
+    )
+    assert status == 200
+    assert data == {"success": True, "output": ""}
+
+    status, data = _request(f"{server_url}/bundle", {"project": str(project)})
+    assert status == 400
+    assert data == {"error": "Invalid bundle job, expected a string 'path'"}
+
+    status, data = _request(f"{server_url}/status")
+    assert status == 200
+    assert data["jobs"] == 1
+
+    assert _request(f"{server_url}/jobs")[0] == 404
+
+
+def test_bundle_server_rejects_requests_from_web_pages(
+    project: Path, server_url: str
+) -> None:
+    job = {"project": str(project), "path": "venv"}
+
+    status, data = _request(
+        f"{server_url}/bundle", job, headers={"Content-Type": "text/plain"}
+    )
+    assert status == 415
+    assert data == {
+        "error": "Invalid Content-Type text/plain, expected application/json"
+    }
+
+    # e.g. a page whose domain was rebound to the loopback address
+    status, data = _request(
+        f"{server_url}/bundle", job, headers={"Host": "example.com:8751"}
+    )
+    assert status == 403
+    assert data == {"error": "Invalid host example.com"}
+
+    assert _request(f"{server_url}/status", headers={"Host": "example.com"})[0] == 403
+    assert _request(f"{server_url}/status", headers={"Host": "localhost"})[0] == 200
+    assert _request(f"{server_url}/status")[1]["jobs"] == 0
+
+
+def test_bundle_server_requires_its_token(project: Path, mocker: MockerFixture) -> None:
+    mocker.patch.object(VenvBundler, "bundle", return_value=True)
+    job = {"project": str(project), "path": "venv"}
+
+    with _serve(token="secret") as server_url:
+        status, data = _request(f"{server_url}/bundle", job)
+        assert status == 401
+        assert data == {"error": "Invalid or missing token"}
+
+        headers = {"Authorization": "Bearer other", "Host": "example.com"}
+        assert _request(f"{server_url}/status", headers=headers)[0] == 401
+
+        headers = {"Authorization": "Bearer secret", "Host": "example.com"}
+        assert _request(f"{server_url}/bundle", job, headers=headers) == (
+            200,
+            {"success": True, "output": ""},
+        )
+
+
+def test_make_server_requires_a_token_for_non_loopback_hosts() -> None:
+    with pytest.raises(
+        ValueError, match=r"non-loopback host 0\.0\.0\.0 without a token"
+    ):
+        make_server(BundleServer(), host="0.0.0.0", port=0)
+
+    server = make_server(BundleServer(), host="0.0.0.0", port=0, token="secret")
+    server.server_close()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import sys
+
+from pathlib import Path
+
+from poetry_plugin_bundle.utils.venv_templates import VenvTemplateCache
+
+
+def _create_venv(path: Path) -> None:
+    (path / "bin").mkdir(parents=True)
+    (path / "pyvenv.cfg").write_text(
+        f"home = /usr/bin\ncommand = python -m virtualenv {path}\n", encoding="utf-8"
+    )
+    (path / "bin" / "activate").write_text(f"VIRTUAL_ENV={path}\n", encoding="utf-8")
+    (path / "bin" / "python").symlink_to(sys.executable)
+
+
+def test_restore_rewrites_the_path_of_the_template(tmp_path: Path) -> None:
+    cache = VenvTemplateCache(tmp_path / "cache")
+    key = VenvTemplateCache.key(Path(sys.executable), {"no-pip": True})
+    target = tmp_path / "target"
+
+    assert not cache.restore(key, target)
+
+    cache.put(key, Path(sys.executable), _create_venv)
+
+    assert cache.restore(key, target)
+    assert (target / "bin" / "activate").read_text(encoding="utf-8") == (
+        f"VIRTUAL_ENV={target}\n"
+    )
+    assert (target / "pyvenv.cfg").read_text(encoding="utf-8") == (
+        f"home = /usr/bin\ncommand = python -m virtualenv {target}\n"
+    )
+    assert (target / "bin" / "python").readlink() == Path(sys.executable)
+    assert [path.name for path in cache.path.iterdir()] == [key]
+
+
+def test_templates_are_keyed_by_options(tmp_path: Path) -> None:
+    executable = Path(sys.executable)
+    key = VenvTemplateCache.key(executable, {"no-pip": True}, "project-py3.12")
+
+    assert key == VenvTemplateCache.key(executable, {"no-pip": True}, "project-py3.12")
+    assert key != VenvTemplateCache.key(executable, {"no-pip": False}, "project-py3.12")
+    assert key != VenvTemplateCache.key(executable, {"no-pip": True}, "other-py3.12")
+
+
+def test_put_evicts_the_templates_of_changed_interpreters(tmp_path: Path) -> None:
+    import os
+
+    cache = VenvTemplateCache(tmp_path / "cache")
+    executable = tmp_path / "python"
+    executable.write_text("", encoding="utf-8")
+    other_executable = tmp_path / "other-python"
+    other_executable.write_text("", encoding="utf-8")
+
+    old_key = VenvTemplateCache.key(executable, {})
+    other_key = VenvTemplateCache.key(other_executable, {})
+    cache.put(old_key, executable, _create_venv)
+    cache.put(other_key, other_executable, _create_venv)
+
+    stat = executable.stat()
+    os.utime(executable, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    new_key = VenvTemplateCache.key(executable, {})
+    assert new_key != old_key
+
+    cache.put(new_key, executable, _create_venv)
+
+    assert sorted(path.name for path in cache.path.iterdir()) == sorted(
+        [new_key, other_key]
+    )
+
+    other_executable.unlink()
+    cache.put(new_key, executable, _create_venv)
+
+    assert [path.name for path in cache.path.iterdir()] == [new_key]
+
+
+def test_clear_removes_all_templates(tmp_path: Path) -> None:
+    cache = VenvTemplateCache(tmp_path / "cache")
+
+    assert cache.clear() == 0
+
+    executable = Path(sys.executable)
+    cache.put(VenvTemplateCache.key(executable, {}), executable, _create_venv)
+    cache.put(
+        VenvTemplateCache.key(executable, {"no-pip": True}), executable, _create_venv
+    )
+
+    assert cache.clear() == 2
+    assert list(cache.path.iterdir()) == []
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import shutil
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from poetry.core.constraints.version import Version
+from poetry.factory import Factory
+
+from poetry_plugin_bundle.utils.wheel_cache import WheelCache
+
+
+if TYPE_CHECKING:
+    from poetry.config.config import Config
+
+
+def _write_wheel(path: Path, name: str) -> Path:
+    path.mkdir(parents=True, exist_ok=True)
+    wheel = path / name
+    wheel.write_bytes(name.encode())
+
+    return wheel
+
+
+def test_key_changes_with_the_metadata_of_the_project(
+    tmp_path: Path, config: Config
+) -> None:
+    project = tmp_path / "project"
+    shutil.copytree(
+        Path(__file__).parent.parent / "fixtures" / "simple_project", project
+    )
+    poetry = Factory().create_poetry(project)
+    poetry.set_config(config)
+
+    key = WheelCache.key(poetry)
+    assert key is not None
+    assert WheelCache.key(poetry) == key
+
+    (project / "README.rst").write_text("Another readme\n", encoding="utf-8")
+    readme_key = WheelCache.key(Factory().create_poetry(project))
+    assert readme_key not in (None, key)
+
+    # The version may be computed by plugins, e.g. from tags
+    poetry = Factory().create_poetry(project)
+    poetry.package.version = Version.parse("1.2.4")
+    assert WheelCache.key(poetry) not in (None, key, readme_key)
+
+
+def test_put_keeps_the_latest_wheel_of_each_project(tmp_path: Path) -> None:
+    cache = WheelCache(tmp_path / "cache")
+
+    cache.put("old", _write_wheel(tmp_path / "old", "foo-1.0-py3-none-any.whl"))
+    cache.put("other", _write_wheel(tmp_path / "other", "bar-1.0-py3-none-any.whl"))
+    wheel = cache.put("new", _write_wheel(tmp_path / "new", "foo-1.1-py3-none-any.whl"))
+
+    assert cache.get("old") is None
+    assert cache.get("new") == wheel
+    assert wheel.read_bytes() == b"foo-1.1-py3-none-any.whl"
+    assert cache.get("other") is not None
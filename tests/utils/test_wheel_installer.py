@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import base64
+import csv
+import hashlib
+import os
+import sys
+import zipfile
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from poetry.installation.wheel_installer import WheelInstaller
+from poetry.utils.env import EnvManager
+from poetry.utils.env import VirtualEnv
+
+from poetry_plugin_bundle.utils.report import BundleReport
+from poetry_plugin_bundle.utils.wheel_installer import PARALLEL_FILES
+from poetry_plugin_bundle.utils.wheel_installer import BundleWheelInstaller
+
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from pytest_mock import MockerFixture
+
+
+def _build_wheel(
+    path: Path, files: Mapping[str, str], recorded: Mapping[str, str] | None = None
+) -> Path:
+    """
+    Build a wheel of the given files, whose RECORD lists the hashes of the
+    recorded content of some of them rather than of their actual content.
+    """
+    dist_info = "demo-1.0.dist-info"
+    files = {
+        **files,
+        f"{dist_info}/METADATA": "Metadata-Version: 2.1\nName: demo\nVersion: 1.0\n",
+        f"{dist_info}/WHEEL": (
+            "Wheel-Version: 1.0\nRoot-Is-Purelib: true\nTag: py3-none-any\n"
+        ),
+        f"{dist_info}/entry_points.txt": (
+            "[console_scripts]\ndemo = demo:main\n\n[gui_scripts]\ndemo-gui = demo:main\n"
+        ),
+    }
+
+    record = []
+    for name, content in {**files, **(recorded or {})}.items():
+        digest = hashlib.sha256(content.encode()).digest()
+        encoded = base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+        record.append(f"{name},sha256={encoded},{len(content.encode())}")
+    record.append(f"{dist_info}/RECORD,,")
+
+    wheel = path / "demo-1.0-py3-none-any.whl"
+    with zipfile.ZipFile(wheel, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in files.items():
+            info = zipfile.ZipInfo(name)
+            info.external_attr = (0o755 if "/scripts/" in name else 0o644) << 16
+            archive.writestr(info, content)
+        archive.writestr(f"{dist_info}/RECORD", "\n".join(record) + "\n")
+
+    return wheel
+
+
+def _installed_files(venv: VirtualEnv) -> dict[str, bytes]:
+    files = {}
+    for path in venv.path.rglob("*"):
+        if path.is_file() and "demo" in path.relative_to(venv.path).as_posix():
+            content = path.read_bytes().replace(str(venv.path).encode(), b"<venv>")
+            files[path.relative_to(venv.path).as_posix()] = content
+
+    return files
+
+
+@pytest.fixture
+def wheel(tmp_path: Path) -> Path:
+    return _build_wheel(
+        tmp_path,
+        {
+            "demo/__init__.py": "def main():\n    pass\n",
+            **{
+                f"demo/module_{i}.py": f"VALUE = {i}\n"
+                for i in range(PARALLEL_FILES + 1)
+            },
+            "demo-1.0.data/scripts/demo-script": "#!python\nprint('demo')\n",
+            "demo-1.0.data/data/share/demo/demo.txt": "demo\n",
+            "demo-1.0.data/headers/demo.h": "#define DEMO 1\n",
+        },
+    )
+
+
+def test_bundle_installer_installs_wheels_as_poetry_does(
+    tmp_path: Path, tmp_venv: VirtualEnv, wheel: Path
+) -> None:
+    EnvManager.build_venv(tmp_path / "poetry")
+    poetry_venv = VirtualEnv(tmp_path / "poetry")
+
+    BundleWheelInstaller(tmp_venv, BundleReport()).install(wheel)
+    WheelInstaller(poetry_venv).install(wheel)
+
+    installed = _installed_files(tmp_venv)
+    expected = _installed_files(poetry_venv)
+    assert installed.keys() == expected.keys()
+    for name, content in installed.items():
+        if not name.endswith("/RECORD"):
+            assert content == expected[name], name
+
+    # Hashes of the rewritten scripts depend on the path of the environment
+    record = next(name for name in installed if name.endswith("/RECORD"))
+    rows = list(csv.reader(installed[record].decode().splitlines()))
+    expected_rows = list(csv.reader(expected[record].decode().splitlines()))
+    assert [row[0] for row in rows] == [row[0] for row in expected_rows]
+
+    root = tmp_venv.path / Path(record).parent.parent
+    for name, hash, size in rows:
+        if not hash:
+            continue
+
+        content = (root / name).read_bytes()
+        digest = hashlib.sha256(content).digest()
+        encoded = base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+        assert (hash, size) == (f"sha256={encoded}", str(len(content))), name
+
+    for script in ("demo", "demo-gui", "demo-script"):
+        assert os.access(tmp_venv.path / "bin" / script, os.X_OK)
+
+
+def test_bundle_installer_replaces_hardlinked_files(
+    tmp_path: Path, tmp_venv: VirtualEnv, wheel: Path
+) -> None:
+    installer = BundleWheelInstaller(tmp_venv, BundleReport())
+    installer.install(wheel)
+
+    module = tmp_venv.purelib / "demo" / "module_1.py"
+    shared = tmp_path / "shared.py"
+    os.link(module, shared)
+    module.write_text("VALUE = 0\n", encoding="utf-8")
+
+    installer.install(wheel)
+
+    assert module.read_text(encoding="utf-8") == "VALUE = 1\n"
+    assert shared.read_text(encoding="utf-8") == "VALUE = 0\n"
+
+
+def test_bundle_installer_compiles_bytecode_if_enabled(
+    tmp_venv: VirtualEnv, wheel: Path
+) -> None:
+    installer = BundleWheelInstaller(tmp_venv, BundleReport())
+    installer.enable_bytecode_compilation()
+    installer.install(wheel)
+
+    pycache = tmp_venv.purelib / "demo" / "__pycache__"
+    assert (pycache / f"module_1.{sys.implementation.cache_tag}.pyc").exists()
+
+
+def test_bundle_installer_rejects_files_outside_of_the_environment(
+    tmp_path: Path, tmp_venv: VirtualEnv
+) -> None:
+    wheel = _build_wheel(tmp_path, {"../escaped.py": "VALUE = 1\n"})
+
+    with pytest.raises(ValueError, match="outside of the target directory"):
+        BundleWheelInstaller(tmp_venv, BundleReport()).install(wheel)
+
+    assert not tmp_venv.purelib.parent.joinpath("escaped.py").exists()
+
+
+def test_bundle_installer_lets_poetry_install_wheels_not_matching_their_record(
+    tmp_path: Path, tmp_venv: VirtualEnv, mocker: MockerFixture
+) -> None:
+    wheel = _build_wheel(
+        tmp_path,
+        {
+            "demo/__init__.py": "def main():\n    pass\n",
+            **{
+                f"demo/module_{i}.py": f"VALUE = {i}\n"
+                for i in range(PARALLEL_FILES + 1)
+            },
+        },
+        recorded={"demo/module_1.py": "VALUE = 0\n"},
+    )
+    install = mocker.spy(WheelInstaller, "install")
+
+    installer = BundleWheelInstaller(tmp_venv, BundleReport())
+    installer.install(wheel)
+
+    install.assert_called_once_with(installer, wheel)
+    assert installer.invalid_wheels == {
+        wheel: [f"In {wheel}, hash / size of demo/module_1.py didn't match RECORD"]
+    }
+
+    module = tmp_venv.purelib / "demo" / "module_1.py"
+    assert module.read_text(encoding="utf-8") == "VALUE = 1\n"
+    record = tmp_venv.purelib / "demo-1.0.dist-info" / "RECORD"
+    digest = hashlib.sha256(b"VALUE = 1\n").digest()
+    encoded = base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+    assert f"demo/module_1.py,sha256={encoded},10" in record.read_text(encoding="utf-8")
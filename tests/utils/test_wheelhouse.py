@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import sys
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cleo.io.buffered_io import BufferedIO
+from poetry.factory import Factory
+
+from poetry_plugin_bundle.bundlers.venv_bundler import VenvBundler
+from poetry_plugin_bundle.utils.env import InterpreterEnv
+from poetry_plugin_bundle.utils.locker import BundleLocker
+from poetry_plugin_bundle.utils.wheelhouse import PARTIAL_SUFFIX
+from poetry_plugin_bundle.utils.wheelhouse import Wheelhouse
+from poetry_plugin_bundle.utils.wheelhouse import download_wheelhouse
+from tests.benchmarks.index import IndexServer
+from tests.benchmarks.index import build_index
+from tests.benchmarks.index import write_project
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from poetry.config.config import Config
+    from poetry.poetry import Poetry
+
+    from tests.benchmarks.index import SyntheticPackage
+
+
+@pytest.fixture
+def index(
+    tmp_path: Path,
+) -> Iterator[tuple[IndexServer, dict[str, list[SyntheticPackage]]]]:
+    packages = build_index(tmp_path / "index", 2)
+    server = IndexServer(tmp_path / "index")
+    server.start()
+
+    yield server, packages
+
+    server.stop()
+
+
+def create_poetry(
+    path: Path,
+    config: Config,
+    server: IndexServer,
+    packages: dict[str, list[SyntheticPackage]],
+) -> Poetry:
+    write_project(path, server.url, packages)
+    poetry = Factory().create_poetry(path)
+    poetry.set_config(config)
+
+    return poetry
+
+
+def download(poetry: Poetry, path: Path) -> Wheelhouse:
+    wheelhouse = Wheelhouse(path)
+    download_wheelhouse(
+        poetry,
+        InterpreterEnv(Path(sys.executable)),
+        BundleLocker.from_poetry(poetry),
+        wheelhouse,
+    )
+
+    return wheelhouse
+
+
+def test_bundle_offline_from_downloaded_wheelhouse(
+    tmp_path: Path,
+    config: Config,
+    index: tuple[IndexServer, dict[str, list[SyntheticPackage]]],
+) -> None:
+    server, packages = index
+    poetry = create_poetry(tmp_path / "project", config, server, packages)
+
+    wheelhouse = download(poetry, tmp_path / "wheelhouse")
+
+    wheels = {versions[0].wheel.name for versions in packages.values()}
+    assert {path.name for path in wheelhouse.path.iterdir()} == wheels
+    assert wheelhouse.stats.archives == 2
+    assert wheelhouse.stats.downloaded == 2
+
+    # Archives already in the wheelhouse are not downloaded again
+    assert download(poetry, tmp_path / "wheelhouse").stats.present == 2
+
+    # Nothing can be downloaded once the index is gone
+    server.stop()
+
+    path = tmp_path / "venv"
+    bundler = VenvBundler().set_path(path).set_find_links(wheelhouse.path, True)
+    assert bundler.bundle(poetry, BufferedIO())
+
+    site_packages = next(path.glob("lib/python*/site-packages"))
+    for name in packages:
+        assert (site_packages / name.replace("-", "_") / "__init__.py").exists()
+
+    # Archives missing from the wheelhouse fail offline bundles
+    empty = tmp_path / "empty"
+    empty.mkdir()
+    bundler = (
+        VenvBundler().set_path(tmp_path / "other").set_find_links(empty, offline=True)
+    )
+    assert not bundler.bundle(poetry, BufferedIO())
+
+
+def test_download_wheelhouse_resumes_partial_downloads(
+    tmp_path: Path,
+    config: Config,
+    index: tuple[IndexServer, dict[str, list[SyntheticPackage]]],
+) -> None:
+    server, packages = index
+    poetry = create_poetry(tmp_path / "project", config, server, packages)
+    wheel = packages["bench-0000"][0].wheel
+    content = wheel.read_bytes()
+
+    path = tmp_path / "wheelhouse"
+    path.mkdir()
+    path.joinpath(wheel.name + PARTIAL_SUFFIX).write_bytes(content[:1000])
+
+    wheelhouse = download(poetry, path)
+
+    other = packages["bench-0001"][0].wheel
+    assert wheelhouse.stats.size == len(content) - 1000 + other.stat().st_size
+    assert path.joinpath(wheel.name).read_bytes() == content
+    assert not path.joinpath(wheel.name + PARTIAL_SUFFIX).exists()
+
+
+def test_download_wheelhouse_rejects_archives_not_matching_the_lock_file(
+    tmp_path: Path,
+    config: Config,
+    index: tuple[IndexServer, dict[str, list[SyntheticPackage]]],
+) -> None:
+    server, packages = index
+    poetry = create_poetry(tmp_path / "project", config, server, packages)
+    wheel = packages["bench-0000"][0].wheel
+
+    path = tmp_path / "wheelhouse"
+    path.mkdir()
+    path.joinpath(wheel.name + PARTIAL_SUFFIX).write_bytes(b"corrupted")
+
+    with pytest.raises(RuntimeError, match="Hash for bench-0000"):
+        download(poetry, path)
+
+    assert not path.joinpath(wheel.name).exists()
+    assert not path.joinpath(wheel.name + PARTIAL_SUFFIX).exists()